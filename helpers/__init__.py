@@ -2,5 +2,8 @@ from .logger import TestLogger
 from .screenshot import ScreenshotHelper
 from .page_load import PageLoadHelper
 from .reports import ReportsHelper
+from .tracing import TraceBuffer
+from .browser_events import BrowserEventCollector
+from .error_sentinel import ErrorSentinel
 
-__all__ = ['TestLogger', 'ScreenshotHelper', 'PageLoadHelper', 'ReportsHelper'] 
\ No newline at end of file
+__all__ = ['TestLogger', 'ScreenshotHelper', 'PageLoadHelper', 'ReportsHelper', 'TraceBuffer', 'BrowserEventCollector', 'ErrorSentinel']
\ No newline at end of file
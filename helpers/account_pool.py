@@ -0,0 +1,172 @@
+import os
+import sqlite3
+import time
+
+class AccountPoolExhaustedError(Exception):
+    """Raised when no account of a role becomes free within the wait timeout"""
+
+class AccountPool:
+    """Exclusive test-account leasing shared by all workers on a host.
+
+    Leases live in a SQLite table with an expiry time, so a worker that
+    crashes without releasing its accounts only blocks them until the lease
+    expires. Logins per account are spaced at least ``min_login_interval``
+    seconds apart across all workers to stay under the application's login
+    rate limits.
+    """
+
+    def __init__(self, db_path: str, lease_seconds: float = 900, min_login_interval: float = 2.0,
+                 wait_timeout: float = 300, poll_interval: float = 0.5):
+        """Initialize the AccountPool.
+
+        Args:
+            db_path (str): Path of the SQLite lease database
+            lease_seconds (float): Default lifetime of a lease
+            min_login_interval (float): Minimum seconds between two logins of the same account
+            wait_timeout (float): Seconds to wait for a free account
+            poll_interval (float): Seconds between attempts while every account is leased
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.min_login_interval = min_login_interval
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._setup_database()
+
+    def _connect(self):
+        """Open a connection with explicit transaction control."""
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def _setup_database(self):
+        """Create the database file and tables if they do not exist"""
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        connection = self._connect()
+        try:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS account_leases (
+                    role TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    holder TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (role, email)
+                )
+            """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS account_logins (
+                    email TEXT PRIMARY KEY,
+                    next_login_at REAL NOT NULL
+                )
+            """)
+        finally:
+            connection.close()
+
+    def _try_lease(self, role: str, accounts: list, holder: str, lease_seconds: float):
+        """Lease the first free account in one write transaction.
+
+        Returns:
+            Credentials: Leased account, or None if every account is leased
+        """
+        now = time.time()
+        connection = self._connect()
+        try:
+            # IMMEDIATE takes the write lock up front, so two workers cannot pick the same account
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM account_leases WHERE expires_at < ?", (now,))
+            leased = {row[0] for row in connection.execute(
+                "SELECT email FROM account_leases WHERE role = ?", (role,)
+            )}
+            for account in accounts:
+                if account.email not in leased:
+                    connection.execute(
+                        "INSERT INTO account_leases (role, email, holder, expires_at) VALUES (?, ?, ?, ?)",
+                        (role, account.email, holder, now + lease_seconds)
+                    )
+                    connection.execute("COMMIT")
+                    return account
+            connection.execute("COMMIT")
+            return None
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def lease(self, role: str, accounts: list, holder: str, lease_seconds: float = None):
+        """Lease an account of a role exclusively, waiting for one to become free.
+
+        Args:
+            role (str): Role name
+            accounts (list): Candidate Credentials of the role
+            holder (str): Identifier of the leasing worker
+            lease_seconds (float, optional): Lease lifetime (default: the pool's)
+
+        Returns:
+            Credentials: Leased account
+
+        Raises:
+            AccountPoolExhaustedError: If no account became free within the wait timeout
+        """
+        deadline = time.perf_counter() + self.wait_timeout
+        while True:
+            account = self._try_lease(role, accounts, holder, lease_seconds or self.lease_seconds)
+            if account:
+                return account
+            if time.perf_counter() > deadline:
+                raise AccountPoolExhaustedError(
+                    f"All {len(accounts)} {role} account(s) stayed leased for {self.wait_timeout:.0f}s - "
+                    f"add accounts or run fewer workers"
+                )
+            time.sleep(self.poll_interval)
+
+    def release(self, role: str, email: str, holder: str):
+        """Release a lease held by a worker.
+
+        Args:
+            role (str): Role name
+            email (str): Leased account
+            holder (str): Identifier of the leasing worker
+        """
+        connection = self._connect()
+        try:
+            connection.execute(
+                "DELETE FROM account_leases WHERE role = ? AND email = ? AND holder = ?",
+                (role, email, holder)
+            )
+        finally:
+            connection.close()
+
+    def throttle_login(self, email: str) -> float:
+        """Wait until the account may log in again and reserve the next login slot.
+
+        Args:
+            email (str): Account about to log in
+
+        Returns:
+            float: Seconds waited
+        """
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT next_login_at FROM account_logins WHERE email = ?", (email,)
+            ).fetchone()
+            now = time.time()
+            login_at = max(now, row[0] if row else now)
+            connection.execute(
+                "INSERT OR REPLACE INTO account_logins (email, next_login_at) VALUES (?, ?)",
+                (email, login_at + self.min_login_interval)
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+        wait = login_at - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
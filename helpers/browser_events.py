@@ -0,0 +1,128 @@
+from playwright.sync_api import BrowserContext
+from collections import deque
+from datetime import datetime
+import json
+import os
+import re
+import time
+
+class BrowserEventCollector:
+    """Helper class for bounded capture of browser console and network events.
+
+    Listeners are attached to every page of the context as soon as the page
+    is created, so messages logged during the first navigation are kept.
+    Each page has its own ring buffer of the most recent events; nothing is
+    written unless the test fails or asks for a dump.
+    """
+
+    def __init__(self, context: BrowserContext, test_name: str, max_events: int = 500,
+                 min_status: int = 400, reports_dir: str = "reports/browser_events"):
+        """Initialize the BrowserEventCollector.
+
+        Args:
+            context (BrowserContext): Playwright browser context to listen on
+            test_name (str): Name of the test for file naming
+            max_events (int): Number of most recent events kept per page
+            min_status (int): Lowest HTTP status recorded for responses
+            reports_dir (str): Directory for JSONL dumps
+        """
+        self.context = context
+        self.test_name = self._sanitize_filename(test_name)
+        self.max_events = max(1, max_events)
+        self.min_status = min_status
+        self.reports_dir = reports_dir
+        self.buffers = {}
+        self._page_count = 0
+        self.context.on("page", self._attach)
+        for page in self.context.pages:
+            self._attach(page)
+
+    def _sanitize_filename(self, filename: str) -> str:
+        """Sanitize filename to be safe for all operating systems.
+
+        Args:
+            filename (str): Original filename
+
+        Returns:
+            str: Sanitized filename
+        """
+        # Remove invalid characters
+        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        # Remove square brackets and their contents
+        filename = re.sub(r'\[.*?\]', '', filename)
+        # Replace multiple underscores with a single one
+        filename = re.sub(r'_+', '_', filename)
+        # Remove leading/trailing underscores
+        filename = filename.strip('_')
+        return filename
+
+    def _attach(self, page):
+        """Attach the listeners to a new page."""
+        index = self._page_count
+        self._page_count += 1
+        buffer = deque(maxlen=self.max_events)
+        self.buffers[index] = buffer
+
+        def add(kind: str, **fields):
+            buffer.append({"time": time.time(), "page": index, "kind": kind, **fields})
+
+        def on_response(response):
+            if response.status >= self.min_status:
+                add("response", level="error" if response.status >= 500 else "warning",
+                    method=response.request.method, url=response.url, status=response.status)
+
+        page.on("console", lambda message: add(
+            "console", level=message.type, text=message.text, location=message.location.get("url")
+        ))
+        page.on("pageerror", lambda error: add("pageerror", level="error", text=str(error)))
+        page.on("requestfailed", lambda request: add(
+            "requestfailed", level="error", method=request.method, url=request.url, text=request.failure
+        ))
+        page.on("response", on_response)
+
+    def events(self, kind: str = None, level: str = None) -> list:
+        """Get the buffered events of all pages in time order.
+
+        Args:
+            kind (str, optional): Only events of this kind (console, pageerror, requestfailed, response)
+            level (str, optional): Only events of this level (e.g. "error")
+
+        Returns:
+            list: Event dictionaries
+        """
+        events = [event for buffer in self.buffers.values() for event in buffer]
+        return sorted(
+            (event for event in events
+             if (kind is None or event["kind"] == kind) and (level is None or event.get("level") == level)),
+            key=lambda event: event["time"]
+        )
+
+    def errors(self) -> list:
+        """Get error-level events: console errors, page errors, failed requests and 5xx responses."""
+        return self.events(level="error")
+
+    def dump(self, suffix: str = "") -> str:
+        """Write the buffered events as compact JSONL.
+
+        Args:
+            suffix (str): Extra text for the file name (e.g. "failure")
+
+        Returns:
+            str: Path of the written file
+        """
+        if not os.path.exists(self.reports_dir):
+            os.makedirs(self.reports_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = f"{self.test_name}_{suffix}_{timestamp}" if suffix else f"{self.test_name}_{timestamp}"
+        path = os.path.join(self.reports_dir, f"{name}.jsonl")
+        with open(path, "w") as events_file:
+            for event in self.events():
+                events_file.write(json.dumps(event, separators=(",", ":")) + "\n")
+        return path
+
+    def close(self):
+        """Stop listening for new pages."""
+        try:
+            self.context.remove_listener("page", self._attach)
+        except Exception:
+            pass
@@ -0,0 +1,205 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+class BrowserServerPool:
+    """Pool of shared browser server processes for xdist workers.
+
+    Runs in the xdist controller. Each server is a ``playwright launch-server``
+    process (the CLI form of ``browser_type.launch_server()``) serving a fixed
+    number of workers, started on demand as workers come up. The current
+    websocket endpoint of every server is kept in a small file so workers
+    reconnect to the right place after the health monitor restarted a
+    crashed server.
+    """
+
+    def __init__(self, state_dir: str, browser_name: str = "chromium", workers_per_server: int = 4,
+                 launch_options: dict = None, start_timeout: float = 30, health_interval: float = 5):
+        """Initialize the BrowserServerPool.
+
+        Args:
+            state_dir (str): Directory for endpoint files, server configs and logs
+            browser_name (str): Browser engine of the servers
+            workers_per_server (int): Number of workers sharing one browser process
+            launch_options (dict, optional): Launch options (headless, channel, args, ...)
+            start_timeout (float): Seconds to wait for a server to accept connections
+            health_interval (float): Seconds between health checks
+        """
+        self.state_dir = state_dir
+        self.browser_name = browser_name
+        self.workers_per_server = max(workers_per_server, 1)
+        self.launch_options = launch_options or {}
+        self.start_timeout = start_timeout
+        self.health_interval = health_interval
+        self.servers = {}
+        self.restarts = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._monitor = None
+        if not os.path.exists(self.state_dir):
+            os.makedirs(self.state_dir, exist_ok=True)
+
+    @staticmethod
+    def _free_port() -> int:
+        """Get a free local TCP port."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    @staticmethod
+    def _is_listening(port: int) -> bool:
+        """Check whether a local port accepts connections."""
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def endpoint_file(self, index: int) -> str:
+        """Get the endpoint file of a server."""
+        return os.path.join(self.state_dir, f"server-{index}.json")
+
+    def endpoint_file_for(self, worker_index: int) -> str:
+        """Get the endpoint file of the server assigned to a worker, starting the server if needed.
+
+        Args:
+            worker_index (int): xdist worker number (0 for gw0)
+
+        Returns:
+            str: Path of the endpoint file
+        """
+        index = worker_index // self.workers_per_server
+        with self._lock:
+            if index not in self.servers:
+                self._start(index)
+        return self.endpoint_file(index)
+
+    def _start(self, index: int):
+        """Start (or restart) one browser server and publish its endpoint."""
+        port = self._free_port()
+        ws_path = f"/{uuid.uuid4().hex}"
+        config_path = os.path.join(self.state_dir, f"server-{index}-config.json")
+        with open(config_path, "w") as config_file:
+            json.dump({**self.launch_options, "port": port, "wsPath": ws_path}, config_file)
+
+        log = open(os.path.join(self.state_dir, f"server-{index}.log"), "ab")
+        process = subprocess.Popen(
+            [sys.executable, "-m", "playwright", "launch-server",
+             "--browser", self.browser_name, "--config", config_path],
+            stdout=log, stderr=subprocess.STDOUT
+        )
+        log.close()
+
+        deadline = time.perf_counter() + self.start_timeout
+        while not self._is_listening(port):
+            if process.poll() is not None or time.perf_counter() > deadline:
+                process.kill()
+                raise RuntimeError(
+                    f"Browser server {index} did not start (see {os.path.join(self.state_dir, f'server-{index}.log')})"
+                )
+            time.sleep(0.1)
+
+        self.servers[index] = {"process": process, "port": port}
+        # Write then rename so workers never read a partial file
+        temp_path = f"{self.endpoint_file(index)}.tmp"
+        with open(temp_path, "w") as endpoint_file:
+            json.dump({"ws_endpoint": f"ws://127.0.0.1:{port}{ws_path}", "started_at": time.time()}, endpoint_file)
+        os.replace(temp_path, self.endpoint_file(index))
+
+    def check_health(self):
+        """Restart servers whose process exited or stopped accepting connections.
+
+        Returns:
+            list: Indexes of the restarted servers
+        """
+        restarted = []
+        with self._lock:
+            for index, server in list(self.servers.items()):
+                if server["process"].poll() is None and self._is_listening(server["port"]):
+                    continue
+                server["process"].kill()
+                try:
+                    self._start(index)
+                    self.restarts += 1
+                    restarted.append(index)
+                except RuntimeError as e:
+                    print(f"⚠️  {e}")
+        return restarted
+
+    def start_monitor(self):
+        """Run health checks in a background thread."""
+        def monitor():
+            while not self._stop_event.wait(self.health_interval):
+                self.check_health()
+
+        self._monitor = threading.Thread(target=monitor, name="browser-server-monitor", daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        """Stop the health monitor and every server."""
+        self._stop_event.set()
+        if self._monitor:
+            self._monitor.join(timeout=self.health_interval + 1)
+        with self._lock:
+            for server in self.servers.values():
+                server["process"].terminate()
+            for server in self.servers.values():
+                try:
+                    server["process"].wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    server["process"].kill()
+            self.servers.clear()
+
+class SharedBrowserClient:
+    """Worker side connection to a shared browser server.
+
+    Reconnects (re-reading the endpoint file) whenever the connection was
+    lost, e.g. after the controller restarted a crashed server.
+    """
+
+    def __init__(self, browser_type, endpoint_file: str, connect_timeout: float = 30, slow_mo: float = None):
+        """Initialize the SharedBrowserClient.
+
+        Args:
+            browser_type: Playwright BrowserType matching the servers
+            endpoint_file (str): Endpoint file of the assigned server
+            connect_timeout (float): Seconds to keep retrying a connection
+            slow_mo (float, optional): Slow down Playwright operations (milliseconds)
+        """
+        self.browser_type = browser_type
+        self.endpoint_file = endpoint_file
+        self.connect_timeout = connect_timeout
+        self.slow_mo = slow_mo
+        self.browser = None
+
+    def get(self):
+        """Get a connected browser, reconnecting if needed.
+
+        Returns:
+            Browser: Browser connected to the shared server
+        """
+        if self.browser and self.browser.is_connected():
+            return self.browser
+
+        deadline = time.perf_counter() + self.connect_timeout
+        while True:
+            try:
+                with open(self.endpoint_file) as endpoint_file:
+                    ws_endpoint = json.load(endpoint_file)["ws_endpoint"]
+                self.browser = self.browser_type.connect(ws_endpoint, slow_mo=self.slow_mo)
+                return self.browser
+            except Exception as e:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(f"Could not connect to shared browser server: {e}") from e
+                time.sleep(0.5)
+
+    def close(self):
+        """Disconnect from the server (the server keeps running)."""
+        if self.browser and self.browser.is_connected():
+            self.browser.close()
+        self.browser = None
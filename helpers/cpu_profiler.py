@@ -0,0 +1,177 @@
+import functools
+import importlib
+import json
+import os
+import re
+import weakref
+from .timeouts import TimeoutService
+
+class CpuProfiler:
+    """Browser-side CPU profiling of page object actions over CDP (Chromium only).
+
+    Wraps page object methods at class level so every call runs inside a CDP
+    ``Profiler`` session. Each profile is saved as a ``.cpuprofile`` file
+    (loadable in Chrome DevTools) named after the route and action, and
+    reduced to the functions with the most self time.
+    """
+
+    # Page object class path mapped to the methods profiled
+    TARGETS = {
+        "pom.landlord_page.LandlordPage": (
+            "navigate_to_page", "click_property_tab", "click_tenant_tab", "search_tenants"
+        ),
+        "pom.tenant_page.TenantPage": ("navigate_to_page", "click_tenant_tab", "search_tenants")
+    }
+
+    def __init__(self, reports_dir: str = "reports/cpu_profiles", top_n: int = 10, sampling_interval_us: int = 100):
+        """Initialize the CpuProfiler.
+
+        Args:
+            reports_dir (str): Directory for .cpuprofile files
+            top_n (int): Number of hot functions kept per profile
+            sampling_interval_us (int): Sampling interval in microseconds
+        """
+        self.reports_dir = reports_dir
+        self.top_n = top_n
+        self.sampling_interval_us = sampling_interval_us
+        self.results = []
+        self._sessions = weakref.WeakKeyDictionary()
+        self._originals = []
+        self._counter = 0
+        if not os.path.exists(self.reports_dir):
+            os.makedirs(self.reports_dir, exist_ok=True)
+
+    def install(self):
+        """Wrap the target page object methods."""
+        for class_path, methods in self.TARGETS.items():
+            module_name, class_name = class_path.rsplit(".", 1)
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            for method_name in methods:
+                original = page_class.__dict__.get(method_name)
+                if original is None or getattr(original, "__llhub_profiled__", False):
+                    continue
+                setattr(page_class, method_name, self._wrap(original, method_name))
+                self._originals.append((page_class, method_name, original))
+
+    def uninstall(self):
+        """Restore the original page object methods."""
+        for page_class, method_name, original in reversed(self._originals):
+            setattr(page_class, method_name, original)
+        self._originals = []
+
+    def _label(self, page, method_name: str, args: tuple) -> str:
+        """Name a profile after its route and action."""
+        if method_name == "navigate_to_page" and args:
+            return f"{TimeoutService.route_of(args[0])} navigate"
+        route = TimeoutService.route_of(page.url)
+        if method_name.endswith("_tab") and args:
+            return f"{route} tab:{args[0]}"
+        return f"{route} {method_name.replace('_tenants', '')}"
+
+    def _session(self, page):
+        """Get (or open) the page's CDP session with the profiler enabled."""
+        session = self._sessions.get(page)
+        if session is None:
+            session = page.context.new_cdp_session(page)
+            session.send("Profiler.enable")
+            session.send("Profiler.setSamplingInterval", {"interval": self.sampling_interval_us})
+            self._sessions[page] = session
+        return session
+
+    def _wrap(self, method, method_name: str):
+        """Run a page object method inside a CPU profile."""
+        profiler = self
+
+        @functools.wraps(method)
+        def wrapper(page_object, *args, **kwargs):
+            try:
+                session = profiler._session(page_object.page)
+                session.send("Profiler.start")
+            except Exception:
+                # Not Chromium, or the page is gone: run unprofiled
+                return method(page_object, *args, **kwargs)
+            try:
+                return method(page_object, *args, **kwargs)
+            finally:
+                try:
+                    profile = session.send("Profiler.stop")["profile"]
+                    profiler._record(profiler._label(page_object.page, method_name, args), profile)
+                except Exception:
+                    pass
+
+        wrapper.__llhub_profiled__ = True
+        return wrapper
+
+    def _record(self, label: str, profile: dict):
+        """Save a profile and keep its hot-function summary."""
+        self._counter += 1
+        safe_label = re.sub(r"[^\w.:-]+", "_", label).strip("_")
+        path = os.path.join(self.reports_dir, f"{os.getpid()}_{self._counter:04d}_{safe_label}.cpuprofile")
+        with open(path, "w") as profile_file:
+            json.dump(profile, profile_file)
+        self.results.append({"label": label, "path": path, "top": self.self_times(profile)[:self.top_n]})
+
+    @staticmethod
+    def self_times(profile: dict) -> list:
+        """Compute self time per function from a CDP profile.
+
+        Args:
+            profile (dict): ``Profiler.stop`` result profile
+
+        Returns:
+            list: Dictionaries with function, url, line and self_ms, slowest first
+        """
+        nodes = {node["id"]: node for node in profile.get("nodes", [])}
+        node_time = {}
+        # timeDeltas[i] is the time since the previous sample, so it belongs to sample i
+        for node_id, delta in zip(profile.get("samples", []), profile.get("timeDeltas", [])):
+            node_time[node_id] = node_time.get(node_id, 0) + delta
+
+        functions = {}
+        for node_id, micros in node_time.items():
+            frame = nodes[node_id]["callFrame"]
+            name = frame.get("functionName") or "(anonymous)"
+            if name in ("(idle)", "(root)"):
+                continue
+            if name in ("(program)", "(garbage collector)"):
+                key = (name, "", 0)
+            else:
+                key = (name, frame.get("url", ""), frame.get("lineNumber", 0) + 1)
+            functions[key] = functions.get(key, 0) + micros
+
+        return sorted(
+            ({"function": name, "url": url, "line": line, "self_ms": micros / 1000}
+             for (name, url, line), micros in functions.items()),
+            key=lambda entry: entry["self_ms"],
+            reverse=True
+        )
+
+    def take_results(self) -> list:
+        """Get and clear the profiles recorded since the last call."""
+        results, self.results = self.results, []
+        return results
+
+    @staticmethod
+    def merge(results: list, top_n: int = 10) -> dict:
+        """Merge profile summaries by label.
+
+        Args:
+            results (list): Profile summaries (``label``, ``top``)
+            top_n (int): Number of functions kept per label
+
+        Returns:
+            dict: Label mapped to its hottest functions across all profiles
+        """
+        merged = {}
+        for result in results:
+            functions = merged.setdefault(result["label"], {})
+            for entry in result["top"]:
+                key = (entry["function"], entry["url"], entry["line"])
+                functions[key] = functions.get(key, 0) + entry["self_ms"]
+        return {
+            label: [
+                {"function": name, "url": url, "line": line, "self_ms": self_ms}
+                for (name, url, line), self_ms in sorted(functions.items(), key=lambda item: item[1], reverse=True)[:top_n]
+            ]
+            for label, functions in merged.items()
+        }
@@ -0,0 +1,230 @@
+import asyncio
+import threading
+from playwright.async_api import async_playwright
+
+class DataSeedingError(Exception):
+    """Raised when the API rejects a seeding or cleanup request"""
+
+class DataSeeder:
+    """API-level test data seeding over Playwright's APIRequestContext.
+
+    Creates properties and tenants directly through the application's API,
+    authenticated with the storage state of a logged-in browser context, and
+    deletes everything it created at the end of the session. The collection
+    route of each kind comes from the settings (``PROPERTY_API_PATH`` and
+    ``TENANT_API_PATH``); records are deleted at ``<route>/<id>``.
+
+    The records of one kind are created together: their requests are sent
+    concurrently, at most ``batch_size`` at a time, over one request context
+    kept for the whole session so they share its pooled keep-alive
+    connections. Deletes are batched the same way, one kind after the other
+    with dependents first. The requests run on Playwright's async API in a
+    background thread, next to the tests' sync API. Names carry a per-run,
+    per-worker prefix, so parallel workers never see each other's data. The
+    routes are checked before anything is created, so routes the backend
+    does not serve fail the seeding with a clear message instead of
+    creating half a data set.
+    """
+
+    # Dependents are created after and deleted before the records they reference
+    CREATE_ORDER = ("property", "tenant")
+    DELETE_ORDER = ("tenant", "property")
+
+    def __init__(self, base_url: str, api_paths: dict, storage_state: dict = None, prefix: str = "llhub",
+                 extra_http_headers: dict = None, timeout: float = 10000, batch_size: int = 10):
+        """Initialize the DataSeeder.
+
+        Args:
+            base_url (str): Base URL of the application
+            api_paths (dict): Record kind mapped to its collection route (``Settings.api_paths``)
+            storage_state (dict, optional): Storage state of a logged-in context
+            prefix (str): Prefix of every created record's name
+            extra_http_headers (dict, optional): Headers sent with every request (e.g. an API token)
+            timeout (float): Request timeout in milliseconds
+            batch_size (int): Most requests in flight at once
+        """
+        self.api_paths = api_paths
+        self.prefix = prefix
+        self.batch_size = max(1, batch_size)
+        self.created = {kind: [] for kind in self.CREATE_ORDER}
+        self._counter = 0
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="data-seeder", daemon=True)
+        self._thread.start()
+        self._playwright = self._run(async_playwright().start())
+        self.request = self._run(self._playwright.request.new_context(
+            base_url=base_url,
+            storage_state=storage_state,
+            extra_http_headers=extra_http_headers,
+            ignore_https_errors=True,
+            timeout=timeout
+        ))
+
+    def _run(self, coroutine):
+        """Run a coroutine on the seeder's event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _together(self, coroutines: list) -> list:
+        """Run coroutines concurrently, at most ``batch_size`` at a time, keeping their order."""
+        async def gather():
+            limit = asyncio.Semaphore(self.batch_size)
+
+            async def limited(coroutine):
+                async with limit:
+                    return await coroutine
+
+            return await asyncio.gather(*(limited(coroutine) for coroutine in coroutines), return_exceptions=True)
+
+        return self._run(gather())
+
+    def _path(self, kind: str) -> str:
+        """Get the collection route of a kind."""
+        path = self.api_paths.get(kind)
+        if not path:
+            raise DataSeedingError(f"No API route for {kind} records - set {kind.upper()}_API_PATH in .env")
+        return path
+
+    def _name(self, kind: str) -> str:
+        """Build a unique, prefixed record name."""
+        self._counter += 1
+        return f"{self.prefix}-{kind}-{self._counter}"
+
+    async def _create(self, kind: str, payload: dict) -> dict:
+        """Send one create request and merge the API's answer into the payload."""
+        response = await self.request.post(self._path(kind), data=payload)
+        if not response.ok:
+            raise DataSeedingError(
+                f"Creating {kind} failed: {response.status} {response.status_text} ({response.url})"
+            )
+        try:
+            record = await response.json()
+        except Exception:
+            record = {}
+        return {**payload, **record} if isinstance(record, dict) else payload
+
+    def create(self, kind: str, **fields) -> dict:
+        """Create one record.
+
+        Args:
+            kind (str): Record kind ("property" or "tenant")
+            **fields: Record fields (a prefixed name is added unless given)
+
+        Returns:
+            dict: Created record as returned by the API
+
+        Raises:
+            DataSeedingError: If the API does not accept the record
+        """
+        return self.create_many(kind, 1, **fields)[0]
+
+    def create_many(self, kind: str, count: int, **fields) -> list:
+        """Create several records of one kind with concurrent requests.
+
+        Args:
+            kind (str): Record kind
+            count (int): Number of records
+            **fields: Fields shared by every record
+
+        Returns:
+            list: Created records
+
+        Raises:
+            DataSeedingError: If the API does not accept a record (the accepted ones are still cleaned up)
+        """
+        self._path(kind)
+        payloads = [{"name": self._name(kind), **fields} for _ in range(count)]
+        results = self._together([self._create(kind, payload) for payload in payloads])
+        records = [result for result in results if not isinstance(result, BaseException)]
+        self.created[kind].extend(records)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0] if isinstance(errors[0], DataSeedingError) else DataSeedingError(
+                f"Creating {kind} failed: {errors[0]}"
+            )
+        return records
+
+    def check_endpoints(self):
+        """Check that the backend serves every collection route as a JSON API.
+
+        Single-page apps answer unknown paths with their HTML shell, so a
+        successful status alone does not prove the route exists.
+
+        Raises:
+            DataSeedingError: If a route is not configured, is missing, rejects the session or does not
+                answer with JSON
+        """
+        paths = [self._path(kind) for kind in self.CREATE_ORDER]
+        responses = self._together([self.request.get(path) for path in paths])
+        for kind, response in zip(self.CREATE_ORDER, responses):
+            if isinstance(response, BaseException):
+                raise DataSeedingError(f"{kind} endpoint {self.api_paths[kind]} is not reachable: {response}")
+            content_type = response.headers.get("content-type", "")
+            if not response.ok or "json" not in content_type:
+                raise DataSeedingError(
+                    f"{kind} endpoint {response.url} answered {response.status} "
+                    f"({content_type or 'no content type'}) - check {kind.upper()}_API_PATH against the backend"
+                )
+
+    def seed(self, properties: int = 2, tenants: int = 2) -> dict:
+        """Create the standard data set: properties, then tenants attached to the first property.
+
+        Args:
+            properties (int): Number of properties
+            tenants (int): Number of tenants
+
+        Returns:
+            dict: Created records by kind
+
+        Raises:
+            DataSeedingError: If a route is not configured or served, or a record is rejected
+        """
+        self.check_endpoints()
+        created_properties = self.create_many("property", properties)
+        tenant_fields = {}
+        if created_properties and self._record_id(created_properties[0]) is not None:
+            tenant_fields["propertyId"] = self._record_id(created_properties[0])
+        created_tenants = self.create_many("tenant", tenants, **tenant_fields)
+        return {"properties": created_properties, "tenants": created_tenants}
+
+    @staticmethod
+    def _record_id(record: dict):
+        """Get the id of a record returned by the API."""
+        return record.get("id", record.get("_id"))
+
+    async def _delete(self, kind: str, record_id):
+        """Send one delete request; returns a failure message or None."""
+        response = await self.request.delete(f"{self._path(kind)}/{record_id}")
+        if not response.ok and response.status != 404:
+            return f"Deleting {kind} {record_id} failed: {response.status}"
+        return None
+
+    def cleanup(self):
+        """Delete every created record, dependents first, then close the request context.
+
+        Returns:
+            list: Messages of deletions that failed
+        """
+        failures = []
+        try:
+            for kind in self.DELETE_ORDER:
+                records = self.created[kind]
+                self.created[kind] = []
+                ids = []
+                for record in records:
+                    record_id = self._record_id(record)
+                    if record_id is None:
+                        failures.append(f"{kind} '{record.get('name')}' has no id to delete")
+                    else:
+                        ids.append(record_id)
+                results = self._together([self._delete(kind, record_id) for record_id in ids])
+                failures.extend(
+                    f"Deleting {kind} {record_id} failed: {result}" if isinstance(result, BaseException) else result
+                    for record_id, result in zip(ids, results) if result
+                )
+        finally:
+            self._run(self.request.dispose())
+            self._run(self._playwright.stop())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        return failures
@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+
+@dataclass(frozen=True)
+class EmulationProfile:
+    """Named network and CPU throttling profile"""
+    name: str
+    # Network conditions; None leaves the network unthrottled
+    latency_ms: float = None
+    download_kbps: float = None
+    upload_kbps: float = None
+    # CPU slowdown factor (1 = no throttling)
+    cpu_rate: float = 1
+    # Wait action (as recorded by the TimeoutService) mapped to its budget in milliseconds
+    budgets: dict = field(default_factory=dict)
+
+    @property
+    def throttles_network(self) -> bool:
+        """Whether the profile changes network conditions."""
+        return self.latency_ms is not None
+
+    def budget(self, action: str):
+        """Get the budget of a wait action in milliseconds, or None."""
+        return self.budgets.get(action)
+
+# Network values follow the Chrome DevTools presets (throughput already
+# includes DevTools' packet overhead factor); slow-4g adds Lighthouse's 4x
+# mobile CPU slowdown and cable follows WebPageTest.
+PROFILES = {
+    "slow-3g": EmulationProfile(
+        "slow-3g", latency_ms=2000, download_kbps=400, upload_kbps=400, cpu_rate=1,
+        budgets={"networkidle": 30000, "load": 20000}
+    ),
+    "fast-3g": EmulationProfile(
+        "fast-3g", latency_ms=562.5, download_kbps=1440, upload_kbps=675, cpu_rate=1,
+        budgets={"networkidle": 15000, "load": 10000}
+    ),
+    "slow-4g": EmulationProfile(
+        "slow-4g", latency_ms=562.5, download_kbps=1440, upload_kbps=675, cpu_rate=4,
+        budgets={"networkidle": 20000, "load": 12000}
+    ),
+    "fast-4g": EmulationProfile(
+        "fast-4g", latency_ms=165, download_kbps=8100, upload_kbps=1350, cpu_rate=1,
+        budgets={"networkidle": 8000, "load": 5000}
+    ),
+    "cable": EmulationProfile(
+        "cable", latency_ms=28, download_kbps=5000, upload_kbps=1000, cpu_rate=1,
+        budgets={"networkidle": 5000, "load": 3000}
+    ),
+    "cpu-4x": EmulationProfile("cpu-4x", cpu_rate=4, budgets={"networkidle": 8000, "load": 5000}),
+    "cpu-6x": EmulationProfile("cpu-6x", cpu_rate=6, budgets={"networkidle": 10000, "load": 6000})
+}
+
+class EmulationHelper:
+    """Helper class for applying emulation profiles to a page over CDP (Chromium only)"""
+
+    def __init__(self, page, profile: EmulationProfile):
+        """Initialize the EmulationHelper.
+
+        Args:
+            page: Playwright page to throttle
+            profile (EmulationProfile): Profile to apply
+        """
+        self.page = page
+        self.profile = profile
+        self.session = None
+
+    def apply(self):
+        """Throttle the page's network and CPU as described by the profile."""
+        self.session = self.page.context.new_cdp_session(self.page)
+        if self.profile.throttles_network:
+            self.session.send("Network.enable")
+            self.session.send("Network.emulateNetworkConditions", {
+                "offline": False,
+                "latency": self.profile.latency_ms,
+                # CDP expects bytes per second
+                "downloadThroughput": self.profile.download_kbps * 1000 / 8,
+                "uploadThroughput": self.profile.upload_kbps * 1000 / 8
+            })
+        if self.profile.cpu_rate != 1:
+            self.session.send("Emulation.setCPUThrottlingRate", {"rate": self.profile.cpu_rate})
+
+    def reset(self):
+        """Remove the throttling and detach from the page."""
+        if not self.session:
+            return
+        try:
+            if self.profile.throttles_network:
+                self.session.send("Network.emulateNetworkConditions", {
+                    "offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1
+                })
+            if self.profile.cpu_rate != 1:
+                self.session.send("Emulation.setCPUThrottlingRate", {"rate": 1})
+            self.session.detach()
+        except Exception:
+            # The page may already be closed
+            pass
+        self.session = None
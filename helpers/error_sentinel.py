@@ -0,0 +1,218 @@
+import json
+import re
+from playwright.sync_api import BrowserContext, Page
+
+_SENTINEL_SCRIPT = """
+(() => {
+    if (window.__llhubSentinel) return;
+    const pattern = new RegExp(%(pattern)s, 'i');
+    const maxEntries = %(max_entries)d;
+    const minStatus = %(min_status)d;
+    const entries = [];
+    const recorded = new WeakMap();
+    let seq = 0;
+    let dropped = 0;
+
+    const push = (kind, detail) => {
+        entries.push({seq: ++seq, kind, time: Date.now(), url: location.href, ...detail});
+        if (entries.length > maxEntries) {
+            entries.shift();
+            dropped++;
+        }
+    };
+    const visible = el => {
+        if (!el || !el.isConnected) return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const describe = el => el.tagName.toLowerCase() + (el.id ? '#' + el.id : '') +
+        (typeof el.className === 'string' && el.className.trim() ? '.' + el.className.trim().split(/\\s+/).join('.') : '');
+    const errorTexts = root => {
+        if (root.nodeType === Node.TEXT_NODE) return pattern.test(root.data) ? [root] : [];
+        if (root.nodeType !== Node.ELEMENT_NODE && root.nodeType !== Node.DOCUMENT_NODE) return [];
+        const found = [];
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {
+            acceptNode: node => pattern.test(node.data) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP
+        });
+        while (walker.nextNode()) found.push(walker.currentNode);
+        return found;
+    };
+    const visibleErrorTexts = root => errorTexts(root).filter(node => {
+        const el = node.parentElement;
+        return el && !['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE'].includes(el.tagName) && visible(el);
+    });
+    const inspect = root => {
+        for (const node of visibleErrorTexts(root)) {
+            if (recorded.get(node) === node.data) continue;
+            recorded.set(node, node.data);
+            push('text', {text: node.data.trim().slice(0, 200), element: describe(node.parentElement)});
+        }
+    };
+
+    // Error texts are flagged the moment they are rendered or revealed, even if they disappear before anyone looks
+    new MutationObserver(records => {
+        for (const record of records) {
+            if (record.type === 'childList') record.addedNodes.forEach(inspect);
+            else inspect(record.target);
+        }
+    }).observe(document, {
+        childList: true, subtree: true, characterData: true,
+        attributes: true, attributeFilter: ['class', 'style', 'hidden']
+    });
+
+    window.addEventListener('error', event => {
+        if (event instanceof ErrorEvent) {
+            push('error', {text: String(event.message).slice(0, 500), source: `${event.filename}:${event.lineno}`});
+        }
+    }, true);
+    window.addEventListener('unhandledrejection', event => {
+        const reason = event.reason;
+        push('rejection', {text: String(reason && (reason.stack || reason.message) || reason).slice(0, 500)});
+    });
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (...args) {
+            const url = String(args[0] && args[0].url || args[0]);
+            return originalFetch.apply(this, args).then(response => {
+                if (response.status >= minStatus) push('fetch', {url, status: response.status});
+                return response;
+            }, error => {
+                if (!(error && error.name === 'AbortError')) push('fetch', {url, status: 0, text: String(error)});
+                throw error;
+            });
+        };
+    }
+    const originalOpen = XMLHttpRequest.prototype.open;
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url, ...rest) {
+        this.__llhubUrl = String(url);
+        return originalOpen.call(this, method, url, ...rest);
+    };
+    XMLHttpRequest.prototype.send = function (...args) {
+        let aborted = false;
+        this.addEventListener('abort', () => { aborted = true; });
+        this.addEventListener('loadend', () => {
+            if (this.status >= minStatus || (this.status === 0 && !aborted)) {
+                push('fetch', {url: this.__llhubUrl, status: this.status});
+            }
+        });
+        return originalSend.apply(this, args);
+    };
+
+    Object.defineProperty(window, '__llhubSentinel', {
+        value: {
+            read(drain) {
+                const result = {
+                    entries: entries.slice(),
+                    dropped,
+                    visible: document.body ? visibleErrorTexts(document.body).map(node => ({
+                        kind: 'text', text: node.data.trim().slice(0, 200), element: describe(node.parentElement)
+                    })) : []
+                };
+                if (drain) {
+                    entries.length = 0;
+                    dropped = 0;
+                }
+                return result;
+            }
+        }
+    });
+})();
+"""
+
+class ErrorSentinel:
+    """Helper class for the in-page error sentinel.
+
+    An init script added at context creation watches every document of
+    the context. A MutationObserver flags error texts as soon as they are
+    rendered or an existing one is shown by a class, style or ``hidden``
+    change, and listeners record uncaught errors, unhandled rejections
+    and failed or 5xx fetch/XHR requests into a ring buffer in the page.
+    Verifying a page then takes a single ``evaluate`` instead of polling
+    for each error text, and errors that only flashed are caught too.
+    """
+
+    # Same texts the page objects used to poll for
+    ERROR_TEXTS = ("Error", "404", "Not Found", "Server Error")
+    # Entry kinds that fail a verification; uncaught errors and rejections are only logged
+    FATAL_KINDS = ("text", "fetch")
+
+    def __init__(self, page: Page, logger=None):
+        """Initialize the ErrorSentinel.
+
+        Args:
+            page (Page): Playwright page object
+            logger (logging.Logger, optional): Logger for non-fatal entries
+        """
+        self.page = page
+        self.logger = logger
+
+    @classmethod
+    def script(cls, max_entries: int = 200, min_status: int = 500) -> str:
+        """Build the init script.
+
+        Args:
+            max_entries (int): Size of the page-side ring buffer
+            min_status (int): Lowest HTTP status of a failed request
+
+        Returns:
+            str: JavaScript source
+        """
+        pattern = "|".join(re.escape(text) for text in cls.ERROR_TEXTS)
+        return _SENTINEL_SCRIPT % {"pattern": json.dumps(pattern), "max_entries": max_entries,
+                                   "min_status": min_status}
+
+    @classmethod
+    def install(cls, context: BrowserContext):
+        """Add the sentinel to every page of a context.
+
+        Args:
+            context (BrowserContext): Context to install the sentinel in (before its pages load)
+        """
+        context.add_init_script(cls.script())
+
+    def read(self, drain: bool = True):
+        """Read the sentinel state.
+
+        Args:
+            drain (bool): Clear the buffered entries after reading
+
+        Returns:
+            dict: Buffered entries, error texts visible now and dropped count, or None without a sentinel
+        """
+        try:
+            return self.page.evaluate(
+                "drain => window.__llhubSentinel ? window.__llhubSentinel.read(drain) : null", drain
+            )
+        except Exception:
+            return None
+
+    def verify(self) -> bool:
+        """Check the page for error states recorded since the last check.
+
+        Returns:
+            bool: True when verified, False when the page has no sentinel (use polling instead)
+
+        Raises:
+            AssertionError: If error texts appeared or requests failed
+        """
+        state = self.read()
+        if state is None:
+            return False
+
+        failures = [entry for entry in state["entries"] if entry["kind"] in self.FATAL_KINDS] + state["visible"]
+        if self.logger:
+            for entry in state["entries"]:
+                if entry["kind"] not in self.FATAL_KINDS:
+                    self.logger.warning(f"Page {entry['kind']}: {entry.get('text', '')}")
+        if failures:
+            details = "\n".join(
+                f"  [{entry['kind']}] " + (
+                    f"{entry.get('status')} {entry.get('url')}" if entry["kind"] == "fetch"
+                    else f"'{entry['text']}' in {entry['element']}"
+                )
+                for entry in failures[:10]
+            )
+            raise AssertionError(f"Error state detected on {self.page.url}:\n{details}")
+        return True
@@ -0,0 +1,201 @@
+import json
+import os
+import pytest
+from _pytest.runner import runtestprotocol
+from .run_history import RunHistory
+
+def flakiness_score(outcomes: list) -> float:
+    """Score how flaky a test is from its recent outcomes.
+
+    The score is the share of runs that were classified flaky (failed, then
+    passed on rerun) or that flipped between passed and failed compared with
+    the previous run.
+
+    Args:
+        outcomes (list): Outcome strings, oldest first
+
+    Returns:
+        float: Score between 0.0 (stable) and 1.0 (always flaky)
+    """
+    if not outcomes:
+        return 0.0
+
+    unstable = 0
+    previous = None
+    for outcome in outcomes:
+        if outcome == "flaky":
+            unstable += 1
+        elif previous in ("passed", "failed") and outcome != previous:
+            unstable += 1
+        previous = outcome if outcome != "flaky" else previous
+    return unstable / len(outcomes)
+
+class FlakyTestPlugin:
+    """Pytest plugin that classifies failures and quarantines flaky tests.
+
+    Failed tests are rerun once with fresh function-scoped fixtures (a new
+    browser context and page). A test that fails and then passes is recorded
+    as flaky. Tests marked ``quarantine``, or whose flakiness score is over
+    the threshold when auto-quarantine is on, still run but their failures
+    are reported as xfail so they do not block the run.
+    """
+
+    def __init__(self, config, history: RunHistory, threshold: float = 0.3, min_runs: int = 5,
+                 window: int = 20, auto_quarantine: bool = False):
+        """Initialize the FlakyTestPlugin.
+
+        Args:
+            config: Pytest config object carrying the shared ``llhub_run_id``
+            history (RunHistory): Store for the outcomes of each run
+            threshold (float): Flakiness score at which a test is quarantined
+            min_runs (int): Minimum recorded runs before a score is trusted
+            window (int): Number of recent runs used for the score
+            auto_quarantine (bool): Quarantine tests over the threshold automatically
+        """
+        self.config = config
+        self.history = history
+        self.threshold = threshold
+        self.min_runs = min_runs
+        self.window = window
+        self.auto_quarantine = auto_quarantine
+        self.run_id = config.llhub_run_id
+        self.quarantined = {}
+
+    def score(self, test_id: str):
+        """Get the flakiness score of a test.
+
+        Args:
+            test_id (str): Pytest node id of the test
+
+        Returns:
+            tuple: (score, number of runs the score is based on)
+        """
+        outcomes = self.history.recent_outcomes(test_id, self.window)
+        return flakiness_score(outcomes), len(outcomes)
+
+    def pytest_collection_modifyitems(self, items):
+        """Move marked or chronically flaky tests into the quarantine lane"""
+        for item in items:
+            marker = item.get_closest_marker("quarantine")
+            if marker:
+                self.quarantined[item.nodeid] = marker.kwargs.get("reason") or "marked as quarantined"
+                continue
+
+            if self.auto_quarantine:
+                score, runs = self.score(item.nodeid)
+                if runs >= self.min_runs and score >= self.threshold:
+                    reason = f"flakiness score {score:.2f} over last {runs} runs"
+                    self.quarantined[item.nodeid] = reason
+                    item.add_marker(pytest.mark.quarantine(reason=reason))
+
+    def _outcome(self, reports: list) -> str:
+        """Summarize the reports of one attempt into a single outcome."""
+        if any(report.failed for report in reports):
+            return "failed"
+        if any(report.skipped for report in reports):
+            return "skipped"
+        return "passed"
+
+    def _log(self, item, reports: list):
+        """Send reports to the terminal, HTML and JSON reporters."""
+        for report in reports:
+            item.ihook.pytest_runtest_logreport(report=report)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Run a test, rerun it once on failure and record its classification"""
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+
+        # Each attempt's reports carry only the properties recorded during that attempt
+        initial_properties = list(item.user_properties)
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        duration = sum(report.duration for report in reports)
+        outcome = self._outcome(reports)
+
+        if outcome == "failed":
+            # Log the first attempt as a rerun, then retry with fresh fixtures
+            for report in reports:
+                if report.failed and report.when in ("setup", "call"):
+                    report.outcome = "rerun"
+            self._log(item, reports)
+
+            item._initrequest()
+            item.user_properties[:] = initial_properties
+            reports = runtestprotocol(item, nextitem=nextitem, log=False)
+            duration += sum(report.duration for report in reports)
+            outcome = "flaky" if self._outcome(reports) == "passed" else "failed"
+
+        quarantine_reason = self.quarantined.get(item.nodeid)
+        if quarantine_reason and outcome == "failed":
+            for report in reports:
+                if report.failed and report.when in ("setup", "call"):
+                    report.outcome = "skipped"
+                    report.wasxfail = f"quarantined: {quarantine_reason}"
+
+        if outcome == "flaky":
+            for report in reports:
+                if report.when == "call":
+                    report.user_properties.append(("flaky", True))
+
+        self.history.record_outcome(self.run_id, item.nodeid, outcome, duration,
+                                    quarantined=bool(quarantine_reason))
+        self._log(item, reports)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_report_teststatus(self, report):
+        """Show first attempts of rerun tests as RERUN instead of FAILED"""
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+    def build_report(self) -> dict:
+        """Build the flaky test report for this run.
+
+        Returns:
+            dict: Flaky and quarantined tests of the run, and scores of all known tests
+        """
+        results = self.history.run_results(self.run_id)
+        scores = {}
+        for test_id in self.history.test_ids():
+            score, runs = self.score(test_id)
+            scores[test_id] = {"score": round(score, 3), "runs": runs}
+
+        return {
+            "run_id": self.run_id,
+            "flaky": [result["test_id"] for result in results if result["outcome"] == "flaky"],
+            "quarantined": [
+                {"test_id": result["test_id"], "outcome": result["outcome"]}
+                for result in results if result["quarantined"]
+            ],
+            "quarantine_candidates": sorted(
+                test_id for test_id, entry in scores.items()
+                if entry["runs"] >= self.min_runs and entry["score"] >= self.threshold
+            ),
+            "scores": dict(sorted(scores.items(), key=lambda entry: -entry[1]["score"]))
+        }
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Write the flaky test report and summarize it on the terminal"""
+        # Only the controller writes the report when running under xdist
+        if hasattr(self.config, "workerinput"):
+            return
+
+        report = self.build_report()
+        report_path = os.path.join("reports", "flaky_report.json")
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(report_path, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+        terminalreporter.section("flaky tests")
+        for test_id in report["flaky"]:
+            score = report["scores"].get(test_id, {}).get("score", 0.0)
+            terminalreporter.write_line(f"🔁 FLAKY {test_id} (score {score:.2f})")
+        for entry in report["quarantined"]:
+            terminalreporter.write_line(f"🚧 QUARANTINED {entry['test_id']} ({entry['outcome']})")
+        for test_id in report["quarantine_candidates"]:
+            if test_id not in {entry["test_id"] for entry in report["quarantined"]}:
+                score = report["scores"][test_id]["score"]
+                terminalreporter.write_line(f"⚠️  Quarantine candidate {test_id} (score {score:.2f})")
+        terminalreporter.write_line(f"📄 Flaky test report: {report_path}")
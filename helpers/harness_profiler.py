@@ -0,0 +1,223 @@
+import cProfile
+import glob
+import html
+import os
+import pstats
+import shutil
+import sys
+import sysconfig
+import threading
+import pytest
+from _pytest.runner import runtestprotocol
+
+class HarnessProfilerPlugin:
+    """Pytest plugin that profiles the Python side of the harness per test.
+
+    Each test (setup, call and teardown) runs under ``cProfile`` and the
+    stats are aggregated over the session. At the same time a sampler
+    thread records the main thread's stack at a fixed interval, giving
+    collapsed stacks for flame graphs and a split of the sampled time into
+    repo code (page objects, helpers, conftest), other Python (pytest and
+    report plugins) and time spent in Playwright waiting on the browser.
+    Each process saves its results; the controller merges them into
+    ``reports/harness_profile.prof`` (pstats) and
+    ``reports/harness_profile.collapsed``.
+    """
+
+    # Frame paths (relative to site-packages or the stdlib) of Playwright's event loop
+    PLAYWRIGHT_PATHS = (f"playwright{os.sep}", f"asyncio{os.sep}", f"greenlet{os.sep}", "selectors.py")
+
+    def __init__(self, config, top_n: int = 25, interval_ms: float = 5.0, reports_dir: str = "reports"):
+        """Initialize the HarnessProfilerPlugin.
+
+        Args:
+            config: Pytest config object carrying the shared ``llhub_run_id``
+            top_n (int): Number of functions in the top table
+            interval_ms (float): Stack sampling interval in milliseconds
+            reports_dir (str): Directory of the merged profile files
+        """
+        self.config = config
+        self.top_n = top_n
+        self.interval = interval_ms / 1000
+        self.reports_dir = reports_dir
+        self.parts_dir = os.path.join(reports_dir, "harness_profile", config.llhub_run_id)
+        workerinput = getattr(config, "workerinput", None)
+        self.worker = workerinput["workerid"] if workerinput else "main"
+        self.rootdir = str(config.rootpath)
+        self.stdlib = sysconfig.get_paths()["stdlib"]
+        self.stats = None
+        self.stacks = {}
+        self.summary = None
+        self._labels = {}
+        self._main_id = threading.main_thread().ident
+        self._protocol_code = runtestprotocol.__code__
+        self._sampling = threading.Event()
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(target=self._sample_loop, name="llhub-harness-sampler", daemon=True)
+        self._sampler.start()
+
+    def _short_path(self, path: str) -> str:
+        """Shorten a source path relative to the root, site-packages or the stdlib."""
+        if path.startswith(self.rootdir):
+            return os.path.relpath(path, self.rootdir)
+        if "site-packages" in path:
+            return path.split(f"site-packages{os.sep}", 1)[1]
+        if path.startswith(self.stdlib):
+            return os.path.relpath(path, self.stdlib)
+        return path
+
+    def _label(self, code) -> str:
+        """Name a code object as ``function (path:line)``."""
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({self._short_path(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _sample_loop(self):
+        """Record the main thread's stack while a test runs."""
+        while not self._stopped.wait(self.interval):
+            if not self._sampling.is_set():
+                continue
+            frame = sys._current_frames().get(self._main_id)
+            codes = []
+            # Stacks start at the test protocol, leaving out pytest and xdist startup frames
+            while frame is not None and frame.f_code is not self._protocol_code:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            if not codes:
+                continue
+            stack = ";".join(self._label(code) for code in reversed(codes))
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Profile one test including its fixtures"""
+        profile = cProfile.Profile()
+        self._sampling.set()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._sampling.clear()
+            if self.stats is None:
+                self.stats = pstats.Stats(profile)
+            else:
+                self.stats.add(profile)
+
+    def category(self, stack: str) -> str:
+        """Classify a collapsed stack by its innermost frame.
+
+        Args:
+            stack (str): Semicolon-separated frame labels, outermost first
+
+        Returns:
+            str: "playwright" (waiting on the browser), "repo" or "other"
+        """
+        path = stack.rsplit(";", 1)[-1].rsplit(" (", 1)[-1]
+        if path.startswith(self.PLAYWRIGHT_PATHS):
+            return "playwright"
+        if path.startswith(("pom", "helpers", "tests", "old")):
+            return "repo"
+        return "other"
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        """Save this process's profile; the controller merges all of them"""
+        self._stopped.set()
+        self._sampler.join(timeout=1)
+        os.makedirs(self.parts_dir, exist_ok=True)
+        if self.stats is not None:
+            self.stats.dump_stats(os.path.join(self.parts_dir, f"{self.worker}.prof"))
+            with open(os.path.join(self.parts_dir, f"{self.worker}.collapsed"), "w") as stacks_file:
+                for stack, count in self.stacks.items():
+                    stacks_file.write(f"{stack} {count}\n")
+
+        # Workers are done writing before the controller finishes its session
+        if hasattr(self.config, "workerinput"):
+            return
+        profiles = sorted(glob.glob(os.path.join(self.parts_dir, "*.prof")))
+        stacks = {}
+        for path in glob.glob(os.path.join(self.parts_dir, "*.collapsed")):
+            with open(path) as stacks_file:
+                for line in stacks_file:
+                    stack, count = line.rstrip("\n").rsplit(" ", 1)
+                    stacks[stack] = stacks.get(stack, 0) + int(count)
+        if profiles:
+            stats = pstats.Stats(*profiles)
+            profile_path = os.path.join(self.reports_dir, "harness_profile.prof")
+            stats.dump_stats(profile_path)
+            stacks_path = os.path.join(self.reports_dir, "harness_profile.collapsed")
+            with open(stacks_path, "w") as stacks_file:
+                for stack, count in sorted(stacks.items()):
+                    stacks_file.write(f"{stack} {count}\n")
+            split = {"repo": 0, "other": 0, "playwright": 0}
+            for stack, count in stacks.items():
+                split[self.category(stack)] += count
+            self.summary = {
+                "profile_path": profile_path,
+                "stacks_path": stacks_path,
+                "top": self.top_functions(stats, self.top_n),
+                "split": split
+            }
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+        try:
+            os.rmdir(os.path.dirname(self.parts_dir))
+        except OSError:
+            pass
+
+    def top_functions(self, stats: pstats.Stats, top_n: int) -> list:
+        """Get the functions with the most own time.
+
+        Args:
+            stats (pstats.Stats): Aggregated profile
+            top_n (int): Number of functions
+
+        Returns:
+            list: Dictionaries with function, calls, tottime and cumtime, most own time first
+        """
+        rows = []
+        for (path, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+            location = f" ({self._short_path(path)}:{line})" if line else ""
+            rows.append({"function": f"{name}{location}", "calls": calls, "tottime": tottime, "cumtime": cumtime})
+        return sorted(rows, key=lambda row: row["tottime"], reverse=True)[:top_n]
+
+    def _split_line(self) -> str:
+        """Describe where the sampled time went."""
+        split = self.summary["split"]
+        total = sum(split.values()) or 1
+        return (f"Sampled time: repo code {split['repo'] / total * 100:.1f}%, "
+                f"pytest and plugins {split['other'] / total * 100:.1f}%, "
+                f"Playwright / browser wait {split['playwright'] / total * 100:.1f}%")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_summary(self, prefix, summary, postfix, session):
+        """Add the top functions table to the HTML report"""
+        if not self.summary:
+            return
+        rows = "".join(
+            f"<tr><td>{row['tottime']:.3f}</td><td>{row['cumtime']:.3f}</td><td>{row['calls']}</td>"
+            f"<td>{html.escape(row['function'])}</td></tr>"
+            for row in self.summary["top"]
+        )
+        prefix.append(
+            f"<h3>Harness profile</h3><p>{html.escape(self._split_line())}</p>"
+            f"<table><tr><th>own s</th><th>cum s</th><th>calls</th><th>function</th></tr>{rows}</table>"
+        )
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show the functions with the most own time"""
+        if not self.summary:
+            return
+        terminalreporter.section("Harness profile")
+        terminalreporter.write_line(self._split_line())
+        terminalreporter.write_line(f"{'own s':>9} {'cum s':>9} {'calls':>8}  function")
+        for row in self.summary["top"]:
+            terminalreporter.write_line(
+                f"{row['tottime']:>9.3f} {row['cumtime']:>9.3f} {row['calls']:>8}  {row['function']}"
+            )
+        terminalreporter.write_line(
+            f"🐍 Profile: {self.summary['profile_path']} (pstats), "
+            f"collapsed stacks: {self.summary['stacks_path']} (flamegraph.pl / speedscope)"
+        )
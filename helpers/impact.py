@@ -0,0 +1,453 @@
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+
+class ImpactAnalyzer:
+    """Static change-impact analysis for test selection.
+
+    Builds a map from every test to the page object methods, helper modules,
+    selectors and routes it uses, and turns a ``git diff`` into the set of
+    tests that can be affected by it.
+    """
+
+    # Changes to these files can affect every test
+    RUN_ALL_FILES = {"tests/conftest.py", "helpers/__init__.py", "pom/__init__.py",
+                     "pytest.ini", "requirements.txt", "setup.py"}
+    SOURCE_DIRS = ("pom", "helpers", "tests")
+    WHOLE_MODULE = "*"
+    ROUTE_PATTERN = re.compile(r"^/[A-Za-z][\w/-]*$")
+    SELECTOR_PATTERN = re.compile(r"^(?:text=|[a-z]*[#.\[]\S|[a-z]+:[a-z-]+\()")
+
+    def __init__(self, root: str = "."):
+        """Initialize the ImpactAnalyzer.
+
+        Args:
+            root (str): Repository root directory
+        """
+        self.root = os.path.abspath(root)
+        self.modules = {}
+        self.fixtures = {}
+        self.tests = {}
+        self._package_exports = {}
+        self._build_map()
+
+    # Static map
+    def _source_files(self):
+        """List the Python files of the source directories, relative to the root."""
+        files = []
+        for directory in self.SOURCE_DIRS:
+            base = os.path.join(self.root, directory)
+            if not os.path.isdir(base):
+                continue
+            for dirpath, _, filenames in os.walk(base):
+                for filename in filenames:
+                    if filename.endswith(".py"):
+                        full_path = os.path.join(dirpath, filename)
+                        files.append(os.path.relpath(full_path, self.root).replace(os.sep, "/"))
+        return sorted(files)
+
+    def _module_path(self, module: str, current: str, level: int = 0):
+        """Resolve a dotted module name to a source file path.
+
+        Args:
+            module (str): Dotted module name (may be empty for relative imports)
+            current (str): Path of the importing file
+            level (int): Relative import level
+
+        Returns:
+            str: Relative file path, or None for modules outside the repository
+        """
+        if level:
+            package = os.path.dirname(current).split("/")
+            package = package[:len(package) - (level - 1)] if level > 1 else package
+            parts = package + (module.split(".") if module else [])
+        else:
+            parts = module.split(".")
+
+        candidates = ["/".join(parts) + ".py", "/".join(parts) + "/__init__.py"]
+        for candidate in candidates:
+            if os.path.exists(os.path.join(self.root, candidate)):
+                return candidate
+        return None
+
+    def _parse(self, path: str):
+        """Parse a source file into an AST."""
+        with open(os.path.join(self.root, path), encoding="utf-8") as source:
+            return ast.parse(source.read(), filename=path)
+
+    def _collect_imports(self, path: str, tree):
+        """Map imported names of a module to the files that define them."""
+        names = {}
+        modules = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    target = self._module_path(alias.name, path)
+                    if target:
+                        modules.add(target)
+                        names[alias.asname or alias.name.split(".")[0]] = target
+            elif isinstance(node, ast.ImportFrom):
+                target = self._module_path(node.module or "", path, node.level)
+                if not target:
+                    continue
+                for alias in node.names:
+                    submodule = self._module_path(f"{node.module}.{alias.name}", path, node.level) \
+                        if node.module else None
+                    resolved = submodule or self._reexport(target, alias.name)
+                    modules.add(resolved)
+                    names[alias.asname or alias.name] = resolved
+        return names, modules
+
+    def _reexport(self, target: str, name: str):
+        """Follow package re-exports such as ``from helpers import TestLogger``.
+
+        Args:
+            target (str): File the name is imported from
+            name (str): Imported name
+
+        Returns:
+            str: File that actually defines the name
+        """
+        if not target.endswith("__init__.py"):
+            return target
+        if target not in self._package_exports:
+            self._package_exports[target] = {}
+            self._package_exports[target], _ = self._collect_imports(target, self._parse(target))
+        return self._package_exports[target].get(name, target)
+
+    def _function_usage(self, node):
+        """Collect called attribute names, string literals and routes used by a function."""
+        calls = set()
+        selectors = set()
+        routes = set()
+        # Fragments of f-strings are not complete selectors or routes
+        fragments = {id(value) for child in ast.walk(node) if isinstance(child, ast.JoinedStr)
+                     for value in child.values}
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call) and isinstance(child.func, ast.Attribute):
+                calls.add(child.func.attr)
+            elif isinstance(child, ast.Constant) and isinstance(child.value, str) and id(child) not in fragments:
+                value = child.value.strip()
+                if self.ROUTE_PATTERN.match(value):
+                    routes.add(value)
+                elif self.SELECTOR_PATTERN.match(value):
+                    selectors.add(value)
+        return calls, selectors, routes
+
+    @staticmethod
+    def _references(tree):
+        """Map every attribute and name read in a module to the lines reading it."""
+        references = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute):
+                references.setdefault(node.attr, set()).add(node.lineno)
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+                references.setdefault(node.id, set()).add(node.lineno)
+        return references
+
+    def _is_fixture(self, node):
+        """Check whether a function definition is decorated as a pytest fixture."""
+        for decorator in node.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", "")
+            if name == "fixture":
+                return True
+        return False
+
+    def _build_map(self):
+        """Build the module, fixture and test maps from the source tree."""
+        for path in self._source_files():
+            try:
+                tree = self._parse(path)
+            except SyntaxError:
+                continue
+
+            names, imports = self._collect_imports(path, tree)
+            info = {"imports": imports, "methods": {}, "functions": {}, "references": self._references(tree)}
+
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef):
+                    for item in node.body:
+                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                            calls, selectors, routes = self._function_usage(item)
+                            info["methods"][item.name] = {
+                                "class": node.name,
+                                "lines": (item.lineno, item.end_lineno),
+                                "calls": calls,
+                                "selectors": selectors,
+                                "routes": routes
+                            }
+                            if node.name.startswith("Test") and item.name.startswith("test_"):
+                                self._add_test(path, item, imports)
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    info["functions"][node.name] = (node.lineno, node.end_lineno)
+                    if self._is_fixture(node):
+                        self._add_fixture(node, names)
+                    elif node.name.startswith("test_") and os.path.basename(path).startswith("test_"):
+                        self._add_test(path, node, imports)
+
+            self.modules[path] = info
+
+    def _add_fixture(self, node, names: dict):
+        """Record the fixtures and modules a fixture depends on."""
+        used_modules = {names[child.id] for child in ast.walk(node)
+                        if isinstance(child, ast.Name) and child.id in names}
+        calls, _, _ = self._function_usage(node)
+        fixture = self.fixtures.setdefault(node.name, {"fixtures": set(), "modules": set(), "calls": set()})
+        fixture["fixtures"].update(arg.arg for arg in node.args.args)
+        fixture["modules"].update(used_modules)
+        fixture["calls"].update(calls)
+
+    def _add_test(self, path: str, node, imports: set):
+        """Record what a single test function uses."""
+        calls, selectors, routes = self._function_usage(node)
+        for decorator in node.decorator_list:
+            _, decorator_selectors, decorator_routes = self._function_usage(decorator)
+            selectors.update(decorator_selectors)
+            routes.update(decorator_routes)
+
+        self.tests[(path, node.name)] = {
+            "fixtures": {arg.arg for arg in node.args.args if arg.arg != "self"},
+            "modules": set(imports),
+            "calls": calls,
+            "selectors": selectors,
+            "routes": routes
+        }
+
+    def _resolve_fixture(self, name: str, seen=None):
+        """Resolve a fixture to the modules and calls it pulls in transitively."""
+        seen = seen if seen is not None else set()
+        if name in seen or name not in self.fixtures:
+            return set(), set()
+        seen.add(name)
+        fixture = self.fixtures[name]
+        modules = set(fixture["modules"])
+        calls = set(fixture["calls"])
+        for dependency in fixture["fixtures"]:
+            dep_modules, dep_calls = self._resolve_fixture(dependency, seen)
+            modules.update(dep_modules)
+            calls.update(dep_calls)
+        return modules, calls
+
+    def _test_dependencies(self, key):
+        """Return the modules a test depends on and the methods it calls."""
+        test = self.tests[key]
+        modules = set(test["modules"])
+        calls = set(test["calls"])
+        for fixture in test["fixtures"]:
+            fixture_modules, fixture_calls = self._resolve_fixture(fixture)
+            modules.update(fixture_modules)
+            calls.update(fixture_calls)
+
+        # Modules imported by the modules we use (e.g. pom -> helpers.logger)
+        pending = list(modules)
+        while pending:
+            module = pending.pop()
+            for imported in self.modules.get(module, {}).get("imports", ()):
+                if imported not in modules:
+                    modules.add(imported)
+                    pending.append(imported)
+        return modules, calls
+
+    def dependency_map(self):
+        """Build a serializable map from each test to what it uses.
+
+        Returns:
+            dict: ``path::test`` mapped to modules, methods, selectors and routes
+        """
+        result = {}
+        for key, test in sorted(self.tests.items()):
+            modules, calls = self._test_dependencies(key)
+            methods = sorted(
+                f"{self.modules[module]['methods'][call]['class']}.{call}"
+                for module in modules if module in self.modules
+                for call in calls if call in self.modules[module]["methods"]
+            )
+            result[f"{key[0]}::{key[1]}"] = {
+                "modules": sorted(modules),
+                "methods": methods,
+                "selectors": sorted(test["selectors"]),
+                "routes": sorted(test["routes"])
+            }
+        return result
+
+    # Git diff
+    def changed_lines(self, base: str):
+        """Collect changed files and their changed line numbers since a git revision.
+
+        Args:
+            base (str): Git revision to diff the working tree against
+
+        Returns:
+            dict: Relative path mapped to a set of changed lines, or None when
+                the whole file should be treated as changed
+        """
+        diff = subprocess.run(
+            ["git", "diff", "--unified=0", "--no-color", base, "--"],
+            cwd=self.root, capture_output=True, text=True, check=True
+        ).stdout
+
+        changes = {}
+        old_path = new_path = None
+        for line in diff.splitlines():
+            if line.startswith("--- "):
+                old_path = None if line[4:] == "/dev/null" else line[6:]
+            elif line.startswith("+++ "):
+                new_path = None if line[4:] == "/dev/null" else line[6:]
+                if new_path is None or old_path is None:
+                    # Added or deleted file
+                    changes[new_path or old_path] = None
+                else:
+                    changes.setdefault(new_path, set())
+            elif line.startswith("@@") and new_path and changes.get(new_path) is not None:
+                match = re.match(r"@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", line)
+                if match:
+                    start = int(match.group(1))
+                    count = int(match.group(2)) if match.group(2) is not None else 1
+                    changes[new_path].update(range(max(start, 1), max(start, 1) + max(count, 1)))
+
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "--", *self.SOURCE_DIRS],
+            cwd=self.root, capture_output=True, text=True, check=True
+        ).stdout
+        for path in untracked.splitlines():
+            changes[path] = None
+        return changes
+
+    # Selection
+    @staticmethod
+    def _owner(info: dict, line: int):
+        """Find the method or module level function containing a line (None outside of both)."""
+        for name, method in info["methods"].items():
+            start, end = method["lines"]
+            if start <= line <= end:
+                return name
+        for name, (start, end) in info["functions"].items():
+            if start <= line <= end:
+                return name
+        return None
+
+    def _changed_units(self, changes: dict):
+        """Turn changed lines into changed (module, method) units.
+
+        A changed method or function also changes every method and function
+        reading its name, in its own module and in the modules importing it.
+        A read outside of any function (module or class level) changes the
+        whole reading module.
+        """
+        units = {}
+        for path, lines in changes.items():
+            if path not in self.modules or lines is None:
+                units[path] = {self.WHOLE_MODULE}
+                continue
+            info = self.modules[path]
+            units[path] = {self._owner(info, line) or self.WHOLE_MODULE for line in lines}
+
+        importers = {}
+        for path, info in self.modules.items():
+            for imported in info["imports"]:
+                importers.setdefault(imported, set()).add(path)
+
+        pending = [(path, name) for path, changed in units.items() for name in changed]
+        while pending:
+            changed_module, name = pending.pop()
+            if name == self.WHOLE_MODULE:
+                # Whole-module changes propagate to every module importing them
+                for path in importers.get(changed_module, ()):
+                    if self.WHOLE_MODULE not in units.get(path, ()):
+                        units.setdefault(path, set()).add(self.WHOLE_MODULE)
+                        pending.append((path, self.WHOLE_MODULE))
+                continue
+
+            for path in {changed_module} | importers.get(changed_module, set()):
+                info = self.modules.get(path)
+                changed = units.setdefault(path, set())
+                if info is None or self.WHOLE_MODULE in changed:
+                    continue
+                for line in info["references"].get(name, ()):
+                    caller = self._owner(info, line) or self.WHOLE_MODULE
+                    if caller not in changed:
+                        changed.add(caller)
+                        pending.append((path, caller))
+        return units
+
+    def requires_full_run(self, changes: dict) -> bool:
+        """Check whether the changes touch shared configuration.
+
+        Args:
+            changes (dict): Output of ``changed_lines``
+
+        Returns:
+            bool: True if every test should run
+        """
+        for path in changes:
+            if path in self.RUN_ALL_FILES or os.path.basename(path) == "conftest.py":
+                return True
+            # Deleted page objects or helpers cannot be mapped reliably
+            if path.startswith(("pom/", "helpers/")) and path.endswith(".py") and path not in self.modules:
+                return True
+        return False
+
+    def affected_tests(self, changes: dict):
+        """Find the tests affected by a set of changes.
+
+        Args:
+            changes (dict): Output of ``changed_lines``
+
+        Returns:
+            set: ``(path, test_name)`` keys, or None if every test should run
+        """
+        if self.requires_full_run(changes):
+            return None
+
+        units = self._changed_units(changes)
+        affected = set()
+        for key, test in self.tests.items():
+            path, name = key
+            changed_in_file = units.get(path, set())
+            if self.WHOLE_MODULE in changed_in_file or name in changed_in_file:
+                affected.add(key)
+                continue
+            # Module level fixtures of the test file itself
+            if changed_in_file & (set(self.fixtures) & test["fixtures"]):
+                affected.add(key)
+                continue
+
+            modules, calls = self._test_dependencies(key)
+            for module in modules:
+                changed = units.get(module)
+                if not changed:
+                    continue
+                if self.WHOLE_MODULE in changed or changed & calls:
+                    affected.add(key)
+                    break
+        return affected
+
+def main():
+    parser = argparse.ArgumentParser(description="Show tests affected by changes since a git revision")
+    parser.add_argument("--base", default="HEAD", help="Git revision to diff against (default: HEAD)")
+    parser.add_argument("--map", action="store_true", help="Print the full test dependency map as JSON")
+    args = parser.parse_args()
+
+    analyzer = ImpactAnalyzer()
+    if args.map:
+        print(json.dumps(analyzer.dependency_map(), indent=2))
+        return 0
+
+    changes = analyzer.changed_lines(args.base)
+    affected = analyzer.affected_tests(changes)
+    if affected is None:
+        print("🔁 Shared configuration changed - all tests are affected")
+    elif not affected:
+        print("✅ No tests affected")
+    else:
+        for path, name in sorted(affected):
+            print(f"{path}::{name}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,6 @@
 import pytest
 from playwright.sync_api import Page
 from pom.landlord_page import LandlordPage
-import os
-from dotenv import load_dotenv
-
-load_dotenv(override=True)
 
 @pytest.fixture
 def landlord_page(page: Page, base_url: str):
@@ -12,12 +8,11 @@ def landlord_page(page: Page, base_url: str):
     return LandlordPage(page, base_url)
 
 @pytest.fixture
-def landlord_credentials():
+def landlord_credentials(lease_account):
     """Fixture to provide landlord credentials"""
-    email = os.getenv('LANDLORD_USER_EMAIL')
-    password = os.getenv('LANDLORD_USER_PASSWORD')
+    credentials = lease_account("landlord")
     
-    if not email or not password:
+    if not credentials:
         pytest.fail("LANDLORD_USER_EMAIL and LANDLORD_USER_PASSWORD must be set in .env file")
     
-    return {"email": email, "password": password}
\ No newline at end of file
+    return credentials.as_dict()
\ No newline at end of file
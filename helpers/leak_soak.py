@@ -0,0 +1,195 @@
+import json
+import os
+from datetime import datetime
+
+class LeakSoak:
+    """Helper class for heap and DOM growth tracking across navigation loops.
+
+    Cycles through routes on one page the way a long-lived SPA session does
+    (client-side navigation, no reloads). Every visit goes from the first
+    route (home) to the visited route and back home. Around each visit it
+    forces a garbage collection and samples the heap size, DOM node count and
+    event listener count through CDP ``Performance.getMetrics``; the
+    difference is what the visit left behind. The metrics are page-global,
+    so only these per-visit deltas attribute growth to a route. A linear
+    trend is fitted per route and metric to the running total of its deltas
+    to find steady growth.
+    """
+
+    METRICS = ("JSHeapUsedSize", "Nodes", "JSEventListeners")
+    # Growth per loop above which a metric counts as leaking
+    DEFAULT_THRESHOLDS = {"JSHeapUsedSize": 50 * 1024, "Nodes": 5, "JSEventListeners": 1}
+
+    def __init__(self, page, base_url: str, routes: list, iterations: int = 100, warmup: int = 3,
+                 thresholds: dict = None, reports_dir: str = "reports/leak_soak"):
+        """Initialize the LeakSoak.
+
+        Args:
+            page: Logged-in Playwright page (Chromium)
+            base_url (str): Base URL of the application
+            routes (list): Routes to cycle through, the first one is home
+            iterations (int): Number of loops over all routes
+            warmup (int): Initial loops left out of the trend (caches filling up)
+            thresholds (dict, optional): Metric mapped to the leaking growth per loop
+            reports_dir (str): Directory for the JSON report
+        """
+        self.page = page
+        self.base_url = base_url
+        self.routes = routes
+        self.iterations = iterations
+        self.warmup = warmup
+        self.thresholds = {**self.DEFAULT_THRESHOLDS, **(thresholds or {})}
+        self.reports_dir = reports_dir
+        self.samples = {route: {metric: [] for metric in self.METRICS} for route in routes}
+        self.session = None
+
+    def _navigate(self, route: str):
+        """Navigate inside the SPA without reloading, so leaked objects survive."""
+        self.page.evaluate(
+            """path => {
+                window.history.pushState({}, '', path);
+                window.dispatchEvent(new PopStateEvent('popstate', {state: {}}));
+            }""",
+            route
+        )
+        self.page.wait_for_load_state("networkidle")
+
+    def _sample(self) -> dict:
+        """Force garbage collection and read the tracked metrics."""
+        self.session.send("HeapProfiler.collectGarbage")
+        metrics = self.session.send("Performance.getMetrics")["metrics"]
+        values = {metric["name"]: metric["value"] for metric in metrics}
+        return {name: values.get(name, 0) for name in self.METRICS}
+
+    @staticmethod
+    def slope(values: list) -> float:
+        """Least-squares growth per step of a series.
+
+        Args:
+            values (list): Samples in order
+
+        Returns:
+            float: Slope of the fitted line (0 for fewer than two samples)
+        """
+        count = len(values)
+        if count < 2:
+            return 0.0
+        mean_x = (count - 1) / 2
+        mean_y = sum(values) / count
+        covariance = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+        variance = sum((x - mean_x) ** 2 for x in range(count))
+        return covariance / variance
+
+    def run(self) -> dict:
+        """Run the soak loop.
+
+        Returns:
+            dict: Analysis per route (see ``analyze``)
+        """
+        home = self.routes[0]
+        self.session = self.page.context.new_cdp_session(self.page)
+        self.session.send("Performance.enable")
+        self.session.send("HeapProfiler.enable")
+        try:
+            # Load the app once; every later visit is client-side
+            self.page.goto(f"{self.base_url}{home}")
+            self.page.wait_for_load_state("networkidle")
+            before = self._sample()
+            for _ in range(self.iterations):
+                for route in self.routes:
+                    # Returning home releases what the route only needs while shown
+                    self._navigate(route)
+                    if route != home:
+                        self._navigate(home)
+                    after = self._sample()
+                    for name in self.METRICS:
+                        self.samples[route][name].append(after[name] - before[name])
+                    before = after
+        finally:
+            self.session.detach()
+            self.session = None
+        return self.analyze()
+
+    def analyze(self) -> dict:
+        """Fit growth trends to the per-visit deltas.
+
+        Returns:
+            dict: Route mapped to per-metric retained growth, growth per loop and leak flag
+        """
+        analysis = {}
+        for route, metrics in self.samples.items():
+            route_result = {}
+            for name, deltas in metrics.items():
+                trend = deltas[self.warmup:] if len(deltas) > self.warmup + 1 else deltas
+                # Running total of what the route's visits left behind
+                retained = []
+                for delta in trend:
+                    retained.append((retained[-1] if retained else 0) + delta)
+                growth = self.slope(retained)
+                route_result[name] = {
+                    "retained": retained[-1] if retained else 0,
+                    "growth_per_loop": growth,
+                    "leaking": growth > self.thresholds[name]
+                }
+            analysis[route] = route_result
+        return analysis
+
+    @staticmethod
+    def leaking_routes(analysis: dict) -> dict:
+        """Get the routes with at least one leaking metric.
+
+        Args:
+            analysis (dict): Output of ``analyze``
+
+        Returns:
+            dict: Route mapped to the names of its leaking metrics
+        """
+        leaks = {}
+        for route, metrics in analysis.items():
+            leaking = [name for name, result in metrics.items() if result["leaking"]]
+            if leaking:
+                leaks[route] = leaking
+        return leaks
+
+    def save_report(self, analysis: dict) -> str:
+        """Save the analysis and the per-visit deltas as JSON.
+
+        Args:
+            analysis (dict): Output of ``analyze``
+
+        Returns:
+            str: Path of the saved report
+        """
+        if not os.path.exists(self.reports_dir):
+            os.makedirs(self.reports_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.reports_dir, f"leak_soak_{timestamp}.json")
+        with open(path, "w") as report_file:
+            json.dump({
+                "iterations": self.iterations,
+                "warmup": self.warmup,
+                "thresholds": self.thresholds,
+                "analysis": analysis,
+                "samples": self.samples
+            }, report_file, indent=2)
+        return path
+
+    @staticmethod
+    def format_summary(analysis: dict) -> str:
+        """Format the analysis as a table, one row per route.
+
+        Args:
+            analysis (dict): Output of ``analyze``
+
+        Returns:
+            str: Human readable summary
+        """
+        lines = [f"{'Route':<20} {'Heap/loop':>12} {'Nodes/loop':>11} {'Listeners/loop':>15}"]
+        for route, metrics in analysis.items():
+            flag = " ⚠️ LEAK" if any(result["leaking"] for result in metrics.values()) else ""
+            lines.append(
+                f"{route:<20} {metrics['JSHeapUsedSize']['growth_per_loop'] / 1024:>10.1f}KB "
+                f"{metrics['Nodes']['growth_per_loop']:>11.2f} "
+                f"{metrics['JSEventListeners']['growth_per_loop']:>15.2f}{flag}"
+            )
+        return "\n".join(lines)
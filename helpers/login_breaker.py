@@ -0,0 +1,169 @@
+import json
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime
+
+class LoginCircuitOpenError(Exception):
+    """Raised when an account's login circuit is open after a definitive failure"""
+
+class LoginCircuitBreaker:
+    """Per-account login circuit breaker shared across the session.
+
+    The first definitive login failure for an account opens the circuit for
+    that account only, so one locked account of a pool does not stop the
+    others. Definitive failures are the application rejecting the
+    credentials with an error message and the application being
+    unreachable. A login that times out on the login page (wrong
+    credentials without a visible message, or a hung backend) can also be
+    a slow redirect, so the circuit opens only after several of them in a
+    row for the same account, with the first one's diagnosis. Missing
+    elements and other errors never open it.
+    State is kept in small files per account, so every xdist worker of the
+    run sees it, and later logins fail immediately with the original
+    diagnosis instead of waiting out the login timeouts again.
+    """
+
+    # Login failures retrying cannot fix within the run: the app's error message or no connection
+    DEFINITIVE_FAILURES = (
+        "Login failed with error message",
+        "net::ERR_CONNECTION_",
+        "net::ERR_NAME_NOT_RESOLVED",
+        "net::ERR_ADDRESS_UNREACHABLE"
+    )
+    # Login redirect timeouts: the page objects' own message, and Playwright's wait_for_url timeout
+    # (AdminPage.login lets it through)
+    REDIRECT_TIMEOUTS = (
+        "Login failed - still on login page",
+        "waiting for navigation to"
+    )
+
+    def __init__(self, state_dir: str, redirect_timeouts: int = 2):
+        """Initialize the LoginCircuitBreaker.
+
+        Args:
+            state_dir (str): Directory shared by all workers of the run
+            redirect_timeouts (int): Consecutive redirect timeouts of an account that open its circuit
+        """
+        self.state_dir = state_dir
+        self.redirect_timeouts = redirect_timeouts
+        if not os.path.exists(self.state_dir):
+            os.makedirs(self.state_dir, exist_ok=True)
+
+    def _state_path(self, account: str, kind: str = "circuit") -> str:
+        """Get a state file of an account (its open circuit or its redirect timeouts)."""
+        name = re.sub(r"[^\w.@-]", "_", account.lower())
+        suffix = "" if kind == "circuit" else f".{kind}"
+        return os.path.join(self.state_dir, f"{name}{suffix}.json")
+
+    def diagnosis(self, account: str):
+        """Get the diagnosis that opened the circuit for an account.
+
+        Args:
+            account (str): Email of the account
+
+        Returns:
+            str: Original failure message, or None if the circuit is closed
+        """
+        try:
+            with open(self._state_path(account)) as state_file:
+                return json.load(state_file)["diagnosis"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+
+    def is_definitive(self, error: Exception) -> bool:
+        """Check whether a login error should open the circuit.
+
+        Args:
+            error (Exception): Error raised while logging in
+
+        Returns:
+            bool: True if retrying in this run cannot succeed
+        """
+        message = str(error)
+        return any(marker in message for marker in self.DEFINITIVE_FAILURES)
+
+    def is_redirect_timeout(self, error: Exception) -> bool:
+        """Check whether a login error is a timeout waiting to leave the login page.
+
+        Args:
+            error (Exception): Error raised while logging in
+
+        Returns:
+            bool: True for redirect timeouts, which open the circuit only when repeated
+        """
+        message = str(error)
+        return any(marker in message for marker in self.REDIRECT_TIMEOUTS)
+
+    def record_redirect_timeout(self, account: str, diagnosis: str):
+        """Count a redirect timeout of an account and open its circuit after enough in a row.
+
+        Args:
+            account (str): Email of the account
+            diagnosis (str): Failure message; the first one of the streak is kept
+        """
+        path = self._state_path(account, "timeouts")
+        try:
+            with open(path) as state_file:
+                streak = json.load(state_file)
+        except (FileNotFoundError, ValueError):
+            streak = {"count": 0, "diagnosis": diagnosis}
+        streak["count"] += 1
+        with open(path, "w") as state_file:
+            json.dump(streak, state_file)
+        if streak["count"] >= self.redirect_timeouts:
+            self.trip(account, f"{streak['diagnosis']} ({streak['count']} login redirect timeouts in a row)")
+
+    def reset(self, account: str):
+        """End an account's streak of redirect timeouts after a successful login.
+
+        Args:
+            account (str): Email of the account
+        """
+        try:
+            os.remove(self._state_path(account, "timeouts"))
+        except FileNotFoundError:
+            pass
+
+    def trip(self, account: str, diagnosis: str):
+        """Open the circuit for an account, keeping the first diagnosis.
+
+        Args:
+            account (str): Email of the account
+            diagnosis (str): Failure message to report to later tests
+        """
+        state = json.dumps({"diagnosis": diagnosis, "opened_at": datetime.now().isoformat()})
+        try:
+            # O_EXCL makes the first worker to fail win
+            fd = os.open(self._state_path(account), os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+        except FileExistsError:
+            return
+        with os.fdopen(fd, "w") as state_file:
+            state_file.write(state)
+
+    @contextmanager
+    def guard(self, account: str):
+        """Run a login, failing fast if the circuit is open and tripping it on definitive failures.
+
+        Args:
+            account (str): Email of the account logging in (the leased one with account leasing)
+
+        Raises:
+            LoginCircuitOpenError: If an earlier login of the account failed definitively
+        """
+        diagnosis = self.diagnosis(account)
+        if diagnosis:
+            raise LoginCircuitOpenError(f"Login circuit open for {account}: {diagnosis}")
+        try:
+            yield
+        except Exception as e:
+            lines = str(e).splitlines() or [type(e).__name__]
+            # Playwright's first line is only "Timeout ...ms exceeded."; name the wait it logged too
+            waits = [line.strip() for line in lines[1:] if line.strip().startswith("waiting for")]
+            message = f"{lines[0]} {waits[0]}" if waits else lines[0]
+            if self.is_definitive(e):
+                self.trip(account, message)
+            elif self.is_redirect_timeout(e):
+                self.record_redirect_timeout(account, message)
+            raise
+        self.reset(account)
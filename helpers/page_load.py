@@ -1,5 +1,67 @@
-from playwright.sync_api import Page, expect, TimeoutError
+import time
+from playwright.sync_api import Page, expect, TimeoutError, Error
 from .logger import TestLogger
+from .timeouts import get_timeout_service
+from .error_sentinel import ErrorSentinel
+
+# Rejection message of the in-page waits when their deadline passes
+_WAIT_TIMEOUT_MARKER = "llhub-wait-timeout"
+# Errors of in-page waits whose document was replaced by a navigation
+_NAVIGATION_ERRORS = ("Execution context was destroyed", "Cannot find context with specified id")
+
+# Resolves once the observed value stops changing for quietMs.
+# mode "text": textContent of the selector, "count": number of matches
+# (at least `minimum`), "dom": any mutation below the selector (or body).
+_SETTLE_SCRIPT = """
+([selector, mode, quietMs, timeoutMs, minimum]) => new Promise((resolve, reject) => {
+    const snapshot = () => {
+        if (mode === 'text') {
+            const element = document.querySelector(selector);
+            return element ? element.textContent : null;
+        }
+        if (mode === 'count') return document.querySelectorAll(selector).length;
+        return null;
+    };
+    const ready = value => mode === 'text' ? value !== null : mode === 'count' ? value >= minimum : true;
+    const root = mode === 'dom' ? (selector && document.querySelector(selector)) || document.body : document.documentElement;
+    let last = snapshot();
+    let quietTimer = null;
+    const finish = (ok) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        ok ? resolve(last) : reject(new Error('""" + _WAIT_TIMEOUT_MARKER + """'));
+    };
+    const restartQuietTimer = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => { if (ready(last)) finish(true); }, quietMs);
+    };
+    const observer = new MutationObserver(() => {
+        if (mode !== 'dom') {
+            const value = snapshot();
+            if (value === last) return;
+            last = value;
+        }
+        restartQuietTimer();
+    });
+    observer.observe(root, {attributes: true, childList: true, subtree: true, characterData: true});
+    const deadline = setTimeout(() => finish(false), timeoutMs);
+    restartQuietTimer();
+})
+"""
+
+# Truthy once the element matching the selector is in the requested state
+_ELEMENT_STATE_SCRIPT = """
+([selector, state]) => {
+    const element = document.querySelector(selector);
+    if (!element) return false;
+    if (state === 'enabled') return !element.disabled;
+    if (state === 'disabled') return !!element.disabled;
+    if (state === 'checked') return !!element.checked;
+    if (state === 'unchecked') return !element.checked;
+    return false;
+}
+"""
 
 class PageLoadHelper:
     """Helper class for page load verification strategies"""
@@ -13,78 +75,257 @@ class PageLoadHelper:
         """
         self.page = page
         self.logger = TestLogger(f"page_load_{test_name}")
+        self.timeouts = get_timeout_service()
+        # Durations of the condition waits, in call order
+        self.wait_log = []
+
+    def _timeout(self, action: str, timeout: int = None, default: int = 30000) -> int:
+        """Resolve the timeout for a wait on the current route.
+
+        Args:
+            action (str): Name of the wait
+            timeout (int, optional): Explicit timeout in milliseconds
+            default (int): Timeout used without learned data
 
-    def wait_for_network_idle(self, timeout: int = 30000):
+        Returns:
+            int: Explicit timeout, or the adaptive timeout for this route and action
+        """
+        if timeout is not None:
+            return timeout
+        return self.timeouts.timeout(action, self.page.url, default=default)
+
+    def _condition_wait(self, action: str, description: str, wait):
+        """Run a condition wait, recording how long it took.
+
+        Successful durations also go to the timeout service, so condition
+        waits get adaptive timeouts like the load state waits. When the page
+        navigates during an in-page wait, the wait runs once more on the new
+        document after it loaded; a second navigation counts as a timeout.
+
+        Args:
+            action (str): Name of the wait for the timeout service
+            description (str): Human readable condition for the log
+            wait (callable): Performs the wait; raises on timeout
+
+        Returns:
+            tuple: (True and the wait's result, or False and None on timeout)
+        """
+        route = self.page.url
+        start = time.perf_counter()
+        retried = False
+        while True:
+            try:
+                result = wait()
+                break
+            except (TimeoutError, Error) as e:
+                navigated = any(marker in str(e) for marker in _NAVIGATION_ERRORS)
+                if navigated and not retried:
+                    retried = True
+                    self.logger.info(f"Page navigated during wait for {description}; waiting again on the new page")
+                    try:
+                        self.page.wait_for_load_state(
+                            "domcontentloaded", timeout=self._timeout("domcontentloaded", default=30000)
+                        )
+                    except TimeoutError:
+                        pass
+                    continue
+                timed_out = isinstance(e, TimeoutError) or _WAIT_TIMEOUT_MARKER in str(e)
+                if not (timed_out or navigated):
+                    raise
+                duration_ms = (time.perf_counter() - start) * 1000
+                self.wait_log.append(
+                    {"action": action, "condition": description, "duration_ms": duration_ms, "ok": False}
+                )
+                self.logger.warning(f"{description} not met after {duration_ms:.0f}ms")
+                return False, None
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        # A wait spanning a navigation says nothing about how long the route takes to settle
+        if not retried:
+            self.timeouts.record(action, route, duration_ms)
+        self.wait_log.append({"action": action, "condition": description, "duration_ms": duration_ms, "ok": True})
+        self.logger.info(f"{description} after {duration_ms:.0f}ms")
+        return True, result
+
+    def wait_for_network_idle(self, timeout: int = None):
         """Wait for network to be idle.
         
         Args:
-            timeout (int): Maximum time to wait in milliseconds
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
         """
         try:
-            self.page.wait_for_load_state("networkidle", timeout=timeout)
+            with self.timeouts.measure("networkidle", self.page.url):
+                self.page.wait_for_load_state("networkidle", timeout=self._timeout("networkidle", timeout))
             self.logger.info("Network is idle")
         except TimeoutError:
             self.logger.warning("Network did not become idle within timeout")
 
-    def wait_for_dom_content_loaded(self, timeout: int = 30000):
+    def wait_for_dom_content_loaded(self, timeout: int = None):
         """Wait for DOM content to be loaded.
         
         Args:
-            timeout (int): Maximum time to wait in milliseconds
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
         """
         try:
-            self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            with self.timeouts.measure("domcontentloaded", self.page.url):
+                self.page.wait_for_load_state("domcontentloaded", timeout=self._timeout("domcontentloaded", timeout))
             self.logger.info("DOM content is loaded")
         except TimeoutError:
             self.logger.warning("DOM content did not load within timeout")
 
-    def wait_for_load(self, timeout: int = 30000):
+    def wait_for_load(self, timeout: int = None):
         """Wait for page load event.
         
         Args:
-            timeout (int): Maximum time to wait in milliseconds
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
         """
         try:
-            self.page.wait_for_load_state("load", timeout=timeout)
+            with self.timeouts.measure("load", self.page.url):
+                self.page.wait_for_load_state("load", timeout=self._timeout("load", timeout))
             self.logger.info("Page load event fired")
         except TimeoutError:
             self.logger.warning("Page load event did not fire within timeout")
 
-    def wait_for_selector(self, selector: str, timeout: int = 30000):
+    def wait_for_selector(self, selector: str, timeout: int = None):
         """Wait for a specific element to be present.
         
         Args:
             selector (str): CSS selector to wait for
-            timeout (int): Maximum time to wait in milliseconds
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
         """
         try:
-            self.page.wait_for_selector(selector, timeout=timeout)
+            with self.timeouts.measure(f"selector:{selector}", self.page.url):
+                self.page.wait_for_selector(selector, timeout=self._timeout(f"selector:{selector}", timeout))
             self.logger.info(f"Selector '{selector}' is present")
         except TimeoutError:
             self.logger.warning(f"Selector '{selector}' did not appear within timeout")
 
-    def wait_for_navigation(self, timeout: int = 30000):
+    def wait_for_navigation(self, timeout: int = None):
         """Wait for navigation to complete.
         
         Args:
-            timeout (int): Maximum time to wait in milliseconds
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
         """
         try:
-            self.page.wait_for_load_state("networkidle", timeout=timeout)
-            self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            with self.timeouts.measure("navigation", self.page.url):
+                self.page.wait_for_load_state("networkidle", timeout=self._timeout("networkidle", timeout))
+                self.page.wait_for_load_state("domcontentloaded", timeout=self._timeout("domcontentloaded", timeout))
             self.logger.info("Navigation completed")
         except TimeoutError:
             self.logger.warning("Navigation did not complete within timeout")
 
+    def wait_for_element_state(self, selector: str, state: str, timeout: int = None) -> bool:
+        """Wait for an element to reach a state.
+
+        Args:
+            selector (str): Selector of the element (CSS for enabled/disabled/checked/unchecked)
+            state (str): visible, hidden, attached, detached, enabled, disabled, checked or unchecked
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
+
+        Returns:
+            bool: True if the element reached the state in time
+        """
+        action = f"state:{state}:{selector}"
+        timeout = self._timeout(action, timeout, default=10000)
+        if state in ("visible", "hidden", "attached", "detached"):
+            def wait():
+                self.page.locator(selector).first.wait_for(state=state, timeout=timeout)
+        else:
+            def wait():
+                self.page.wait_for_function(_ELEMENT_STATE_SCRIPT, arg=[selector, state], timeout=timeout)
+        ok, _ = self._condition_wait(action, f"'{selector}' {state}", wait)
+        return ok
+
+    def wait_for_text_settled(self, selector: str, quiet_ms: int = 300, timeout: int = None):
+        """Wait until an element's text stops changing.
+
+        Args:
+            selector (str): CSS selector of the element
+            quiet_ms (int): Time the text must stay unchanged in milliseconds
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
+
+        Returns:
+            str: Settled text, or None if it did not settle in time
+        """
+        action = f"text_settled:{selector}"
+        timeout = self._timeout(action, timeout, default=10000)
+        _, text = self._condition_wait(
+            action, f"Text of '{selector}' settled",
+            lambda: self.page.evaluate(_SETTLE_SCRIPT, [selector, "text", quiet_ms, timeout, 0])
+        )
+        return text
+
+    def wait_for_count_stable(self, selector: str, quiet_ms: int = 300, minimum: int = 0, timeout: int = None):
+        """Wait until the number of matching elements stops changing.
+
+        Args:
+            selector (str): CSS selector of the elements
+            quiet_ms (int): Time the count must stay unchanged in milliseconds
+            minimum (int): Smallest count accepted as settled
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
+
+        Returns:
+            int: Settled count, or None if it did not settle in time
+        """
+        action = f"count_stable:{selector}"
+        timeout = self._timeout(action, timeout, default=10000)
+        _, count = self._condition_wait(
+            action, f"Count of '{selector}' stable",
+            lambda: self.page.evaluate(_SETTLE_SCRIPT, [selector, "count", quiet_ms, timeout, minimum])
+        )
+        return count
+
+    def wait_for_request_completed(self, url_pattern, trigger=None, timeout: int = None):
+        """Wait for a response to a request matching a URL pattern.
+
+        Args:
+            url_pattern: URL glob, regular expression or predicate as accepted by Playwright
+            trigger (callable, optional): Action that causes the request (avoids missing fast responses)
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
+
+        Returns:
+            Response: Matching response, or None if none arrived in time
+        """
+        action = f"request:{getattr(url_pattern, 'pattern', url_pattern)}"
+        timeout = self._timeout(action, timeout, default=30000)
+
+        def wait():
+            with self.page.expect_response(url_pattern, timeout=timeout) as response_info:
+                if trigger:
+                    trigger()
+            return response_info.value
+
+        _, response = self._condition_wait(action, f"Response for {url_pattern}", wait)
+        return response
+
+    def wait_for_dom_stable(self, quiet_ms: int = 500, root_selector: str = None, timeout: int = None) -> bool:
+        """Wait until the DOM stops mutating for a while.
+
+        Args:
+            quiet_ms (int): Time without mutations in milliseconds
+            root_selector (str, optional): CSS selector of the subtree to watch (default: body)
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
+
+        Returns:
+            bool: True if the DOM was quiet in time
+        """
+        action = "dom_stable"
+        timeout = self._timeout(action, timeout, default=10000)
+        ok, _ = self._condition_wait(
+            action, f"DOM{f' under {root_selector}' if root_selector else ''} stable for {quiet_ms}ms",
+            lambda: self.page.evaluate(_SETTLE_SCRIPT, [root_selector, "dom", quiet_ms, timeout, 0])
+        )
+        return ok
+
     def verify_page_loaded(self, expected_url: str = None, expected_title: str = None, 
-                          required_selector: str = None, timeout: int = 30000):
+                          required_selector: str = None, timeout: int = None):
         """Comprehensive page load verification.
         
         Args:
             expected_url (str, optional): Expected URL to verify
             expected_title (str, optional): Expected page title
             required_selector (str, optional): Required element selector
-            timeout (int): Maximum time to wait in milliseconds
+            timeout (int, optional): Maximum time to wait in milliseconds (adaptive if not set)
         """
         try:
             # Wait for network and DOM
@@ -106,10 +347,11 @@ class PageLoadHelper:
                 self.wait_for_selector(required_selector, timeout)
                 self.logger.info(f"Required element verified: {required_selector}")
 
-            # Check for common error indicators
-            error_selectors = ["text=Error", "text=404", "text=Not Found", "text=Server Error"]
-            for selector in error_selectors:
-                expect(self.page.locator(selector)).not_to_be_visible()
+            # Check for common error indicators, including ones that only flashed
+            if not ErrorSentinel(self.page, self.logger).verify():
+                error_selectors = ["text=Error", "text=404", "text=Not Found", "text=Server Error"]
+                for selector in error_selectors:
+                    expect(self.page.locator(selector)).not_to_be_visible()
 
             self.logger.info("Page load verification completed successfully")
             return True
@@ -0,0 +1,126 @@
+import ssl
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+class AppPreflight:
+    """Helper class for the pre-flight health gate and warm-up.
+
+    Runs before any browser launches: waits for the application host to
+    answer plain HTTP requests (with exponential backoff), optionally checks
+    a status endpoint, then warms the key routes with concurrent requests so
+    a cold deployment does not eat into the first tests' timeouts.
+    """
+
+    WARM_ROUTES = ("/login", "/welcome", "/property", "/tenants")
+
+    def __init__(self, base_url: str, timeout: float = 60, status_path: str = None,
+                 warm_routes: tuple = WARM_ROUTES, request_timeout: float = 10, max_backoff: float = 8):
+        """Initialize the AppPreflight.
+
+        Args:
+            base_url (str): Base URL of the application
+            timeout (float): Maximum seconds to wait for the application to become ready
+            status_path (str, optional): Status endpoint that must answer successfully (e.g. "/status")
+            warm_routes (tuple): Routes requested concurrently once the host is up
+            request_timeout (float): Timeout of a single HTTP request in seconds
+            max_backoff (float): Largest delay between reachability attempts in seconds
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.status_path = status_path
+        self.warm_routes = warm_routes
+        self.request_timeout = request_timeout
+        self.max_backoff = max_backoff
+        # Same policy as the browser context (ignore_https_errors)
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+
+    def _request(self, path: str):
+        """Request a path and return its status code and duration.
+
+        Args:
+            path (str): Path relative to the base URL
+
+        Returns:
+            tuple: (HTTP status code or None if unreachable, elapsed seconds, error message)
+        """
+        start = time.perf_counter()
+        try:
+            request = urllib.request.Request(f"{self.base_url}{path}", headers={"User-Agent": "llhub-preflight"})
+            with urllib.request.urlopen(request, timeout=self.request_timeout, context=self._ssl_context) as response:
+                response.read()
+                return response.status, time.perf_counter() - start, None
+        except urllib.error.HTTPError as e:
+            return e.code, time.perf_counter() - start, str(e)
+        except Exception as e:
+            return None, time.perf_counter() - start, str(e)
+
+    def wait_until_reachable(self, deadline: float):
+        """Poll the base URL with exponential backoff until it answers without a server error.
+
+        Args:
+            deadline (float): ``time.perf_counter()`` value to give up at
+
+        Returns:
+            tuple: (reachable, number of attempts, last error message)
+        """
+        delay = 0.5
+        attempts = 0
+        last_error = None
+        while True:
+            attempts += 1
+            status, _, error = self._request("/")
+            if status is not None and status < 500:
+                return True, attempts, None
+            last_error = error or f"HTTP {status}"
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False, attempts, last_error
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_backoff)
+
+    def warm_up(self):
+        """Request the warm-up routes concurrently.
+
+        Returns:
+            dict: Route mapped to (status code, elapsed seconds)
+        """
+        if not self.warm_routes:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(self.warm_routes)) as executor:
+            results = executor.map(self._request, self.warm_routes)
+            return {route: (status, elapsed) for route, (status, elapsed, _) in zip(self.warm_routes, results)}
+
+    def run(self) -> dict:
+        """Run the full pre-flight check.
+
+        Returns:
+            dict: ready flag, time_to_ready in seconds, attempts, warm-up results and error message
+        """
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        result = {"ready": False, "time_to_ready": None, "attempts": 0, "warm_up": {}, "error": None}
+
+        reachable, result["attempts"], error = self.wait_until_reachable(deadline)
+        if not reachable:
+            result["error"] = f"{self.base_url} not reachable after {self.timeout:.0f}s: {error}"
+            return result
+
+        if self.status_path:
+            while True:
+                status, _, error = self._request(self.status_path)
+                if status is not None and status < 400:
+                    break
+                if time.perf_counter() >= deadline:
+                    result["error"] = f"{self.status_path} not healthy: {error or f'HTTP {status}'}"
+                    return result
+                time.sleep(1)
+
+        result["warm_up"] = self.warm_up()
+        result["ready"] = True
+        result["time_to_ready"] = time.perf_counter() - start
+        return result
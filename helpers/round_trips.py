@@ -0,0 +1,221 @@
+import functools
+import importlib
+import inspect
+import time
+from importlib.metadata import version
+
+class RoundTripCounterError(Exception):
+    """Raised when the installed Playwright cannot be instrumented"""
+    pass
+
+class RoundTripCounter:
+    """Counts browser round trips made by page object methods and tests.
+
+    Every protocol call Playwright sends to the browser (``click``,
+    ``fill``, ``isVisible``, ``queryCount``, ``expect`` polls, ...) goes
+    through ``Channel.inner_send``, which is wrapped to count the call and
+    its latency. Page object methods are wrapped at class level so each
+    call is attributed to every page object method on the stack, and to
+    ``(test)`` when made outside page objects. A method whose single call
+    makes more round trips than its budget is reported as a violation.
+    """
+
+    # Page object class path mapped to extra private methods counted (public ones always are)
+    TARGETS = {
+        "pom.admin_page.AdminPage": ("_verify_page_content",),
+        "pom.landlord_page.LandlordPage": ("_verify_page_content",),
+        "pom.tenant_page.TenantPage": ("_verify_page_content",)
+    }
+    OUTSIDE = "(test)"
+    # Playwright (major, minor) versions whose private Channel.inner_send is known to match the wrapper
+    SUPPORTED_PLAYWRIGHT = ((1, 40),)
+    INNER_SEND_PARAMETERS = ("self", "method", "params", "return_as_dict")
+
+    def __init__(self, budgets: dict = None, default_budget: int = None):
+        """Initialize the RoundTripCounter.
+
+        Args:
+            budgets (dict, optional): Method (``login`` or ``LandlordPage.login``) mapped to
+                the most round trips one call may make
+            default_budget (int, optional): Budget of methods without their own
+        """
+        self.budgets = budgets or {}
+        self.default_budget = default_budget
+        self.active = False
+        self.methods = {}
+        self.violations = []
+        self._stack = []
+        self._outside = None
+        self._originals = []
+
+    @classmethod
+    def _channel_class(cls):
+        """Get Playwright's ``Channel`` class after checking it can be wrapped.
+
+        ``Channel.inner_send`` is private API, so the Playwright version and the
+        method's signature are checked before it is replaced.
+
+        Raises:
+            RoundTripCounterError: If the installed Playwright is not supported
+        """
+        installed = version("playwright")
+        if tuple(int(part) for part in installed.split(".")[:2]) not in cls.SUPPORTED_PLAYWRIGHT:
+            supported = ", ".join(f"{major}.{minor}" for major, minor in cls.SUPPORTED_PLAYWRIGHT)
+            raise RoundTripCounterError(
+                f"Round-trip counting supports Playwright {supported} (requirements.txt pin), "
+                f"but {installed} is installed"
+            )
+
+        try:
+            from playwright._impl._connection import Channel
+        except ImportError as e:
+            raise RoundTripCounterError(f"Playwright {installed} has no Channel class to instrument: {e}")
+        inner_send = getattr(Channel, "inner_send", None)
+        if not inspect.iscoroutinefunction(inner_send) or \
+                tuple(inspect.signature(inner_send).parameters) != cls.INNER_SEND_PARAMETERS:
+            raise RoundTripCounterError(
+                f"Playwright {installed} has no Channel.inner_send({', '.join(cls.INNER_SEND_PARAMETERS[1:])}) "
+                "coroutine to instrument"
+            )
+        return Channel
+
+    def install(self):
+        """Wrap ``Channel.inner_send`` and the page object methods.
+
+        Raises:
+            RoundTripCounterError: If the installed Playwright is not supported
+        """
+        if self._originals:
+            return
+        Channel = self._channel_class()
+        original_send = Channel.inner_send
+        counter = self
+
+        async def inner_send(channel, method, params, return_as_dict):
+            start = time.perf_counter()
+            try:
+                return await original_send(channel, method, params, return_as_dict)
+            finally:
+                counter._record(f"{channel._object._type}.{method}", (time.perf_counter() - start) * 1000)
+
+        Channel.inner_send = inner_send
+        self._originals.append((Channel, "inner_send", original_send))
+
+        for class_path, extra_methods in self.TARGETS.items():
+            module_name, class_name = class_path.rsplit(".", 1)
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            for method_name, method in list(vars(page_class).items()):
+                if not callable(method) or (method_name.startswith("_") and method_name not in extra_methods):
+                    continue
+                if getattr(method, "__llhub_round_trips__", False):
+                    continue
+                setattr(page_class, method_name, self._wrap(method, f"{class_name}.{method_name}"))
+                self._originals.append((page_class, method_name, method))
+
+    def uninstall(self):
+        """Restore the original functions."""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals = []
+
+    def budget(self, label: str):
+        """Get the round-trip budget of a page object method (None without one)."""
+        return self.budgets.get(label, self.budgets.get(label.split(".", 1)[-1], self.default_budget))
+
+    def _wrap(self, method, label: str):
+        """Attribute the round trips of a page object method call."""
+        counter = self
+
+        @functools.wraps(method)
+        def wrapper(page_object, *args, **kwargs):
+            if not counter.active:
+                return method(page_object, *args, **kwargs)
+            frame = {"label": label, "round_trips": 0, "latency_ms": 0.0, "protocol": {}}
+            counter._stack.append(frame)
+            try:
+                return method(page_object, *args, **kwargs)
+            finally:
+                counter._stack.pop()
+                counter._finish(frame)
+
+        wrapper.__llhub_round_trips__ = True
+        return wrapper
+
+    def _entry(self, label: str) -> dict:
+        """Get the totals of a method, creating them on first use."""
+        entry = self.methods.get(label)
+        if entry is None:
+            entry = self.methods[label] = {"calls": 0, "round_trips": 0, "max_round_trips": 0,
+                                           "latency_ms": 0.0, "protocol": {}}
+        return entry
+
+    def _record(self, protocol_method: str, latency_ms: float):
+        """Count one round trip for the running page object methods (or the test)."""
+        if not self.active:
+            return
+        frames = self._stack or [self._outside]
+        for frame in frames:
+            frame["round_trips"] += 1
+            frame["latency_ms"] += latency_ms
+            frame["protocol"][protocol_method] = frame["protocol"].get(protocol_method, 0) + 1
+
+    def _finish(self, frame: dict):
+        """Add a finished page object method call to the totals and check its budget."""
+        entry = self._entry(frame["label"])
+        entry["calls"] += 1
+        entry["round_trips"] += frame["round_trips"]
+        entry["max_round_trips"] = max(entry["max_round_trips"], frame["round_trips"])
+        entry["latency_ms"] += frame["latency_ms"]
+        for name, count in frame["protocol"].items():
+            entry["protocol"][name] = entry["protocol"].get(name, 0) + count
+
+        budget = self.budget(frame["label"])
+        if budget is not None and frame["round_trips"] > budget:
+            top = ", ".join(f"{name} x{count}" for name, count in
+                            sorted(frame["protocol"].items(), key=lambda item: -item[1])[:5])
+            self.violations.append(f"{frame['label']}: {frame['round_trips']} round trips > {budget} budget ({top})")
+
+    def start(self):
+        """Start counting for a test."""
+        self.methods = {}
+        self.violations = []
+        self._stack = []
+        self._outside = {"label": self.OUTSIDE, "round_trips": 0, "latency_ms": 0.0, "protocol": {}}
+        self.active = True
+
+    def stop(self) -> dict:
+        """Stop counting and get the test's totals.
+
+        Returns:
+            dict: Method label mapped to calls, round_trips, max_round_trips, latency_ms and protocol counts
+        """
+        self.active = False
+        if self._outside["round_trips"]:
+            self._entry(self.OUTSIDE).update(
+                calls=1, round_trips=self._outside["round_trips"], max_round_trips=self._outside["round_trips"],
+                latency_ms=self._outside["latency_ms"], protocol=self._outside["protocol"]
+            )
+        return self.methods
+
+    @staticmethod
+    def merge(results: list) -> dict:
+        """Merge the totals of several tests.
+
+        Args:
+            results (list): Outputs of ``stop``
+
+        Returns:
+            dict: Method label mapped to merged totals
+        """
+        merged = {}
+        for methods in results:
+            for label, entry in methods.items():
+                total = merged.setdefault(label, {"calls": 0, "round_trips": 0, "max_round_trips": 0,
+                                                  "latency_ms": 0.0, "protocol": {}})
+                total["calls"] += entry["calls"]
+                total["round_trips"] += entry["round_trips"]
+                total["max_round_trips"] = max(total["max_round_trips"], entry["max_round_trips"])
+                total["latency_ms"] += entry["latency_ms"]
+                for name, count in entry["protocol"].items():
+                    total["protocol"][name] = total["protocol"].get(name, 0) + count
+        return merged
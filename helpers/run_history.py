@@ -0,0 +1,172 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+
+class RunHistory:
+    """SQLite-backed store of test outcomes and wait timings across runs.
+
+    SQLite handles concurrent writers, so every xdist worker can record its
+    own results into the same database.
+    """
+
+    def __init__(self, db_path: str = "reports/history/run_history.db"):
+        """Initialize the RunHistory.
+
+        Args:
+            db_path (str): Path of the SQLite database file
+        """
+        self.db_path = db_path
+        self._setup_database()
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that waits for other writers instead of failing.
+
+        The transaction is committed (or rolled back on error) and the
+        connection closed when the block exits.
+        """
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _setup_database(self):
+        """Create the database file and tables if they do not exist"""
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS test_runs (
+                    run_id TEXT NOT NULL,
+                    test_id TEXT NOT NULL,
+                    outcome TEXT NOT NULL,
+                    duration REAL NOT NULL,
+                    quarantined INTEGER NOT NULL DEFAULT 0,
+                    recorded_at TEXT NOT NULL
+                )
+            """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_test_runs_test ON test_runs (test_id, recorded_at)"
+            )
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS action_timings (
+                    route TEXT NOT NULL,
+                    action TEXT NOT NULL,
+                    duration_ms REAL NOT NULL,
+                    recorded_at TEXT NOT NULL,
+                    profile TEXT NOT NULL DEFAULT ''
+                )
+            """)
+            # Databases created before emulation profiles were recorded
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(action_timings)")}
+            if "profile" not in columns:
+                connection.execute("ALTER TABLE action_timings ADD COLUMN profile TEXT NOT NULL DEFAULT ''")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_action_timings ON action_timings (route, action, recorded_at)"
+            )
+
+    def record_outcome(self, run_id: str, test_id: str, outcome: str, duration: float,
+                       quarantined: bool = False):
+        """Record the final outcome of a test in a run.
+
+        Args:
+            run_id (str): Identifier shared by all workers of a run
+            test_id (str): Pytest node id of the test
+            outcome (str): One of passed, failed, flaky or skipped
+            duration (float): Total duration in seconds, including reruns
+            quarantined (bool): Whether the test ran in the quarantine lane
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO test_runs (run_id, test_id, outcome, duration, quarantined, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, test_id, outcome, duration, int(quarantined), datetime.now().isoformat())
+            )
+
+    def recent_outcomes(self, test_id: str, window: int = 20):
+        """Get the most recent outcomes of a test, oldest first.
+
+        Args:
+            test_id (str): Pytest node id of the test
+            window (int): Maximum number of runs to return
+
+        Returns:
+            list: Outcome strings
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT outcome FROM test_runs WHERE test_id = ? AND outcome != 'skipped' "
+                "ORDER BY recorded_at DESC LIMIT ?",
+                (test_id, window)
+            ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def test_ids(self):
+        """Get every test id with recorded history.
+
+        Returns:
+            list: Pytest node ids
+        """
+        with self._connect() as connection:
+            rows = connection.execute("SELECT DISTINCT test_id FROM test_runs ORDER BY test_id").fetchall()
+        return [row[0] for row in rows]
+
+    def run_results(self, run_id: str):
+        """Get the recorded results of a single run.
+
+        Args:
+            run_id (str): Identifier of the run
+
+        Returns:
+            list: Dictionaries with test_id, outcome, duration and quarantined
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT test_id, outcome, duration, quarantined FROM test_runs WHERE run_id = ? ORDER BY test_id",
+                (run_id,)
+            ).fetchall()
+        return [
+            {"test_id": test_id, "outcome": outcome, "duration": duration, "quarantined": bool(quarantined)}
+            for test_id, outcome, duration, quarantined in rows
+        ]
+
+    def record_timings(self, samples: list):
+        """Record successful wait durations.
+
+        Args:
+            samples (list): (route, action, duration_ms, profile) tuples; profile is "" when unthrottled
+        """
+        if not samples:
+            return
+        recorded_at = datetime.now().isoformat()
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT INTO action_timings (route, action, duration_ms, recorded_at, profile) VALUES (?, ?, ?, ?, ?)",
+                [(route, action, duration_ms, recorded_at, profile) for route, action, duration_ms, profile in samples]
+            )
+
+    def timing_samples(self, window: int = 50):
+        """Get the most recent wait durations for every route and action.
+
+        Args:
+            window (int): Maximum number of samples per route and action
+
+        Returns:
+            dict: (route, action, profile) mapped to a list of durations in milliseconds
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT route, action, profile, duration_ms FROM action_timings ORDER BY recorded_at DESC"
+            ).fetchall()
+
+        samples = {}
+        for route, action, profile, duration_ms in rows:
+            durations = samples.setdefault((route, action, profile), [])
+            if len(durations) < window:
+                durations.append(duration_ms)
+        return samples
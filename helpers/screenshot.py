@@ -1,21 +1,39 @@
 from playwright.sync_api import Page
+import json
 import os
 from datetime import datetime
 import re
 
 class ScreenshotHelper:
-    """Helper class for test screenshots"""
-    
-    def __init__(self, page: Page, test_name: str):
+    """Helper class for test screenshots
+
+    Error screenshots follow a capture policy: ``element`` clips to the
+    failing locator's bounding box plus a margin, ``viewport`` captures the
+    visible area and ``full`` the whole page up to ``max_pixels``. ``auto``
+    uses the element when the error names a locator that is on the page and
+    falls back to the viewport otherwise.
+    """
+
+    POLICIES = ("auto", "element", "viewport", "full")
+
+    def __init__(self, page: Page, test_name: str, policy: str = "auto", margin: int = 80,
+                 max_pixels: int = 4_000_000):
         """Initialize the ScreenshotHelper.
         
         Args:
             page (Page): Playwright page object
             test_name (str): Name of the test for screenshot naming
+            policy (str): Capture policy of error screenshots (auto, element, viewport or full)
+            margin (int): Context in CSS pixels kept around a failing element
+            max_pixels (int): Largest image size in pixels; taller pages are cut, wider images downscaled
         """
         self.page = page
         self.test_name = self._sanitize_filename(test_name)
         self.screenshot_dir = "reports/screenshots"
+        self.policy = policy
+        self.margin = margin
+        self.max_pixels = max_pixels
+        self.last_capture = None
         self._ensure_screenshot_dir()
 
     def _sanitize_filename(self, filename: str) -> str:
@@ -60,15 +78,115 @@ class ScreenshotHelper:
         except Exception as e:
             raise
 
-    def take_error_screenshot(self, page_path: str, error_message: str = None, full_page: bool = True):
+    @staticmethod
+    def failing_selector(error_text: str):
+        """Get the selector of the locator an error was waiting for.
+
+        Args:
+            error_text (str): Error message or report text with Playwright's call log
+
+        Returns:
+            str: Selector (chained locators joined with ``>>``), or None
+        """
+        if not error_text:
+            return None
+        for line in reversed(error_text.splitlines()):
+            if "waiting for" not in line:
+                continue
+            parts = re.findall(r'locator\("((?:[^"\\]|\\.)*)"\)', line)
+            if not parts:
+                parts = re.findall(r'selector "((?:[^"\\]|\\.)*)"', line)
+            if parts:
+                return " >> ".join(json.loads(f'"{part}"') for part in parts)
+        return None
+
+    def _element_clip(self, selector: str):
+        """Get the failing element's box plus margin within the viewport (None if it has none)."""
+        try:
+            locator = self.page.locator(selector).first
+            if locator.count() == 0:
+                return None
+            locator.scroll_into_view_if_needed(timeout=2000)
+            box = locator.bounding_box(timeout=2000)
+        except Exception:
+            return None
+        viewport = self.page.viewport_size
+        if not box or not viewport:
+            return None
+        left = max(0, box["x"] - self.margin)
+        top = max(0, box["y"] - self.margin)
+        right = min(viewport["width"], box["x"] + box["width"] + self.margin)
+        bottom = min(viewport["height"], box["y"] + box["height"] + self.margin)
+        if right <= left or bottom <= top:
+            return None
+        return {"x": left, "y": top, "width": right - left, "height": bottom - top}
+
+    def _downscale(self, path: str):
+        """Shrink an image over ``max_pixels`` in place (needs Pillow)."""
+        try:
+            from PIL import Image
+        except ImportError:
+            return
+        with Image.open(path) as image:
+            width, height = image.size
+            if width * height <= self.max_pixels:
+                return
+            factor = (self.max_pixels / (width * height)) ** 0.5
+            resized = image.resize((max(1, int(width * factor)), max(1, int(height * factor))))
+        resized.save(path)
+
+    def capture(self, name: str, policy: str = None, selector: str = None):
+        """Take a screenshot following a capture policy.
+
+        Args:
+            name (str): Name for the screenshot
+            policy (str, optional): auto, element, viewport or full (default: the helper's policy)
+            selector (str, optional): Selector of the element for the element policy
+
+        Returns:
+            str: Path of the screenshot
+        """
+        policy = policy or self.policy
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown capture policy '{policy}', expected one of {', '.join(self.POLICIES)}")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{self.test_name}_{self._sanitize_filename(name)}_{timestamp}.png"
+        screenshot_path = os.path.join(self.screenshot_dir, filename)
+
+        options = {"path": screenshot_path, "scale": "css"}
+        used = "viewport"
+        if policy in ("auto", "element") and selector:
+            clip = self._element_clip(selector)
+            if clip:
+                options["clip"] = clip
+                used = "element"
+        if policy == "full":
+            used = "full"
+            options["full_page"] = True
+            width, height = self.page.evaluate(
+                "() => [document.documentElement.scrollWidth, document.documentElement.scrollHeight]"
+            )
+            if width * height > self.max_pixels:
+                used = "full (cut)"
+                options["clip"] = {"x": 0, "y": 0, "width": width, "height": max(1, self.max_pixels // max(1, width))}
+
+        self.page.screenshot(**options)
+        self._downscale(screenshot_path)
+        self.last_capture = {"policy": used, "selector": selector if used == "element" else None}
+        return screenshot_path
+
+    def take_error_screenshot(self, page_path: str, error_message: str = None, full_page: bool = None,
+                              policy: str = None, selector: str = None):
         """Take a screenshot on test failure.
         
         Args:
             page_path (str): The path of the page that failed
-            error_message (str, optional): Additional error message to include in filename
-            full_page (bool): Whether to take a full page screenshot
+            error_message (str, optional): Additional error message to include in filename; the failing
+                locator is read from it when no selector is given
+            full_page (bool, optional): Force a full page (True) or viewport (False) screenshot
+            policy (str, optional): Capture policy (default: the helper's policy)
+            selector (str, optional): Selector of the failing element
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_path = self._sanitize_filename(page_path)
         
         if error_message:
@@ -76,5 +194,7 @@ class ScreenshotHelper:
             name = f"error_{safe_path}_{safe_error}"
         else:
             name = f"error_{safe_path}"
-            
-        return self.take_screenshot(name, full_page) 
\ No newline at end of file
+
+        if full_page is not None:
+            policy = "full" if full_page else "viewport"
+        return self.capture(name, policy, selector or self.failing_selector(error_message))
@@ -0,0 +1,357 @@
+import functools
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from playwright.sync_api import Page, Locator
+from .timeouts import TimeoutService
+
+class SelectorProfiler:
+    """Times selector resolution against the live page.
+
+    ``Page.locator`` and ``Locator.locator`` are wrapped to remember the
+    selector of each locator (kept through ``first``, ``last`` and ``nth``).
+    The selector is measured when it is used: by a locator method
+    (``click``, ``is_visible``, ``wait_for``, ...) or a page method taking a
+    selector (``click``, ``fill``, ``wait_for_selector``, ...). Methods that
+    change the page are measured right before they act, the others once
+    they return, after auto-waiting. A measurement resolves the selector
+    with ``count()`` a few times; the fastest run minus the fastest run of a
+    trivial ``:root`` lookup is its engine cost, and the match count is
+    recorded too. The first time a comma list is seen on a route, each
+    alternative is counted on its own so branches that never match show
+    up. Selectors are then ranked by total cost and ambiguity, with a
+    suggestion for those that should become ``data-testid`` lookups.
+    """
+
+    # Page methods taking a selector as first argument (or ``selector=``)
+    PAGE_METHODS = ("click", "fill", "is_visible", "is_enabled", "query_selector", "query_selector_all",
+                    "wait_for_selector", "text_content", "inner_text", "get_attribute")
+    # Locator methods using the elements of the locator's selector
+    LOCATOR_METHODS = ("click", "fill", "check", "press", "hover", "is_visible", "is_enabled", "is_checked",
+                       "wait_for", "text_content", "inner_text", "get_attribute", "input_value", "count", "all")
+    # Locator methods and properties returning a locator of the same selector
+    DERIVED = ("first", "last", "nth")
+    # Methods that change the page, so they are measured before they act instead of after
+    CHANGES_PAGE = ("click", "fill", "check", "press", "hover")
+    ACTIONS = ("click", "fill", "check", "press", "hover", "is_visible", "is_enabled", "is_checked",
+               "wait_for_selector", "wait_for", "text_content", "inner_text", "get_attribute", "input_value")
+    # Selector features that need Playwright's slower engines or full-text scans
+    EXPENSIVE_PATTERNS = {
+        ":has-text(": "has-text", ":text(": "text", "text=": "text engine", ":has(": "has",
+        " i]": "case-insensitive attribute", "*=": "substring attribute", ">>": "chained"
+    }
+
+    def __init__(self, repeats: int = 3, max_samples: int = 5, slow_ms: float = 2.0, root: str = None,
+                 round_trips=None):
+        """Initialize the SelectorProfiler.
+
+        Args:
+            repeats (int): Resolutions per measurement; the fastest one counts
+            max_samples (int): Measurements per route and selector in this process
+            slow_ms (float): Engine cost per resolution from which a selector counts as slow
+            root (str, optional): Project root used to find the call site of a selector
+            round_trips (RoundTripCounter, optional): Counter paused while measuring, so
+                measurements are not counted as the test's round trips
+        """
+        self.repeats = max(1, repeats)
+        self.max_samples = max_samples
+        self.slow_ms = slow_ms
+        self.root = root or os.getcwd()
+        self.round_trips = round_trips
+        self.results = {}
+        self._samples = {}
+        self._branches_seen = set()
+        self._busy = False
+        self._originals = []
+
+    def install(self):
+        """Wrap the selector entry points of ``Page`` and ``Locator``."""
+        if self._originals:
+            return
+        wrappers = [(Page, "locator", self._wrap_factory(Page.locator, scoped=False)),
+                    (Locator, "locator", self._wrap_factory(Locator.locator, scoped=True))]
+        for method_name in self.PAGE_METHODS:
+            wrappers.append((Page, method_name, self._wrap_use(getattr(Page, method_name), method_name, False)))
+        for method_name in self.LOCATOR_METHODS:
+            wrappers.append((Locator, method_name, self._wrap_use(getattr(Locator, method_name), method_name, True)))
+        for name in self.DERIVED:
+            original = getattr(Locator, name)
+            if isinstance(original, property):
+                wrappers.append((Locator, name, property(self._wrap_derived(original.fget))))
+            else:
+                wrappers.append((Locator, name, self._wrap_derived(original)))
+
+        for owner, name, wrapper in wrappers:
+            self._originals.append((owner, name, getattr(owner, name)))
+            setattr(owner, name, wrapper)
+
+    def uninstall(self):
+        """Restore the original methods."""
+        for owner, method_name, original in reversed(self._originals):
+            setattr(owner, method_name, original)
+        self._originals = []
+
+    @staticmethod
+    def _wrap_factory(method, scoped: bool):
+        """Remember the selector a locator is created with."""
+
+        @functools.wraps(method)
+        def wrapper(owner, *args, **kwargs):
+            locator = method(owner, *args, **kwargs)
+            selector = args[0] if args else kwargs.get("selector")
+            if isinstance(selector, str):
+                locator._llhub_selector = (owner, selector, scoped)
+            return locator
+
+        return wrapper
+
+    @staticmethod
+    def _wrap_derived(method):
+        """Pass the remembered selector on to a locator derived from another."""
+
+        @functools.wraps(method)
+        def wrapper(locator, *args, **kwargs):
+            derived = method(locator, *args, **kwargs)
+            source = getattr(locator, "_llhub_selector", None)
+            if source is not None:
+                derived._llhub_selector = source
+            return derived
+
+        return wrapper
+
+    def _wrap_use(self, method, method_name: str, on_locator: bool):
+        """Measure the selector a method uses when the method runs."""
+        profiler = self
+
+        @functools.wraps(method)
+        def wrapper(owner, *args, **kwargs):
+            if on_locator:
+                source = getattr(owner, "_llhub_selector", None)
+            else:
+                selector = args[0] if args else kwargs.get("selector")
+                source = (owner, selector, False) if isinstance(selector, str) else None
+            if profiler._busy or source is None:
+                return method(owner, *args, **kwargs)
+            selector_owner, selector, scoped = source
+            if method_name in profiler.CHANGES_PAGE:
+                profiler._measure(selector_owner, selector, method_name, scoped)
+                return method(owner, *args, **kwargs)
+            result = method(owner, *args, **kwargs)
+            profiler._measure(selector_owner, selector, method_name, scoped)
+            return result
+
+        return wrapper
+
+    def _call_site(self) -> str:
+        """Find the first frame of repo code outside the harness's method wrappers."""
+        frame = sys._getframe(2)
+        while frame is not None:
+            path = frame.f_code.co_filename
+            if path.startswith(self.root) and path != __file__ and frame.f_code.co_name != "wrapper":
+                return f"{os.path.relpath(path, self.root)}:{frame.f_lineno}"
+            frame = frame.f_back
+        return ""
+
+    @staticmethod
+    def split_alternatives(selector: str) -> list:
+        """Split a selector on its top-level commas.
+
+        Args:
+            selector (str): CSS or Playwright selector
+
+        Returns:
+            list: Alternatives; a single item when the selector is not a list
+        """
+        parts = []
+        depth = 0
+        quote = None
+        start = 0
+        for index, char in enumerate(selector):
+            if quote:
+                if char == quote and selector[index - 1] != "\\":
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif char in "([":
+                depth += 1
+            elif char in ")]":
+                depth -= 1
+            elif char == "," and depth == 0:
+                parts.append(selector[start:index].strip())
+                start = index + 1
+        parts.append(selector[start:].strip())
+        return [part for part in parts if part]
+
+    def _fastest(self, locator) -> tuple:
+        """Resolve a locator ``repeats`` times; returns (fastest ms, match count)."""
+        fastest = None
+        count = 0
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            count = locator.count()
+            elapsed = (time.perf_counter() - start) * 1000
+            fastest = elapsed if fastest is None else min(fastest, elapsed)
+        return fastest, count
+
+    def _measure(self, owner, selector: str, method_name: str, scoped: bool):
+        """Time a selector against the current page state."""
+        page = owner.page if scoped else owner
+        try:
+            route = TimeoutService.route_of(page.url)
+        except Exception:
+            return
+        key = f"{route} {'(scoped) ' if scoped else ''}{selector}"
+        if self._samples.get(key, 0) >= self.max_samples:
+            self._use(key, route, selector, method_name, scoped)
+            return
+
+        self._busy = True
+        counting = self.round_trips is not None and self.round_trips.active
+        if counting:
+            self.round_trips.active = False
+        try:
+            baseline, _ = self._fastest(page.locator(":root"))
+            resolve = owner.locator
+            elapsed, matches = self._fastest(resolve(selector))
+            branches = None
+            alternatives = self.split_alternatives(selector)
+            if len(alternatives) > 1 and key not in self._branches_seen and matches:
+                self._branches_seen.add(key)
+                branches = {alternative: resolve(alternative).count() for alternative in alternatives}
+        except Exception:
+            # Page closed or navigating: nothing to measure
+            return
+        finally:
+            self._busy = False
+            if counting:
+                self.round_trips.active = True
+
+        if not matches and method_name in self.CHANGES_PAGE:
+            # Not rendered yet; the action's auto-wait would resolve it later
+            self._use(key, route, selector, method_name, scoped)
+            return
+
+        self._samples[key] = self._samples.get(key, 0) + 1
+        entry = self._use(key, route, selector, method_name, scoped)
+        entry["cost_ms"].append(round(max(0.0, elapsed - baseline), 3))
+        entry["matches"].append(matches)
+        if branches is not None:
+            entry["branches"] = branches
+
+    def _use(self, key: str, route: str, selector: str, method_name: str, scoped: bool) -> dict:
+        """Count a use of a selector."""
+        entry = self.results.get(key)
+        if entry is None:
+            entry = self.results[key] = {
+                "route": route, "selector": selector, "scoped": scoped, "uses": 0, "methods": [],
+                "sites": [], "cost_ms": [], "matches": [], "branches": None
+            }
+        entry["uses"] += 1
+        if method_name not in entry["methods"]:
+            entry["methods"].append(method_name)
+        site = self._call_site()
+        if site and site not in entry["sites"]:
+            entry["sites"].append(site)
+        return entry
+
+    def take_results(self) -> list:
+        """Get and clear the selector records since the last call."""
+        results, self.results = list(self.results.values()), {}
+        return results
+
+    @staticmethod
+    def merge(results: list) -> dict:
+        """Merge selector records of several tests by route and selector.
+
+        Args:
+            results (list): Records from ``take_results``
+
+        Returns:
+            dict: "route selector" key mapped to the merged record
+        """
+        merged = {}
+        for entry in results:
+            key = f"{entry['route']} {'(scoped) ' if entry['scoped'] else ''}{entry['selector']}"
+            total = merged.get(key)
+            if total is None:
+                merged[key] = {**entry, "methods": list(entry["methods"]), "sites": list(entry["sites"]),
+                               "cost_ms": list(entry["cost_ms"]), "matches": list(entry["matches"]),
+                               "branches": dict(entry["branches"]) if entry["branches"] else None}
+                continue
+            total["uses"] += entry["uses"]
+            total["cost_ms"].extend(entry["cost_ms"])
+            total["matches"].extend(entry["matches"])
+            total["methods"].extend(name for name in entry["methods"] if name not in total["methods"])
+            total["sites"].extend(site for site in entry["sites"] if site not in total["sites"])
+            if entry["branches"]:
+                branches = total["branches"] or {}
+                for alternative, count in entry["branches"].items():
+                    branches[alternative] = max(branches.get(alternative, 0), count)
+                total["branches"] = branches
+        return merged
+
+    def suggestion(self, entry: dict) -> str:
+        """Suggest how to make a selector cheaper or unambiguous (empty when it is fine)."""
+        selector = entry["selector"]
+        features = [name for pattern, name in self.EXPENSIVE_PATTERNS.items() if pattern in selector]
+        has_testid = "data-testid" in selector
+        dead = [alternative for alternative, count in (entry.get("branches") or {}).items() if count == 0]
+        live = [alternative for alternative, count in (entry.get("branches") or {}).items() if count > 0]
+        action = any(name in self.ACTIONS for name in entry["methods"])
+
+        notes = []
+        if has_testid and dead and any("data-testid" in alternative for alternative in dead):
+            notes.append("the data-testid alternative never matches: add it to the markup and drop the fallbacks")
+        elif not has_testid and (features or entry["avg_cost_ms"] >= self.slow_ms):
+            notes.append("replace with a data-testid lookup")
+        if dead and len(live) == 1:
+            notes.append(f"only '{live[0]}' matches; {len(dead)} alternative(s) never do")
+        elif dead and live:
+            notes.append(f"{len(dead)} alternative(s) never match")
+        if action and entry["max_matches"] > 1:
+            notes.append(f"matches {entry['max_matches']} elements for {'/'.join(entry['methods'])}")
+        if features:
+            notes.append(f"uses {', '.join(features)}")
+        return "; ".join(notes)
+
+    def rank(self, merged: dict) -> list:
+        """Rank selectors by total cost, then ambiguity.
+
+        Args:
+            merged (dict): Output of ``merge``
+
+        Returns:
+            list: Records with avg_cost_ms, total_cost_ms, max_matches and suggestion, most expensive first
+        """
+        ranked = []
+        for entry in merged.values():
+            costs = entry["cost_ms"]
+            average = sum(costs) / len(costs) if costs else 0.0
+            ranked.append({
+                **entry,
+                "avg_cost_ms": round(average, 3),
+                "total_cost_ms": round(average * entry["uses"], 3),
+                "max_matches": max(entry["matches"]) if entry["matches"] else 0
+            })
+        for entry in ranked:
+            entry["suggestion"] = self.suggestion(entry)
+        return sorted(ranked, key=lambda entry: (entry["total_cost_ms"], entry["max_matches"]), reverse=True)
+
+    @staticmethod
+    def save_report(ranked: list, reports_dir: str = "reports") -> str:
+        """Save the ranked selectors as JSON.
+
+        Args:
+            ranked (list): Output of ``rank``
+            reports_dir (str): Directory for the report
+
+        Returns:
+            str: Path of the saved report
+        """
+        os.makedirs(reports_dir, exist_ok=True)
+        path = os.path.join(reports_dir, "selector_profile.json")
+        with open(path, "w") as report_file:
+            json.dump({"generated": datetime.now().isoformat(), "selectors": ranked}, report_file, indent=2)
+        return path
@@ -0,0 +1,180 @@
+import os
+import re
+from dataclasses import dataclass, field, asdict
+from urllib.parse import urlparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@dataclass(frozen=True)
+class Credentials:
+    """Login credentials of one account"""
+    email: str
+    password: str
+
+    def as_dict(self) -> dict:
+        """Credentials in the dictionary form used by the test fixtures."""
+        return {"email": self.email, "password": self.password}
+
+@dataclass(frozen=True)
+class Settings:
+    """Typed test configuration loaded once per process.
+
+    Values come from the environment with the project's ``.env`` file taking
+    precedence (as ``load_dotenv(override=True)`` did). xdist workers receive
+    the controller's settings instead of parsing ``.env`` again.
+
+    Besides each role's primary account, extra accounts for the account pool
+    are read from numbered variables, e.g. ``LANDLORD_USER_EMAIL_2`` and
+    ``LANDLORD_USER_PASSWORD_2``, and from the role's further prefixes
+    (TenantB is a second tenant account). The API collection routes used for
+    seeding test data come from ``PROPERTY_API_PATH`` and ``TENANT_API_PATH``.
+    """
+
+    # Role name -> environment variable prefixes of its accounts, primary account's first
+    ROLES = {
+        "admin": ("ADMIN",),
+        "landlord": ("LANDLORD",),
+        "tenant": ("TenantA", "TenantB")
+    }
+    # Record kind seeded through the API -> environment variable holding its collection route
+    API_PATHS = {
+        "property": "PROPERTY_API_PATH",
+        "tenant": "TENANT_API_PATH"
+    }
+
+    url: str = None
+    credentials: dict = field(default_factory=dict)
+    accounts: dict = field(default_factory=dict)
+    api_paths: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_env(cls, env_file: str = None) -> "Settings":
+        """Load settings from the environment and the ``.env`` file.
+
+        Args:
+            env_file (str, optional): Path of the .env file (defaults to the project root)
+
+        Returns:
+            Settings: Loaded settings
+        """
+        # Imported here so workers that receive settings never load python-dotenv
+        from dotenv import dotenv_values
+
+        env_file = env_file or os.path.join(PROJECT_ROOT, ".env")
+        values = dict(os.environ)
+        if os.path.exists(env_file):
+            values.update({key: value for key, value in dotenv_values(env_file).items() if value is not None})
+
+        credentials = {}
+        accounts = {}
+        for role, prefixes in cls.ROLES.items():
+            role_accounts = []
+            for prefix in prefixes:
+                email = values.get(f"{prefix}_USER_EMAIL")
+                password = values.get(f"{prefix}_USER_PASSWORD")
+                if email and password:
+                    role_accounts.append(Credentials(email, password))
+                    if prefix == prefixes[0]:
+                        credentials[role] = role_accounts[-1]
+
+                # Numbered extra accounts, in numeric order after the prefix's unnumbered one
+                pattern = re.compile(rf"^{re.escape(prefix)}_USER_EMAIL_(\d+)$")
+                numbers = sorted(int(match.group(1)) for match in map(pattern.match, values) if match)
+                role_accounts.extend(
+                    Credentials(values[f"{prefix}_USER_EMAIL_{number}"], values[f"{prefix}_USER_PASSWORD_{number}"])
+                    for number in numbers if values.get(f"{prefix}_USER_PASSWORD_{number}")
+                )
+            if role_accounts:
+                accounts[role] = role_accounts
+
+        api_paths = {
+            kind: "/" + values[name].strip("/") for kind, name in cls.API_PATHS.items() if values.get(name)
+        }
+        return cls(url=(values.get("URL") or "").rstrip("/") or None, credentials=credentials, accounts=accounts,
+                   api_paths=api_paths)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Settings":
+        """Rebuild settings sent by the xdist controller.
+
+        Args:
+            data (dict): Output of ``to_dict``
+
+        Returns:
+            Settings: Settings equal to the controller's
+        """
+        credentials = {role: Credentials(**values) for role, values in data.get("credentials", {}).items()}
+        accounts = {
+            role: [Credentials(**values) for values in role_accounts]
+            for role, role_accounts in data.get("accounts", {}).items()
+        }
+        return cls(url=data.get("url"), credentials=credentials, accounts=accounts,
+                   api_paths=dict(data.get("api_paths", {})))
+
+    def to_dict(self) -> dict:
+        """Serialize settings for the xdist worker input."""
+        return asdict(self)
+
+    def role_credentials(self, role: str):
+        """Get the credentials of a role.
+
+        Args:
+            role (str): Role name (e.g. "landlord", "tenant", "admin")
+
+        Returns:
+            Credentials: Credentials, or None if they are not configured
+        """
+        return self.credentials.get(role)
+
+    def role_accounts(self, role: str) -> list:
+        """Get every configured account of a role, primary account first.
+
+        Args:
+            role (str): Role name
+
+        Returns:
+            list: Credentials of the role's accounts
+        """
+        return list(self.accounts.get(role, []))
+
+    def env_names(self, role: str) -> str:
+        """Names of the environment variables holding a role's primary credentials, for error messages."""
+        prefix = self.ROLES[role][0]
+        return f"{prefix}_USER_EMAIL and {prefix}_USER_PASSWORD"
+
+    def validate(self):
+        """Check the URL and every role's credentials.
+
+        Returns:
+            list: Human readable problems, empty if the configuration is complete
+        """
+        problems = []
+        if not self.url:
+            problems.append("URL is not set")
+        else:
+            parsed = urlparse(self.url)
+            if parsed.scheme not in ("http", "https") or not parsed.netloc:
+                problems.append(f"URL '{self.url}' is not an http(s) URL")
+
+        for role in self.ROLES:
+            if role not in self.credentials:
+                problems.append(f"{self.env_names(role)} are not set")
+        return problems
+
+_settings = None
+
+def get_settings() -> Settings:
+    """Get the settings of this process, loading them on first use."""
+    global _settings
+    if _settings is None:
+        _settings = Settings.from_env()
+    return _settings
+
+def configure_settings(settings: Settings):
+    """Use settings received from elsewhere (e.g. the xdist controller).
+
+    Args:
+        settings (Settings): Settings for this process
+    """
+    global _settings
+    _settings = settings
@@ -0,0 +1,212 @@
+import json
+import os
+import sys
+import threading
+import time
+import pytest
+from playwright.sync_api import Page
+
+class SleepAuditPlugin:
+    """Pytest plugin that measures fixed sleeps in tests.
+
+    While installed, ``time.sleep`` and ``Page.wait_for_timeout`` are wrapped
+    so every call made on the test thread is recorded with its call site and
+    the time it actually slept. Sleeps are attributed to the running test
+    (setup, call and teardown), attached to its teardown report and ranked
+    per test, file and call site at the end of the run. Sleeps of background
+    threads (browser server monitor, account lease polling) are not counted.
+    """
+
+    def __init__(self, config, top_n: int = 10, report_path: str = "reports/sleep_audit.json"):
+        """Initialize the SleepAuditPlugin.
+
+        Args:
+            config: Pytest config object
+            top_n (int): Number of tests, files and call sites listed in the summary
+            report_path (str): Path of the JSON report
+        """
+        self.config = config
+        self.top_n = top_n
+        self.report_path = report_path
+        self.rootdir = str(config.rootpath)
+        self.current = None
+        self._thread = threading.current_thread()
+        self._originals = None
+
+    def install(self):
+        """Wrap ``time.sleep`` and ``Page.wait_for_timeout``."""
+        if self._originals is not None:
+            return
+        original_sleep = time.sleep
+        original_wait = Page.wait_for_timeout
+        audit = self
+
+        def sleep(seconds):
+            start = time.perf_counter()
+            try:
+                return original_sleep(seconds)
+            finally:
+                audit._record("time.sleep", sys._getframe(1), time.perf_counter() - start)
+
+        def wait_for_timeout(page, timeout):
+            start = time.perf_counter()
+            try:
+                return original_wait(page, timeout)
+            finally:
+                audit._record("wait_for_timeout", sys._getframe(1), time.perf_counter() - start)
+
+        wait_for_timeout.__doc__ = original_wait.__doc__
+        time.sleep = sleep
+        Page.wait_for_timeout = wait_for_timeout
+        self._originals = (original_sleep, original_wait)
+
+    def uninstall(self):
+        """Restore the original functions."""
+        if self._originals is None:
+            return
+        time.sleep, Page.wait_for_timeout = self._originals
+        self._originals = None
+
+    def _site(self, frame) -> str:
+        """Format a caller frame as ``path:line (function)`` relative to the root."""
+        path = frame.f_code.co_filename
+        if path.startswith(self.rootdir):
+            path = os.path.relpath(path, self.rootdir)
+        return f"{path}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+    def _record(self, kind: str, frame, seconds: float):
+        """Add a sleep to the running test's records."""
+        if self.current is None or threading.current_thread() is not self._thread:
+            return
+        key = (kind, self._site(frame))
+        calls, total = self.current.get(key, (0, 0.0))
+        self.current[key] = (calls + 1, total + seconds)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Collect the sleeps of one test, including its fixtures"""
+        self.current = {}
+        try:
+            yield
+        finally:
+            self.current = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        """Attach the test's sleeps to its teardown report"""
+        yield
+        if self.current:
+            item.user_properties.append(("sleep_audit", [
+                {"kind": kind, "site": site, "calls": calls, "seconds": round(seconds, 4)}
+                for (kind, site), (calls, seconds) in self.current.items()
+            ]))
+        # A rerun of the test starts counting again
+        self.current = {}
+
+    def pytest_unconfigure(self, config):
+        """Restore the wrapped functions"""
+        self.uninstall()
+
+    @staticmethod
+    def build_report(stats: dict) -> dict:
+        """Rank sleep time per test, file and call site.
+
+        Works on the controller under xdist since the records travel in the
+        reports' user properties.
+
+        Args:
+            stats (dict): Terminal reporter stats
+
+        Returns:
+            dict: Totals and ranked tests, files and call sites
+        """
+        durations = {}
+        sleeps = {}
+        sites = {}
+        for reports in stats.values():
+            for report in reports:
+                nodeid = getattr(report, "nodeid", None)
+                if not nodeid or getattr(report, "when", None) is None:
+                    continue
+                durations[nodeid] = durations.get(nodeid, 0.0) + report.duration
+                for key, value in getattr(report, "user_properties", []):
+                    if key != "sleep_audit":
+                        continue
+                    for entry in value:
+                        sleeps[nodeid] = sleeps.get(nodeid, 0.0) + entry["seconds"]
+                        site = sites.setdefault(
+                            (entry["kind"], entry["site"]), {"calls": 0, "seconds": 0.0, "tests": set()}
+                        )
+                        site["calls"] += entry["calls"]
+                        site["seconds"] += entry["seconds"]
+                        site["tests"].add(nodeid)
+
+        def share(slept, total):
+            return round(slept / total * 100, 1) if total else 0.0
+
+        files = {}
+        for nodeid, duration in durations.items():
+            path = nodeid.split("::", 1)[0]
+            file_entry = files.setdefault(path, {"seconds": 0.0, "duration": 0.0})
+            file_entry["seconds"] += sleeps.get(nodeid, 0.0)
+            file_entry["duration"] += duration
+
+        total_sleep = sum(sleeps.values())
+        total_duration = sum(durations.values())
+        return {
+            "total_sleep_seconds": round(total_sleep, 3),
+            "total_test_seconds": round(total_duration, 3),
+            "sleep_share_percent": share(total_sleep, total_duration),
+            "tests": [
+                {"test_id": nodeid, "seconds": round(slept, 3), "duration": round(durations[nodeid], 3),
+                 "share_percent": share(slept, durations[nodeid])}
+                for nodeid, slept in sorted(sleeps.items(), key=lambda item: -item[1])
+            ],
+            "files": [
+                {"file": path, "seconds": round(entry["seconds"], 3), "duration": round(entry["duration"], 3),
+                 "share_percent": share(entry["seconds"], entry["duration"])}
+                for path, entry in sorted(files.items(), key=lambda item: -item[1]["seconds"])
+                if entry["seconds"]
+            ],
+            "call_sites": [
+                {"kind": kind, "site": site, "calls": entry["calls"], "seconds": round(entry["seconds"], 3),
+                 "tests": len(entry["tests"])}
+                for (kind, site), entry in sorted(sites.items(), key=lambda item: -item[1]["seconds"])
+            ]
+        }
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Write the sleep audit report and list the worst offenders"""
+        # Only the controller writes the report when running under xdist
+        if hasattr(self.config, "workerinput"):
+            return
+
+        report = self.build_report(terminalreporter.stats)
+        os.makedirs(os.path.dirname(self.report_path), exist_ok=True)
+        with open(self.report_path, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+        terminalreporter.section("Sleep audit")
+        terminalreporter.write_line(
+            f"😴 {report['total_sleep_seconds']:.1f}s of {report['total_test_seconds']:.1f}s test time "
+            f"spent in fixed sleeps ({report['sleep_share_percent']}%)"
+        )
+        if report["files"]:
+            terminalreporter.write_line("Files:")
+            for entry in report["files"][:self.top_n]:
+                terminalreporter.write_line(
+                    f"    {entry['seconds']:>8.1f}s {entry['share_percent']:>5.1f}%  {entry['file']}"
+                )
+        if report["tests"]:
+            terminalreporter.write_line("Tests:")
+            for entry in report["tests"][:self.top_n]:
+                terminalreporter.write_line(
+                    f"    {entry['seconds']:>8.1f}s {entry['share_percent']:>5.1f}%  {entry['test_id']}"
+                )
+        if report["call_sites"]:
+            terminalreporter.write_line("Call sites:")
+            for entry in report["call_sites"][:self.top_n]:
+                terminalreporter.write_line(
+                    f"    {entry['seconds']:>8.1f}s {entry['calls']:>5}x  {entry['kind']:<16} {entry['site']}"
+                )
+        terminalreporter.write_line(f"📄 Sleep audit report: {self.report_path}")
@@ -0,0 +1,154 @@
+import time
+import pytest
+
+# Named test selections. A suite is a set of test files, optionally narrowed
+# to tests whose node id contains a keyword (e.g. a route parameter).
+SUITES = {
+    "public": {"paths": ["tests/test_before_login.py"], "keyword": None},
+    "admin": {"paths": ["tests/test_admin_login.py"], "keyword": None},
+    "landlord": {"paths": ["tests/test_landlord_login.py"], "keyword": None},
+    "tenant": {"paths": ["tests/test_tenant_login.py"], "keyword": None},
+    # Landlord's view of properties and tenants. The runners used to point at
+    # test_property_functionality.py, test_landlord_property.py and
+    # test_tenant_functionality.py, which now live in old/ and need the
+    # fixtures of tests/conftest.py, so these suites select the landlord
+    # tests of those routes instead.
+    "property": {"paths": ["tests/test_landlord_login.py", "tests/test_landlord_data.py"], "keyword": "property"},
+    "tenants": {"paths": ["tests/test_landlord_login.py", "tests/test_landlord_data.py"], "keyword": "tenants"},
+    # Skipped unless --leak-soak is given
+    "soak": {"paths": ["tests/test_leak_soak.py"], "keyword": None}
+}
+
+class SuiteSummaryPlugin:
+    """Pytest plugin that summarizes one session's results per named suite"""
+
+    def __init__(self, suites: dict):
+        """Initialize the SuiteSummaryPlugin.
+
+        Args:
+            suites (dict): Suite name mapped to its selection
+        """
+        self.suites = suites
+        self.results = {}
+        self.start_time = time.perf_counter()
+
+    def suites_for(self, nodeid: str):
+        """Get the names of the suites a test belongs to.
+
+        Args:
+            nodeid (str): Pytest node id
+
+        Returns:
+            list: Suite names
+        """
+        path = nodeid.split("::")[0]
+        return [
+            name for name, suite in self.suites.items()
+            if path in suite["paths"] and (not suite["keyword"] or suite["keyword"] in nodeid.lower())
+        ]
+
+    def pytest_runtest_logreport(self, report):
+        """Record the outcome of each test (reports arrive here from xdist workers too)"""
+        if report.when == "call" or (report.when == "setup" and not report.passed):
+            outcome = "failed" if report.failed else "skipped" if report.skipped else "passed"
+            if hasattr(report, "wasxfail"):
+                outcome = "xfailed" if report.skipped else "xpassed"
+            self.results[report.nodeid] = (outcome, report.duration)
+        elif report.when == "teardown" and report.failed:
+            outcome, duration = self.results.get(report.nodeid, ("passed", 0.0))
+            self.results[report.nodeid] = ("failed", duration + report.duration)
+
+    def summaries(self) -> dict:
+        """Build the per-suite summary.
+
+        Returns:
+            dict: Suite name mapped to outcome counts and total duration
+        """
+        summaries = {name: {"passed": 0, "failed": 0, "skipped": 0, "xfailed": 0, "xpassed": 0, "duration": 0.0}
+                     for name in self.suites}
+        for nodeid, (outcome, duration) in self.results.items():
+            for name in self.suites_for(nodeid):
+                summaries[name][outcome] += 1
+                summaries[name]["duration"] += duration
+        return summaries
+
+    def print_summary(self):
+        """Print the per-suite summary"""
+        print("\n" + "=" * 50)
+        print("📋 Suite summary")
+        print("-" * 50)
+        for name, summary in self.summaries().items():
+            icon = "❌" if summary["failed"] else "✅"
+            extra = "".join(
+                f", {summary[key]} {key}" for key in ("xfailed", "xpassed") if summary[key]
+            )
+            print(f"{icon} {name}: {summary['passed']} passed, {summary['failed']} failed, "
+                  f"{summary['skipped']} skipped{extra} ({summary['duration']:.1f}s)")
+        print("-" * 50)
+        print(f"⏱️  Total wall time: {time.perf_counter() - self.start_time:.1f}s")
+
+def build_pytest_args(suite_names: list, workers=None, headed: bool = False, slow_mo: int = None,
+                      verbose: bool = False, extra_args: list = None):
+    """Build the arguments of a single pytest session covering several suites.
+
+    Args:
+        suite_names (list): Names of the suites to run
+        workers (int or str, optional): Number of xdist workers (or "auto")
+        headed (bool): Run browsers in headed mode
+        slow_mo (int, optional): Slow down Playwright operations (milliseconds)
+        verbose (bool): Verbose pytest output
+        extra_args (list, optional): Additional pytest arguments
+
+    Returns:
+        list: Arguments for ``pytest.main``
+    """
+    unknown = [name for name in suite_names if name not in SUITES]
+    if unknown:
+        raise ValueError(f"Unknown suite(s): {', '.join(unknown)}. Available: {', '.join(SUITES)}")
+
+    paths = []
+    expressions = []
+    for name in suite_names:
+        suite = SUITES[name]
+        for path in suite["paths"]:
+            if path not in paths:
+                paths.append(path)
+        # -k also matches module names, which keeps each keyword scoped to its suite's files
+        modules = " or ".join(path.rsplit("/", 1)[-1][:-3] for path in suite["paths"])
+        expressions.append(f"(({modules}) and {suite['keyword']})" if suite["keyword"] else f"({modules})")
+
+    args = list(paths)
+    args.extend(["-k", " or ".join(expressions)])
+    if workers:
+        args.extend(["-n", str(workers)])
+    if headed:
+        args.append("--headed")
+    if slow_mo:
+        args.extend(["--slowmo", str(slow_mo)])
+    if verbose:
+        args.append("-v")
+    if extra_args:
+        args.extend(extra_args)
+    return args
+
+def run_suites(suite_names: list = None, **options) -> int:
+    """Run suites in one in-process pytest session and print per-suite summaries.
+
+    Args:
+        suite_names (list, optional): Names of the suites to run (default: all)
+        **options: Keyword arguments for ``build_pytest_args``
+
+    Returns:
+        int: Pytest exit code
+    """
+    suite_names = suite_names or list(SUITES)
+    args = build_pytest_args(suite_names, **options)
+    plugin = SuiteSummaryPlugin({name: SUITES[name] for name in suite_names})
+
+    print(f"🚀 Running suites: {', '.join(suite_names)}")
+    print(f"Command: pytest {' '.join(args)}")
+    print("=" * 50)
+
+    exit_code = pytest.main(args, plugins=[plugin])
+    plugin.print_summary()
+    return int(exit_code)
@@ -0,0 +1,252 @@
+import functools
+import glob
+import importlib
+import json
+import os
+import shutil
+import threading
+import time
+import pytest
+
+class TimelinePlugin:
+    """Pytest plugin that records a step-level timeline in Chrome trace-event format.
+
+    Every test is broken into spans: the setup, call and teardown phases,
+    each fixture setup, and every page object and helper method (login,
+    navigate, verify, waits, screenshots), which are wrapped at class level
+    so they emit spans automatically. Each process writes its events as
+    JSON at session end and the controller merges them into one file that
+    opens in Perfetto or ``chrome://tracing``, with one row per xdist worker.
+    """
+
+    # Classes whose methods emit spans; public methods plus EXTRA_METHODS are wrapped
+    TARGETS = (
+        "pom.admin_page.AdminPage",
+        "pom.landlord_page.LandlordPage",
+        "pom.tenant_page.TenantPage",
+        "helpers.page_load.PageLoadHelper",
+        "helpers.screenshot.ScreenshotHelper"
+    )
+    EXTRA_METHODS = ("_verify_page_content",)
+
+    def __init__(self, config, reports_dir: str = "reports"):
+        """Initialize the TimelinePlugin.
+
+        Args:
+            config: Pytest config object carrying the shared ``llhub_run_id``
+            reports_dir (str): Directory of the merged ``timeline.json``
+        """
+        self.config = config
+        self.reports_dir = reports_dir
+        self.parts_dir = os.path.join(reports_dir, "timeline", config.llhub_run_id)
+        workerinput = getattr(config, "workerinput", None)
+        self.worker = workerinput["workerid"] if workerinput else "main"
+        self.pid = os.getpid()
+        self.events = []
+        self.current_test = None
+        self.summary = None
+        self._originals = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def category(name: str) -> str:
+        """Classify a method or class name into a span category."""
+        name = name.lower()
+        for keyword, category in (("login", "login"), ("navigate", "navigate"), ("screenshot", "screenshot"),
+                                  ("verify", "verify"), ("wait", "wait")):
+            if keyword in name:
+                return category
+        return "action"
+
+    def install(self):
+        """Wrap the page object and helper methods."""
+        for class_path in self.TARGETS:
+            module_name, class_name = class_path.rsplit(".", 1)
+            target_class = getattr(importlib.import_module(module_name), class_name)
+            for method_name, method in list(vars(target_class).items()):
+                if not callable(method) or isinstance(method, (staticmethod, classmethod)):
+                    continue
+                if method_name.startswith("_") and method_name not in self.EXTRA_METHODS:
+                    continue
+                if getattr(method, "__llhub_timeline__", False):
+                    continue
+                setattr(target_class, method_name, self._wrap(method, f"{class_name}.{method_name}"))
+                self._originals.append((target_class, method_name, method))
+
+    def uninstall(self):
+        """Restore the original methods."""
+        for target_class, method_name, original in reversed(self._originals):
+            setattr(target_class, method_name, original)
+        self._originals = []
+
+    def _wrap(self, method, name: str):
+        """Record every call of a method as a span."""
+        timeline = self
+        category = "screenshot" if name.startswith("ScreenshotHelper.") else self.category(name.split(".")[1])
+
+        @functools.wraps(method)
+        def wrapper(obj, *args, **kwargs):
+            span_args = {"arg": repr(args[0])[:120]} if args else {}
+            with timeline.span(name, category, span_args):
+                return method(obj, *args, **kwargs)
+
+        wrapper.__llhub_timeline__ = True
+        return wrapper
+
+    def _add(self, event: dict):
+        """Append an event tagged with this process and the calling thread."""
+        event.update(pid=self.pid, tid=threading.get_native_id())
+        with self._lock:
+            self.events.append(event)
+
+    def span(self, name: str, category: str, args: dict = None):
+        """Context manager recording a complete ("X") event.
+
+        Args:
+            name (str): Span name
+            category (str): Span category (e.g. "navigate", "fixture")
+            args (dict, optional): Extra values shown for the span
+        """
+        return _Span(self, name, category, args)
+
+    def pytest_sessionstart(self, session):
+        """Name this process's row after its worker"""
+        self._add({"name": "process_name", "ph": "M", "args": {"name": self.worker}})
+        self._add({"name": "process_sort_index", "ph": "M",
+                   "args": {"sort_index": int(self.worker[2:]) if self.worker.startswith("gw") else -1}})
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Span the whole test"""
+        self.current_test = item.nodeid
+        with self.span(item.nodeid, "test"):
+            yield
+        self.current_test = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        """Span fixture setup"""
+        with self.span("setup", "setup"):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        """Span the test body"""
+        with self.span("call", "call"):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        """Span fixture teardown"""
+        with self.span("teardown", "teardown"):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        """Span each fixture's setup"""
+        with self.span(f"fixture:{fixturedef.argname}", "fixture", {"scope": fixturedef.scope}):
+            yield
+
+    @staticmethod
+    def worker_utilization(events: list) -> dict:
+        """Compute busy and idle time per worker from the test spans.
+
+        Args:
+            events (list): Trace events of all processes
+
+        Returns:
+            dict: Worker name mapped to tests, busy_s, idle_s and span_s
+        """
+        names = {event["pid"]: event["args"]["name"] for event in events if event.get("name") == "process_name"}
+        starts = [event["ts"] for event in events if event.get("ph") == "X"]
+        ends = [event["ts"] + event["dur"] for event in events if event.get("ph") == "X"]
+        if not starts:
+            return {}
+        run_start, run_end = min(starts), max(ends)
+
+        utilization = {}
+        for event in events:
+            if event.get("ph") != "X" or event.get("cat") != "test":
+                continue
+            worker = utilization.setdefault(names.get(event["pid"], str(event["pid"])), {"tests": 0, "busy_us": 0})
+            worker["tests"] += 1
+            worker["busy_us"] += event["dur"]
+        return {
+            name: {
+                "tests": worker["tests"],
+                "busy_s": round(worker["busy_us"] / 1e6, 3),
+                "idle_s": round((run_end - run_start - worker["busy_us"]) / 1e6, 3),
+                "span_s": round((run_end - run_start) / 1e6, 3)
+            }
+            for name, worker in sorted(utilization.items())
+        }
+
+    def pytest_sessionfinish(self, session):
+        """Write this process's events; the controller merges all of them"""
+        os.makedirs(self.parts_dir, exist_ok=True)
+        # An xdist controller runs no tests, so it gets no row of its own
+        if any(event["ph"] == "X" for event in self.events):
+            with open(os.path.join(self.parts_dir, f"{self.worker}.json"), "w") as part_file:
+                json.dump(self.events, part_file, separators=(",", ":"))
+
+        # Workers are done writing before the controller finishes its session
+        if hasattr(self.config, "workerinput"):
+            return
+        events = []
+        for path in sorted(glob.glob(os.path.join(self.parts_dir, "*.json"))):
+            with open(path) as part_file:
+                events.extend(json.load(part_file))
+        path = os.path.join(self.reports_dir, "timeline.json")
+        with open(path, "w") as timeline_file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, timeline_file, separators=(",", ":"))
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+        try:
+            os.rmdir(os.path.dirname(self.parts_dir))
+        except OSError:
+            pass
+        self.summary = {"path": path, "events": len(events), "workers": self.worker_utilization(events)}
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show busy and idle time per worker"""
+        if not self.summary:
+            return
+        terminalreporter.section("Timeline")
+        for name, worker in self.summary["workers"].items():
+            busy = worker["busy_s"] / worker["span_s"] * 100 if worker["span_s"] else 0.0
+            terminalreporter.write_line(
+                f"{name:<8} {worker['tests']:>4} tests  busy {worker['busy_s']:>8.1f}s ({busy:>5.1f}%)  "
+                f"idle {worker['idle_s']:>8.1f}s"
+            )
+        terminalreporter.write_line(
+            f"🕒 {self.summary['events']} trace events written to {self.summary['path']} "
+            f"(open in https://ui.perfetto.dev or chrome://tracing)"
+        )
+
+    def pytest_unconfigure(self, config):
+        """Restore the wrapped methods"""
+        self.uninstall()
+
+class _Span:
+    """Span context manager of ``TimelinePlugin.span``."""
+
+    def __init__(self, timeline: TimelinePlugin, name: str, category: str, args: dict = None):
+        self.timeline = timeline
+        self.name = name
+        self.category = category
+        self.args = dict(args or {})
+
+    def __enter__(self):
+        self.ts = time.time_ns() // 1000
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.timeline.current_test and self.category != "test":
+            self.args["test"] = self.timeline.current_test
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.timeline._add({
+            "name": self.name, "cat": self.category, "ph": "X", "ts": self.ts,
+            "dur": max(1, int((time.perf_counter() - self.start) * 1e6)), "args": self.args
+        })
+        return False
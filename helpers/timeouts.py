@@ -0,0 +1,150 @@
+import math
+import re
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from .run_history import RunHistory
+
+class TimeoutService:
+    """Adaptive timeouts learned from earlier runs.
+
+    Successful wait durations are recorded per route and action. When the
+    service is applying timeouts, each wait gets ``multiplier`` times the
+    learned percentile of its duration, clamped between a floor and a
+    ceiling. Without enough samples (or when disabled) the caller's default
+    timeout is used unchanged. Durations are kept per emulation profile, so
+    throttled runs neither learn from nor skew unthrottled timings. Waits
+    that return within ``settled_ms`` found their state already reached
+    (e.g. "networkidle" on a repeat visit to a route) and are not learned
+    from, so they cannot pull the timeouts down.
+    """
+
+    def __init__(self, history: RunHistory = None, apply: bool = False, multiplier: float = 3.0,
+                 percentile: float = 95, floor_ms: int = 2000, ceiling_ms: int = 30000,
+                 min_samples: int = 5, window: int = 50, settled_ms: float = 50):
+        """Initialize the TimeoutService.
+
+        Args:
+            history (RunHistory, optional): Store for recorded durations; nothing is recorded without it
+            apply (bool): Whether learned timeouts replace the defaults
+            multiplier (float): Multiple of the learned percentile used as the timeout
+            percentile (float): Percentile of recorded durations to learn (e.g. 95 or 99)
+            floor_ms (int): Smallest timeout ever returned in milliseconds
+            ceiling_ms (int): Largest timeout ever returned in milliseconds
+            min_samples (int): Samples needed before a learned timeout is used
+            window (int): Number of recent samples per route and action to learn from
+            settled_ms (float): Durations below this are already-settled waits and not learned from
+        """
+        self.history = history
+        self.apply = apply
+        self.multiplier = multiplier
+        self.percentile = percentile
+        self.floor_ms = floor_ms
+        self.ceiling_ms = ceiling_ms
+        self.min_samples = min_samples
+        self.window = window
+        self.settled_ms = settled_ms
+        # Name of the active emulation profile ("" when unthrottled)
+        self.profile = ""
+        # Callables notified of every successful wait as (action, route, duration_ms)
+        self.observers = []
+        self._pending = []
+        self._learned = self._learn() if history and apply else {}
+
+    def _learn(self):
+        """Compute the configured percentile for every route and action."""
+        learned = {}
+        for key, durations in self.history.timing_samples(self.window).items():
+            # Histories recorded before already-settled waits were left out
+            durations = [duration for duration in durations if duration >= self.settled_ms]
+            if len(durations) >= self.min_samples:
+                learned[key] = self._percentile(sorted(durations))
+        return learned
+
+    def _percentile(self, durations: list) -> float:
+        """Nearest-rank percentile of sorted durations."""
+        rank = max(1, math.ceil(self.percentile / 100 * len(durations)))
+        return durations[rank - 1]
+
+    @staticmethod
+    def route_of(url: str) -> str:
+        """Normalize a URL or path to a route key.
+
+        Args:
+            url (str): Full URL or path
+
+        Returns:
+            str: Path with numeric ids replaced by ``:id``
+        """
+        path = urlparse(url).path or "/"
+        return re.sub(r"/\d+(?=/|$)", "/:id", path.rstrip("/") or "/")
+
+    def timeout(self, action: str, route: str = None, default: int = 30000) -> int:
+        """Get the timeout for a wait.
+
+        Args:
+            action (str): Name of the wait (e.g. "networkidle", "login_redirect")
+            route (str, optional): Route or URL the wait runs on
+            default (int): Timeout in milliseconds used without learned data
+
+        Returns:
+            int: Timeout in milliseconds
+        """
+        if not self.apply:
+            return default
+        learned = self._learned.get((self.route_of(route or "/"), action, self.profile))
+        if learned is None:
+            return default
+        return int(min(self.ceiling_ms, max(self.floor_ms, learned * self.multiplier)))
+
+    def record(self, action: str, route: str, duration_ms: float):
+        """Record the duration of a successful wait.
+
+        Observers see every wait; the history only gets waits that did not
+        return already settled.
+
+        Args:
+            action (str): Name of the wait
+            route (str): Route or URL the wait ran on
+            duration_ms (float): Duration in milliseconds
+        """
+        for observer in self.observers:
+            observer(action, route, duration_ms)
+        if self.history is not None and duration_ms >= self.settled_ms:
+            self._pending.append((self.route_of(route or "/"), action, duration_ms, self.profile))
+
+    @contextmanager
+    def measure(self, action: str, route: str = None):
+        """Record how long the wrapped wait took if it succeeds.
+
+        Timed out waits are not recorded so failures do not inflate the
+        learned durations.
+
+        Args:
+            action (str): Name of the wait
+            route (str, optional): Route or URL the wait runs on
+        """
+        start = time.perf_counter()
+        yield
+        self.record(action, route, (time.perf_counter() - start) * 1000)
+
+    def flush(self):
+        """Write recorded durations to the run history."""
+        if self.history is not None and self._pending:
+            self.history.record_timings(self._pending)
+            self._pending = []
+
+_timeout_service = TimeoutService()
+
+def get_timeout_service() -> TimeoutService:
+    """Get the timeout service used by page objects and helpers."""
+    return _timeout_service
+
+def set_timeout_service(service: TimeoutService):
+    """Replace the timeout service used by page objects and helpers.
+
+    Args:
+        service (TimeoutService): Configured service for this process
+    """
+    global _timeout_service
+    _timeout_service = service
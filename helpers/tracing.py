@@ -0,0 +1,201 @@
+from playwright.sync_api import BrowserContext
+from collections import deque
+from datetime import datetime
+import functools
+import importlib
+import os
+import re
+import shutil
+import tempfile
+
+class TraceBuffer:
+    """Helper class for failure-only Playwright tracing.
+
+    Tracing runs in chunked mode for the whole test. A new chunk starts after
+    setup, at every page object step (each public page object method, e.g.
+    a navigation, the login or a search; steps called by other steps do not
+    split further) and before teardown. Finished chunks are kept in a small
+    rolling buffer on tmpfs (``/dev/shm`` when available), so only the last
+    steps before a failure are kept, and only copied to ``reports/traces``
+    when the test fails.
+    """
+
+    # Page object classes whose public methods are steps
+    TARGETS = ("pom.admin_page.AdminPage", "pom.landlord_page.LandlordPage", "pom.tenant_page.TenantPage")
+    # Buffer of the running test, checkpointed by the wrapped page object methods
+    active = None
+    _originals = []
+    _depth = 0
+
+    def __init__(self, context: BrowserContext, test_name: str, max_chunks: int = 3,
+                 screenshots: bool = True, snapshots: bool = True, sources: bool = False):
+        """Initialize the TraceBuffer.
+
+        Args:
+            context (BrowserContext): Playwright browser context to trace
+            test_name (str): Name of the test for trace file naming
+            max_chunks (int): Number of finished chunks to keep in the buffer
+            screenshots (bool): Whether to capture screenshots in the trace
+            snapshots (bool): Whether to capture DOM snapshots in the trace
+            sources (bool): Whether to include test sources in the trace
+        """
+        self.context = context
+        self.test_name = self._sanitize_filename(test_name)
+        self.max_chunks = max(1, max_chunks)
+        self.screenshots = screenshots
+        self.snapshots = snapshots
+        self.sources = sources
+        self.trace_dir = "reports/traces"
+        self.buffer_dir = tempfile.mkdtemp(prefix="llhub-trace-", dir=self._buffer_root())
+        self.chunks = deque()
+        self._persisted = set()
+        self._chunk_index = 0
+        self._chunk_open = False
+        self._started = False
+
+    @classmethod
+    def install(cls):
+        """Wrap the page object methods so each step starts a chunk of the active buffer."""
+        if cls._originals:
+            return
+        for class_path in cls.TARGETS:
+            module_name, class_name = class_path.rsplit(".", 1)
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            for method_name, method in list(vars(page_class).items()):
+                if method_name.startswith("_") or not callable(method):
+                    continue
+                setattr(page_class, method_name, cls._wrap(method, method_name))
+                cls._originals.append((page_class, method_name, method))
+
+    @classmethod
+    def uninstall(cls):
+        """Restore the original page object methods."""
+        for owner, name, original in reversed(cls._originals):
+            setattr(owner, name, original)
+        cls._originals = []
+
+    @classmethod
+    def _wrap(cls, method, method_name: str):
+        """Checkpoint the active buffer before an outermost page object step."""
+
+        @functools.wraps(method)
+        def wrapper(page_object, *args, **kwargs):
+            if cls.active is not None and cls._depth == 0:
+                cls.active.checkpoint(method_name)
+            cls._depth += 1
+            try:
+                return method(page_object, *args, **kwargs)
+            finally:
+                cls._depth -= 1
+
+        return wrapper
+
+    def _sanitize_filename(self, filename: str) -> str:
+        """Sanitize filename to be safe for all operating systems.
+
+        Args:
+            filename (str): Original filename
+
+        Returns:
+            str: Sanitized filename
+        """
+        # Remove invalid characters
+        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        # Remove square brackets and their contents
+        filename = re.sub(r'\[.*?\]', '', filename)
+        # Replace multiple underscores with a single one
+        filename = re.sub(r'_+', '_', filename)
+        # Remove leading/trailing underscores
+        filename = filename.strip('_')
+        return filename
+
+    def _buffer_root(self) -> str:
+        """Pick a memory-backed directory for buffered chunks if one exists."""
+        if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+            return "/dev/shm"
+        return tempfile.gettempdir()
+
+    def start(self):
+        """Start tracing and open the first chunk."""
+        self.context.tracing.start(
+            screenshots=self.screenshots,
+            snapshots=self.snapshots,
+            sources=self.sources
+        )
+        self._started = True
+        self._start_chunk(self.test_name)
+
+    def _start_chunk(self, title: str):
+        """Open a new trace chunk.
+
+        Args:
+            title (str): Title shown for the chunk in the trace viewer
+        """
+        self.context.tracing.start_chunk(title=title)
+        self._chunk_open = True
+
+    def _stop_chunk_to_buffer(self):
+        """Close the current chunk into the buffer, evicting the oldest chunk if full."""
+        if not self._chunk_open:
+            return
+        self._chunk_index += 1
+        chunk_path = os.path.join(self.buffer_dir, f"chunk_{self._chunk_index:03d}.zip")
+        self.context.tracing.stop_chunk(path=chunk_path)
+        self._chunk_open = False
+        self.chunks.append(chunk_path)
+
+        while len(self.chunks) > self.max_chunks:
+            oldest = self.chunks.popleft()
+            if os.path.exists(oldest):
+                os.remove(oldest)
+
+    def checkpoint(self, title: str):
+        """Roll over to a new chunk, keeping the finished one in the buffer.
+
+        Args:
+            title (str): Title for the new chunk
+        """
+        if not self._started:
+            return
+        self._stop_chunk_to_buffer()
+        self._start_chunk(f"{self.test_name} - {title}")
+
+    def persist(self):
+        """Copy the buffered chunks not persisted yet to the reports directory.
+
+        Returns:
+            list: Paths of the persisted trace zips, oldest first
+        """
+        if not self._started:
+            return []
+        self._stop_chunk_to_buffer()
+
+        if not os.path.exists(self.trace_dir):
+            os.makedirs(self.trace_dir)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        persisted = []
+        for chunk_path in self.chunks:
+            if chunk_path in self._persisted:
+                continue
+            self._persisted.add(chunk_path)
+            part = int(os.path.basename(chunk_path)[len("chunk_"):-len(".zip")])
+            filename = f"{self.test_name}_{timestamp}_part{part}.zip"
+            trace_path = os.path.join(self.trace_dir, filename)
+            shutil.copyfile(chunk_path, trace_path)
+            persisted.append(trace_path)
+        return persisted
+
+    def close(self):
+        """Discard any open chunk, stop tracing and remove the buffer directory."""
+        try:
+            if self._chunk_open:
+                # Stopping without a path discards the chunk
+                self.context.tracing.stop_chunk()
+                self._chunk_open = False
+            if self._started:
+                self.context.tracing.stop()
+                self._started = False
+        finally:
+            shutil.rmtree(self.buffer_dir, ignore_errors=True)
+            self.chunks.clear()
@@ -0,0 +1,289 @@
+import functools
+import importlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from PIL import Image, ImageDraw
+from .timeouts import TimeoutService
+
+# Offsets of the 8 neighbours of a pixel
+_NEIGHBOURS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+def _shifted(padded: np.ndarray, dy: int, dx: int, height: int, width: int) -> np.ndarray:
+    """View of a 1-pixel padded array holding each pixel's neighbour at (dy, dx)."""
+    return padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+def _many_siblings(image: np.ndarray) -> np.ndarray:
+    """Mask of pixels with more than two identical neighbours (the image border counts as one)."""
+    height, width = image.shape[:2]
+    padded = np.pad(image.astype(np.int16), ((1, 1), (1, 1), (0, 0)), constant_values=-1)
+    count = np.zeros((height, width), dtype=np.uint8)
+    count[[0, -1], :] = 1
+    count[:, [0, -1]] = 1
+    for dy, dx in _NEIGHBOURS:
+        count += (_shifted(padded, dy, dx, height, width) == image).all(axis=2)
+    return count > 2
+
+def _antialiased(image: np.ndarray, other: np.ndarray) -> np.ndarray:
+    """Mask of pixels of ``image`` that look like anti-aliasing, as pixelmatch detects it.
+
+    A pixel qualifies when at most two neighbours share its brightness, it has
+    both darker and brighter neighbours, and its darkest or brightest
+    neighbour lies in a flat area (more than two identical neighbours) in both
+    images. Changed text and edges fail the last test because the area around
+    them differs between the images.
+    """
+    height, width = image.shape[:2]
+    brightness = image.astype(np.float32) @ np.array([0.29889531, 0.58662247, 0.11448223], dtype=np.float32)
+    padded = np.pad(brightness, 1, constant_values=np.nan)
+    zeroes = np.zeros((height, width), dtype=np.uint8)
+    darkest = np.zeros((height, width), dtype=np.float32)
+    brightest = np.zeros((height, width), dtype=np.float32)
+    darkest_at = np.zeros((height, width), dtype=np.int8)
+    brightest_at = np.zeros((height, width), dtype=np.int8)
+    for index, (dy, dx) in enumerate(_NEIGHBOURS):
+        delta = _shifted(padded, dy, dx, height, width) - brightness
+        zeroes += delta == 0
+        darker = delta < darkest
+        darkest[darker] = delta[darker]
+        darkest_at[darker] = index
+        brighter = delta > brightest
+        brightest[brighter] = delta[brighter]
+        brightest_at[brighter] = index
+
+    flat = np.pad(_many_siblings(image) & _many_siblings(other), 1)
+    flat_extreme = np.zeros((height, width), dtype=bool)
+    for index, (dy, dx) in enumerate(_NEIGHBOURS):
+        neighbour_flat = _shifted(flat, dy, dx, height, width)
+        flat_extreme |= neighbour_flat & ((darkest_at == index) | (brightest_at == index))
+    return (zeroes <= 2) & (darkest < 0) & (brightest > 0) & flat_extreme
+
+def _tile_ratios(changed: np.ndarray, tile_size: int) -> np.ndarray:
+    """Share of changed pixels in each tile (edge tiles count only their real pixels)."""
+    height, width = changed.shape
+    rows, cols = -(-height // tile_size), -(-width // tile_size)
+    padded = np.zeros((rows * tile_size, cols * tile_size), dtype=bool)
+    padded[:height, :width] = changed
+    counts = padded.reshape(rows, tile_size, cols, tile_size).sum(axis=(1, 3))
+    area = np.zeros_like(padded)
+    area[:height, :width] = True
+    areas = area.reshape(rows, tile_size, cols, tile_size).sum(axis=(1, 3))
+    return counts / areas
+
+def compare_images(baseline_path: str, actual_path: str, diff_path: str, channel_tolerance: int = 16,
+                   tile_size: int = 32, tile_threshold: float = 0.02, antialiasing: bool = True,
+                   keep_actual: bool = False) -> dict:
+    """Compare a screenshot with its baseline.
+
+    Pixels differ when any channel differs by more than the tolerance. With
+    anti-aliasing tolerance, a differing pixel is ignored when it looks like
+    anti-aliasing in either image (see ``_antialiased``), so smoothed edges
+    do not fail while changed glyphs do. The image fails when the share of
+    differing pixels in any tile is over the threshold. The diff image is
+    only written for failures; the actual screenshot is removed when the
+    image passes unless ``keep_actual`` is set. Runs in a worker process.
+
+    Args:
+        baseline_path (str): Baseline PNG
+        actual_path (str): New screenshot PNG
+        diff_path (str): Where to write the diff image of a failure
+        channel_tolerance (int): Largest channel difference (0-255) treated as equal
+        tile_size (int): Tile edge in pixels
+        tile_threshold (float): Share of differing pixels above which a tile fails
+        antialiasing (bool): Ignore differences explained by anti-aliasing
+        keep_actual (bool): Keep the actual screenshot of passing images
+
+    Returns:
+        dict: passed, reason, changed_pixels, failed_tiles, tiles, max_tile_ratio and file paths
+    """
+    baseline = np.asarray(Image.open(baseline_path).convert("RGB"))
+    actual = np.asarray(Image.open(actual_path).convert("RGB"))
+    result = {"baseline": baseline_path, "actual": actual_path, "diff": None, "reason": ""}
+
+    size_changed = baseline.shape != actual.shape
+    if size_changed:
+        # Compare on the larger canvas; the area only one image covers counts as changed
+        height = max(baseline.shape[0], actual.shape[0])
+        width = max(baseline.shape[1], actual.shape[1])
+        outside = np.ones((height, width), dtype=bool)
+        outside[:min(baseline.shape[0], actual.shape[0]), :min(baseline.shape[1], actual.shape[1])] = False
+        baseline = np.pad(baseline, ((0, height - baseline.shape[0]), (0, width - baseline.shape[1]), (0, 0)))
+        actual = np.pad(actual, ((0, height - actual.shape[0]), (0, width - actual.shape[1]), (0, 0)))
+        result["reason"] = "size changed; "
+
+    changed = np.abs(baseline.astype(np.int16) - actual.astype(np.int16)).max(axis=2) > channel_tolerance
+    if antialiasing and changed.any():
+        changed &= ~(_antialiased(baseline, actual) | _antialiased(actual, baseline))
+    if size_changed:
+        changed |= outside
+
+    ratios = _tile_ratios(changed, tile_size)
+    failed_tiles = np.argwhere(ratios > tile_threshold)
+    result.update(
+        passed=len(failed_tiles) == 0,
+        changed_pixels=int(changed.sum()),
+        failed_tiles=len(failed_tiles),
+        tiles=int(ratios.size),
+        max_tile_ratio=round(float(ratios.max()), 4) if ratios.size else 0.0
+    )
+
+    if result["passed"]:
+        if not keep_actual:
+            os.remove(actual_path)
+            result["actual"] = None
+        return result
+
+    result["reason"] += f"{len(failed_tiles)} of {ratios.size} tiles differ (max {result['max_tile_ratio']:.1%})"
+    # Faded actual screenshot with differing pixels in red and failed tiles outlined
+    faded = (actual.astype(np.uint16) + 2 * 255) // 3
+    faded[changed] = (255, 0, 0)
+    diff_image = Image.fromarray(faded.astype(np.uint8))
+    draw = ImageDraw.Draw(diff_image)
+    for row, col in failed_tiles:
+        draw.rectangle(
+            (col * tile_size, row * tile_size, (col + 1) * tile_size - 1, (row + 1) * tile_size - 1),
+            outline=(255, 0, 255)
+        )
+    os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+    diff_image.save(diff_path)
+    result["diff"] = diff_path
+    return result
+
+class VisualRegression:
+    """Visual baselines for the routes the suite visits.
+
+    Page objects' ``navigate_to_page`` is wrapped at class level so each
+    route is captured right after it loaded. Screenshots are compared with
+    their baseline in a process pool while the test goes on; ``collect``
+    waits for the comparisons of the test. Missing baselines are created
+    from the first screenshot, and all of them are replaced in update mode.
+    Baselines are kept per browser since rendering differs between engines.
+    """
+
+    # Page object class paths whose navigation is captured
+    TARGETS = ("pom.admin_page.AdminPage", "pom.landlord_page.LandlordPage", "pom.tenant_page.TenantPage")
+
+    def __init__(self, baseline_dir: str = "visual_baselines", output_dir: str = "reports/visual",
+                 update: bool = False, workers: int = None, mask_selectors: list = None,
+                 channel_tolerance: int = 16, tile_size: int = 32, tile_threshold: float = 0.02):
+        """Initialize the VisualRegression.
+
+        Args:
+            baseline_dir (str): Directory of the baseline PNGs (kept in version control)
+            output_dir (str): Directory of the actual screenshots and diff images of failures
+            update (bool): Replace baselines with the new screenshots instead of comparing
+            workers (int, optional): Comparison processes (default: up to 4)
+            mask_selectors (list, optional): Selectors of dynamic regions masked in every screenshot
+            channel_tolerance (int): Largest channel difference (0-255) treated as equal
+            tile_size (int): Tile edge in pixels
+            tile_threshold (float): Share of differing pixels above which a tile fails
+        """
+        self.baseline_dir = baseline_dir
+        self.output_dir = output_dir
+        self.update = update
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.mask_selectors = list(mask_selectors or [])
+        self.options = {"channel_tolerance": channel_tolerance, "tile_size": tile_size,
+                        "tile_threshold": tile_threshold}
+        self.pending = []
+        self._pool = None
+        self._counter = 0
+        self._originals = []
+
+    def install(self):
+        """Wrap the page objects' ``navigate_to_page``."""
+        for class_path in self.TARGETS:
+            module_name, class_name = class_path.rsplit(".", 1)
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            original = page_class.__dict__.get("navigate_to_page")
+            if original is None or getattr(original, "__llhub_visual__", False):
+                continue
+            page_class.navigate_to_page = self._wrap(original, class_name.replace("Page", "").lower())
+            self._originals.append((page_class, original))
+
+    def uninstall(self):
+        """Restore the original methods and stop the comparison processes."""
+        for page_class, original in reversed(self._originals):
+            page_class.navigate_to_page = original
+        self._originals = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _wrap(self, method, role: str):
+        """Capture the route after a successful navigation."""
+        visual = self
+
+        @functools.wraps(method)
+        def wrapper(page_object, path, *args, **kwargs):
+            result = method(page_object, path, *args, **kwargs)
+            visual.check(page_object.page, visual.name_for(role, path))
+            return result
+
+        wrapper.__llhub_visual__ = True
+        return wrapper
+
+    @staticmethod
+    def name_for(role: str, path: str) -> str:
+        """Name the baseline of a route (e.g. ``landlord_income_history``)."""
+        route = TimeoutService.route_of(path).replace(":id", "id")
+        return re.sub(r"[^\w]+", "_", f"{role}{route}").strip("_")
+
+    def _executor(self) -> ProcessPoolExecutor:
+        """Get the comparison process pool, starting it on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def check(self, page, name: str, mask_selectors: list = None, full_page: bool = True):
+        """Screenshot the page and queue its comparison with the baseline.
+
+        Args:
+            page: Playwright page
+            name (str): Baseline name
+            mask_selectors (list, optional): Extra selectors of regions to mask
+            full_page (bool): Whether to capture the full scrollable page
+        """
+        browser = page.context.browser.browser_type.name if page.context.browser else "chromium"
+        baseline = os.path.join(self.baseline_dir, browser, f"{name}.png")
+        self._counter += 1
+        # Unique per process and call: xdist workers may capture the same route at the same time
+        actual = os.path.join(self.output_dir, "actual", f"{name}_{os.getpid()}_{self._counter}.png")
+        os.makedirs(os.path.dirname(actual), exist_ok=True)
+        page.screenshot(
+            path=actual, full_page=full_page, animations="disabled", caret="hide",
+            mask=[page.locator(selector) for selector in self.mask_selectors + list(mask_selectors or [])]
+        )
+
+        if self.update or not os.path.exists(baseline):
+            status = "updated" if os.path.exists(baseline) else "new"
+            os.makedirs(os.path.dirname(baseline), exist_ok=True)
+            os.replace(actual, baseline)
+            self.pending.append({"name": name, "status": status, "passed": True, "baseline": baseline})
+            return
+
+        diff = os.path.join(self.output_dir, "diff", f"{name}_{os.getpid()}_{self._counter}.png")
+        future = self._executor().submit(compare_images, baseline, actual, diff, **self.options)
+        self.pending.append((name, future))
+
+    def collect(self) -> list:
+        """Wait for the queued comparisons and clear them.
+
+        Returns:
+            list: Result dictionaries with name and status ("passed", "failed", "new" or "updated")
+        """
+        results = []
+        for item in self.pending:
+            if not isinstance(item, tuple):
+                results.append(item)
+                continue
+            name, future = item
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"passed": False, "reason": f"comparison error: {e}", "diff": None}
+            result.update(name=name, status="passed" if result["passed"] else "failed")
+            results.append(result)
+        self.pending = []
+        return results
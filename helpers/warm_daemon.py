@@ -0,0 +1,252 @@
+import difflib
+import importlib
+import os
+import sys
+import time
+import pytest
+from playwright.sync_api import sync_playwright
+from .impact import ImpactAnalyzer
+from .settings import get_settings
+
+# The daemon serving the current process, if any (read by tests/conftest.py)
+_active_daemon = None
+
+def get_active_daemon():
+    """Get the warm daemon running in this process, or None."""
+    return _active_daemon
+
+class WarmDaemon:
+    """Long-lived process that keeps a browser and logged-in roles warm.
+
+    Watches ``pom/``, ``helpers/`` and ``tests/`` for changes, reloads the
+    changed modules and re-runs only the affected tests in-process, against
+    the already running browser.
+    """
+
+    WATCH_DIRS = ("pom", "helpers", "tests")
+    # Role -> (page object module, class name)
+    ROLE_PAGES = {
+        "admin": ("pom.admin_page", "AdminPage"),
+        "landlord": ("pom.landlord_page", "LandlordPage"),
+        "tenant": ("pom.tenant_page", "TenantPage")
+    }
+
+    def __init__(self, root: str = ".", browser_name: str = "chromium", headed: bool = False,
+                 roles: tuple = ("landlord",), poll_interval: float = 0.5, pytest_args: list = None):
+        """Initialize the WarmDaemon.
+
+        Args:
+            root (str): Repository root directory
+            browser_name (str): Browser engine to keep warm
+            headed (bool): Show the browser window
+            roles (tuple): Roles to log in once and keep authenticated
+            poll_interval (float): Seconds between file change checks
+            pytest_args (list, optional): Extra arguments for every pytest run
+        """
+        self.root = os.path.abspath(root)
+        self.browser_name = browser_name
+        self.headed = headed
+        self.roles = roles
+        self.poll_interval = poll_interval
+        self.pytest_args = pytest_args or []
+        self.playwright = None
+        self.browser = None
+        self.storage_states = {}
+        self._sources = {}
+
+    def start(self):
+        """Start Playwright, launch the browser and log in every configured role."""
+        global _active_daemon
+        self.playwright = sync_playwright().start()
+        self.browser = getattr(self.playwright, self.browser_name).launch(headless=not self.headed)
+        _active_daemon = self
+        for role in self.roles:
+            self.login_role(role)
+        self._sources = self._read_sources()
+
+    def stop(self):
+        """Close the browser and stop Playwright."""
+        global _active_daemon
+        _active_daemon = None
+        if self.browser:
+            self.browser.close()
+        if self.playwright:
+            self.playwright.stop()
+
+    def login_role(self, role: str):
+        """Log a role in through its page object and keep the storage state.
+
+        Args:
+            role (str): Role name (e.g. "landlord")
+        """
+        settings = get_settings()
+        credentials = settings.role_credentials(role)
+        if not credentials or role not in self.ROLE_PAGES:
+            print(f"⚠️  Cannot keep {role} logged in: no credentials or page object")
+            return
+
+        module_name, class_name = self.ROLE_PAGES[role]
+        page_class = getattr(importlib.import_module(module_name), class_name)
+        context = self.browser.new_context(ignore_https_errors=True)
+        try:
+            page_object = page_class(context.new_page(), settings.url)
+            page_object.navigate_to_login()
+            page_object.login(credentials.email, credentials.password)
+            self.storage_states[role] = context.storage_state()
+            print(f"🔐 {role} logged in and kept warm")
+        except Exception as e:
+            self.storage_states.pop(role, None)
+            print(f"⚠️  Warm login for {role} failed: {e}")
+        finally:
+            context.close()
+
+    # File watching
+    def _read_sources(self):
+        """Read the Python sources of the watched directories."""
+        sources = {}
+        for directory in self.WATCH_DIRS:
+            for dirpath, _, filenames in os.walk(os.path.join(self.root, directory)):
+                for filename in filenames:
+                    if filename.endswith(".py"):
+                        path = os.path.join(dirpath, filename)
+                        relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+                        try:
+                            with open(path, encoding="utf-8") as source:
+                                sources[relative] = (os.path.getmtime(path), source.read())
+                        except OSError:
+                            continue
+        return sources
+
+    def _mtimes(self):
+        """Get modification times of the watched files without reading them."""
+        mtimes = {}
+        for directory in self.WATCH_DIRS:
+            for dirpath, _, filenames in os.walk(os.path.join(self.root, directory)):
+                for filename in filenames:
+                    if filename.endswith(".py"):
+                        path = os.path.join(dirpath, filename)
+                        try:
+                            mtimes[os.path.relpath(path, self.root).replace(os.sep, "/")] = os.path.getmtime(path)
+                        except OSError:
+                            continue
+        return mtimes
+
+    def detect_changes(self):
+        """Compare the watched files with the last snapshot.
+
+        Returns:
+            dict: Changed path mapped to changed line numbers (None for added or removed files)
+        """
+        mtimes = self._mtimes()
+        old_mtimes = {path: mtime for path, (mtime, _) in self._sources.items()}
+        if mtimes == old_mtimes:
+            return {}
+
+        new_sources = self._read_sources()
+        changes = {}
+        for path in set(new_sources) | set(self._sources):
+            if path not in new_sources or path not in self._sources:
+                changes[path] = None
+                continue
+            old_text = self._sources[path][1]
+            new_text = new_sources[path][1]
+            if old_text == new_text:
+                continue
+            lines = set()
+            matcher = difflib.SequenceMatcher(None, old_text.splitlines(), new_text.splitlines())
+            for tag, _, _, start, end in matcher.get_opcodes():
+                if tag != "equal":
+                    lines.update(range(start + 1, max(end, start + 1) + 1))
+            changes[path] = lines
+        self._sources = new_sources
+        return changes
+
+    def reload_modules(self, changes: dict):
+        """Reload changed project modules and forget imported test modules.
+
+        Helpers are reloaded before page objects so page objects pick up
+        the new helper classes. Test modules and conftest are dropped from
+        ``sys.modules`` so pytest imports them again on the next run.
+
+        Args:
+            changes (dict): Output of ``detect_changes``
+        """
+        project_modules = []
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if not path or not os.path.abspath(path).startswith(self.root + os.sep):
+                continue
+            relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+            if relative.startswith("tests/"):
+                del sys.modules[name]
+            elif relative.startswith(("helpers/", "pom/")) and name != __name__:
+                project_modules.append((relative, name))
+
+        if not any(path.startswith(("helpers/", "pom/")) for path in changes):
+            return
+
+        # Package __init__ modules last within their directory, helpers before pom
+        order = {"helpers": 0, "pom": 1}
+        project_modules.sort(key=lambda entry: (order.get(entry[0].split("/")[0], 2),
+                                                entry[0].endswith("__init__.py"), entry[0]))
+        for relative, name in project_modules:
+            try:
+                importlib.reload(sys.modules[name])
+            except Exception as e:
+                print(f"❌ Failed to reload {relative}: {e}")
+
+    def affected_node_ids(self, changes: dict):
+        """Map changes to pytest node ids using the change-impact analysis.
+
+        Args:
+            changes (dict): Output of ``detect_changes``
+
+        Returns:
+            list: Node ids to run, or None to run everything
+        """
+        analyzer = ImpactAnalyzer(self.root)
+        affected = analyzer.affected_tests(changes)
+        if affected is None:
+            return None
+        return sorted(f"{path}::{name}" for path, name in affected)
+
+    def run_tests(self, node_ids: list = None) -> int:
+        """Run tests in-process against the warm browser.
+
+        Args:
+            node_ids (list, optional): Tests to run (default: the configured test paths)
+
+        Returns:
+            int: Pytest exit code
+        """
+        start = time.perf_counter()
+        exit_code = pytest.main([*self.pytest_args, *(node_ids or [])])
+        print(f"⏱️  Run finished in {time.perf_counter() - start:.2f}s (exit code {int(exit_code)})")
+        return int(exit_code)
+
+    def watch(self, run_first: bool = False):
+        """Watch for changes and re-run affected tests until interrupted.
+
+        Args:
+            run_first (bool): Run the whole suite once before watching
+        """
+        if run_first:
+            self.run_tests()
+        print(f"👀 Watching {', '.join(self.WATCH_DIRS)} for changes (Ctrl+C to stop)")
+        while True:
+            time.sleep(self.poll_interval)
+            changes = self.detect_changes()
+            if not changes:
+                continue
+
+            print(f"\n✏️  Changed: {', '.join(sorted(changes))}")
+            self.reload_modules(changes)
+            node_ids = self.affected_node_ids(changes)
+            if node_ids is None:
+                print("🔁 Shared configuration changed - running all tests")
+                self.run_tests()
+            elif not node_ids:
+                print("✅ No tests affected")
+            else:
+                print(f"🎯 Re-running {len(node_ids)} affected test(s)")
+                self.run_tests(node_ids)
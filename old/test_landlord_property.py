@@ -1,5 +1,3 @@
-import os
-from dotenv import load_dotenv
 import pytest
 from playwright.sync_api import expect, TimeoutError, Page
 from pom.landlord_page import LandlordPage
@@ -67,8 +65,8 @@ def test_property_page_functionality(landlord_page: LandlordPage, landlord_crede
             try:
                 landlord_page.click_property_tab(tab_name)
                 test_logger.info(f"Successfully clicked on '{tab_name}' tab")
-                # Wait a moment for tab content to load
-                landlord_page.page.wait_for_timeout(1000)
+                # Wait for tab content to finish rendering
+                page_load_helper.wait_for_dom_stable()
                 break  # If one tab works, we've verified tab functionality
             except Exception as e:
                 test_logger.info(f"Tab '{tab_name}' not found or not clickable: {e}")
@@ -119,7 +119,7 @@ class TestPropertyFunctionality:
                 test_logger.info(f"Successfully clicked on '{tab_name}' tab")
                 
                 # Verify tab content loaded (wait for any dynamic content)
-                landlord_page.page.wait_for_timeout(2000)
+                page_load_helper.wait_for_dom_stable()
                 
                 # Check if tab content is visible (look for common content indicators)
                 content_selectors = [
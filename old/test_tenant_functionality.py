@@ -1,13 +1,8 @@
-import os
-from dotenv import load_dotenv
 import pytest
 from playwright.sync_api import expect, TimeoutError, Page
 from pom.landlord_page import LandlordPage
 from helpers.landlord_fixture import landlord_page, landlord_credentials
 
-# Load environment variables
-load_dotenv(override=True)
-
 class TestTenantFunctionality:
     """Test suite for tenant page functionality (landlord's view of tenants)"""
     
@@ -105,7 +100,7 @@ class TestTenantFunctionality:
                 test_logger.info(f"Successfully clicked on '{tab_name}' tab")
                 
                 # Verify tab content loaded (wait for any dynamic content)
-                landlord_page.page.wait_for_timeout(2000)
+                page_load_helper.wait_for_dom_stable()
                 
                 # Check if tab content is visible (look for common content indicators)
                 content_selectors = [
@@ -160,7 +155,7 @@ class TestTenantFunctionality:
                 test_logger.info(f"Successfully searched for: {search_term}")
                 
                 # Wait for search results
-                landlord_page.page.wait_for_timeout(2000)
+                page_load_helper.wait_for_count_stable(LandlordPage.TENANT_CARD_SELECTOR)
                 
                 # Verify search results are displayed
                 tenant_cards = landlord_page.get_tenant_cards()
@@ -199,7 +194,7 @@ class TestTenantFunctionality:
                 test_logger.info(f"Successfully filtered by status: {status}")
                 
                 # Wait for filter results
-                landlord_page.page.wait_for_timeout(2000)
+                page_load_helper.wait_for_count_stable(LandlordPage.TENANT_CARD_SELECTOR)
                 
                 # Verify filter results are displayed
                 tenant_cards = landlord_page.get_tenant_cards()
@@ -234,8 +229,8 @@ class TestTenantFunctionality:
             landlord_page.add_new_tenant()
             test_logger.info("Successfully clicked add new tenant button")
             
-            # Wait for page to load
-            landlord_page.page.wait_for_timeout(2000)
+            # Wait for the form or modal to finish rendering
+            page_load_helper.wait_for_dom_stable()
             
             # Check if we're on a form page or modal
             current_url = landlord_page.page.url
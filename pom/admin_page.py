@@ -1,4 +1,6 @@
 from playwright.sync_api import Page, expect
+from helpers.timeouts import get_timeout_service
+from helpers.error_sentinel import ErrorSentinel
 
 class AdminPage:
     """Page Object Model for Admin pages.
@@ -16,6 +18,7 @@ class AdminPage:
         """
         self.page = page
         self.base_url = base_url
+        self.timeouts = get_timeout_service()
 
     def navigate_to_login(self):
         """Navigate to the login page."""
@@ -34,12 +37,14 @@ class AdminPage:
         
         # Wait for and fill email input
         email_input = self.page.locator('input[type="email"]')
-        email_input.wait_for(state="visible", timeout=10000)
+        with self.timeouts.measure("email_input", "/login"):
+            email_input.wait_for(state="visible", timeout=self.timeouts.timeout("email_input", "/login", default=10000))
         email_input.fill(email)
         
         # Wait for and fill password input
         password_input = self.page.locator('input[type="password"]')
-        password_input.wait_for(state="visible", timeout=10000)
+        with self.timeouts.measure("password_input", "/login"):
+            password_input.wait_for(state="visible", timeout=self.timeouts.timeout("password_input", "/login", default=10000))
         password_input.fill(password)
         
         # Try multiple possible selectors for the login button
@@ -66,7 +71,11 @@ class AdminPage:
         if not button_clicked:
             raise Exception("Could not find login button with any known selector")
         
-        self.page.wait_for_url(f"{self.base_url}/welcome")
+        with self.timeouts.measure("login_redirect", "/login"):
+            self.page.wait_for_url(
+                f"{self.base_url}/welcome",
+                timeout=self.timeouts.timeout("login_redirect", "/login", default=30000)
+            )
 
     def navigate_to_page(self, path: str):
         """Navigate to a specific page and verify it loaded correctly.
@@ -75,13 +84,18 @@ class AdminPage:
             path (str): Path to navigate to (e.g., '/status', '/stats')
         """
         self.page.goto(f"{self.base_url}{path}")
-        self.page.wait_for_load_state("networkidle")
+        with self.timeouts.measure("networkidle", path):
+            self.page.wait_for_load_state(
+                "networkidle", timeout=self.timeouts.timeout("networkidle", path, default=30000)
+            )
         expect(self.page).to_have_url(f"{self.base_url}{path}")
         self._verify_page_content()
 
     def _verify_page_content(self):
         """Verify that the page loaded without errors and has content."""
-        expect(self.page.locator("text=Error")).not_to_be_visible()
-        expect(self.page.locator("text=404")).not_to_be_visible()
-        expect(self.page.locator("text=Not Found")).not_to_be_visible()
+        # One read of the in-page error sentinel; poll for error texts in pages without it
+        if not ErrorSentinel(self.page, None).verify():
+            expect(self.page.locator("text=Error")).not_to_be_visible()
+            expect(self.page.locator("text=404")).not_to_be_visible()
+            expect(self.page.locator("text=Not Found")).not_to_be_visible()
         expect(self.page.locator("body")).not_to_be_empty() 
\ No newline at end of file
@@ -1,5 +1,7 @@
 from playwright.sync_api import Page, expect
 from helpers.logger import TestLogger
+from helpers.timeouts import get_timeout_service
+from helpers.error_sentinel import ErrorSentinel
 
 class LandlordPage:
     """Page Object Model for Landlord pages.
@@ -7,6 +9,9 @@ class LandlordPage:
     This class encapsulates all interactions with landlord-related pages,
     providing a clean interface for test cases to interact with the landlord interface.
     """
+
+    # Tenant cards on the tenants page (plain CSS, usable in in-page condition waits)
+    TENANT_CARD_SELECTOR = '.tenant-card, [data-testid="tenant-card"], .card, .tenant-item'
     
     def __init__(self, page: Page, base_url: str):
         """Initialize the LandlordPage with a Playwright page and base URL.
@@ -18,6 +23,7 @@ class LandlordPage:
         self.page = page
         self.base_url = base_url
         self.logger = TestLogger("landlord_page")
+        self.timeouts = get_timeout_service()
 
     def navigate_to_login(self):
         """Navigate to the login page."""
@@ -105,11 +111,17 @@ class LandlordPage:
         
         # Wait for navigation after login - be more flexible with URL matching
         try:
-            self.page.wait_for_url(f"{self.base_url}/welcome", timeout=10000)
+            with self.timeouts.measure("login_redirect", "/login"):
+                self.page.wait_for_url(
+                    f"{self.base_url}/welcome",
+                    timeout=self.timeouts.timeout("login_redirect", "/login", default=10000)
+                )
             self.logger.info("Login successful, redirected to welcome page")
         except:
             # If welcome page doesn't load, check for any successful login indicator
-            self.page.wait_for_load_state("networkidle")
+            self.page.wait_for_load_state(
+                "networkidle", timeout=self.timeouts.timeout("networkidle", "/login", default=30000)
+            )
             current_url = self.page.url
             
             # Check for error messages on the page
@@ -150,7 +162,10 @@ class LandlordPage:
             path (str): Path to navigate to
         """
         self.page.goto(f"{self.base_url}{path}")
-        self.page.wait_for_load_state("networkidle")
+        with self.timeouts.measure("networkidle", path):
+            self.page.wait_for_load_state(
+                "networkidle", timeout=self.timeouts.timeout("networkidle", path, default=30000)
+            )
         expect(self.page).to_have_url(f"{self.base_url}{path}")
         self._verify_page_content()
     
@@ -161,14 +176,19 @@ class LandlordPage:
             path (str): Path to navigate to
         """
         self.page.goto(f"{self.base_url}{path}")
-        self.page.wait_for_load_state("networkidle")
+        with self.timeouts.measure("networkidle", path):
+            self.page.wait_for_load_state(
+                "networkidle", timeout=self.timeouts.timeout("networkidle", path, default=30000)
+            )
         self._verify_page_content()
 
     def _verify_page_content(self):
         """Verify that the page loaded without errors and has content."""
-        expect(self.page.locator("text=Error")).not_to_be_visible()
-        expect(self.page.locator("text=404")).not_to_be_visible()
-        expect(self.page.locator("text=Not Found")).not_to_be_visible()
+        # One read of the in-page error sentinel; poll for error texts in pages without it
+        if not ErrorSentinel(self.page, self.logger).verify():
+            expect(self.page.locator("text=Error")).not_to_be_visible()
+            expect(self.page.locator("text=404")).not_to_be_visible()
+            expect(self.page.locator("text=Not Found")).not_to_be_visible()
         expect(self.page.locator("body")).not_to_be_empty()
 
     # Navigation methods for specific pages
@@ -317,7 +337,7 @@ class LandlordPage:
         Returns:
             List of tenant card elements
         """
-        return self.page.locator('.tenant-card, [data-testid="tenant-card"], .card, .tenant-item').all()
+        return self.page.locator(self.TENANT_CARD_SELECTOR).all()
 
     def click_view_tenant_details(self, tenant_index: int = 0):
         """Click the 'View Details' button for a specific tenant.
@@ -6,12 +6,10 @@ This script provides an easy way to run property-related tests with proper confi
 
 import os
 import sys
-import subprocess
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables at the top level
-load_dotenv(override=True)
+import pytest
+from helpers.settings import get_settings
+from helpers.suite_runner import SUITES, run_suites
 
 def run_property_tests():
     """Run property functionality tests with proper configuration."""
@@ -21,20 +19,19 @@ def run_property_tests():
     os.chdir(project_root)
     
     # Check if required environment variables are set
-    url = os.getenv('URL')
-    landlord_email = os.getenv('LANDLORD_USER_EMAIL')
-    landlord_password = os.getenv('LANDLORD_USER_PASSWORD')
+    settings = get_settings()
+    url = settings.url
+    landlord_credentials = settings.role_credentials("landlord")
     
     print(f"🔍 Environment check:")
     print(f"   URL: {'✅ Set' if url else '❌ Not set'}")
-    print(f"   LANDLORD_USER_EMAIL: {'✅ Set' if landlord_email else '❌ Not set'}")
-    print(f"   LANDLORD_USER_PASSWORD: {'✅ Set' if landlord_password else '❌ Not set'}")
+    print(f"   LANDLORD_USER_EMAIL/PASSWORD: {'✅ Set' if landlord_credentials else '❌ Not set'}")
     
     if not url:
         print("❌ Error: URL environment variable not set. Please check your .env file.")
         sys.exit(1)
     
-    if not landlord_email or not landlord_password:
+    if not landlord_credentials:
         print("❌ Error: LANDLORD_USER_EMAIL and LANDLORD_USER_PASSWORD environment variables not set.")
         print("Please check your .env file.")
         sys.exit(1)
@@ -43,39 +40,19 @@ def run_property_tests():
     print(f"📍 Testing URL: {url}")
     print("=" * 50)
     
-    # Run the property tests
-    test_files = [
-        "tests/test_property_functionality.py",
-        "tests/test_landlord_property.py"
-    ]
-    
-    for test_file in test_files:
-        if Path(test_file).exists():
-            print(f"\n📋 Running tests from: {test_file}")
-            print("-" * 30)
-            
-            try:
-                # Run pytest with specific test file
-                result = subprocess.run([
-                    "python", "-m", "pytest", 
-                    test_file,
-                    "-v",  # Verbose output
-                    "--tb=short",  # Short traceback format
-                    "--capture=no"  # Show print statements
-                ], capture_output=False, text=True)
-                
-                if result.returncode == 0:
-                    print(f"✅ Tests in {test_file} completed successfully")
-                else:
-                    print(f"❌ Tests in {test_file} failed")
-                    
-            except Exception as e:
-                print(f"❌ Error running tests in {test_file}: {e}")
-        else:
-            print(f"⚠️  Test file not found: {test_file}")
+    # Run the property suite in one in-process pytest session
+    exit_code = run_suites(
+        ["property"],
+        verbose=True,  # Verbose output
+        extra_args=[
+            "--tb=short",  # Short traceback format
+            "--capture=no"  # Show print statements
+        ]
+    )
     
     print("\n" + "=" * 50)
     print("🏁 Property functionality tests completed!")
+    return exit_code
 
 def run_specific_test(test_name):
     """Run a specific test by name."""
@@ -87,28 +64,25 @@ def run_specific_test(test_name):
     print(f"🎯 Running specific test: {test_name}")
     print("=" * 50)
     
-    try:
-        result = subprocess.run([
-            "python", "-m", "pytest", 
-            f"tests/test_property_functionality.py::{test_name}",
-            "-v",
-            "--tb=short",
-            "--capture=no"
-        ], capture_output=False, text=True)
-        
-        if result.returncode == 0:
-            print(f"✅ Test '{test_name}' completed successfully")
-        else:
-            print(f"❌ Test '{test_name}' failed")
-            
-    except Exception as e:
-        print(f"❌ Error running test '{test_name}': {e}")
+    exit_code = pytest.main([
+        *SUITES["property"]["paths"],
+        "-k", test_name,
+        "-v",
+        "--tb=short",
+        "--capture=no"
+    ])
+    
+    if exit_code == 0:
+        print(f"✅ Test '{test_name}' completed successfully")
+    else:
+        print(f"❌ Test '{test_name}' failed")
+    return int(exit_code)
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         # Run specific test
         test_name = sys.argv[1]
-        run_specific_test(test_name)
+        sys.exit(run_specific_test(test_name))
     else:
         # Run all property tests
-        run_property_tests() 
\ No newline at end of file
+        sys.exit(run_property_tests()) 
\ No newline at end of file
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Unified suite runner
+
+Runs any combination of named suites in a single in-process pytest session
+(optionally in parallel with xdist) and prints a summary per suite.
+
+Usage:
+    python run_suites.py                      # all suites
+    python run_suites.py property tenants     # selected suites
+    python run_suites.py landlord --workers auto
+    python run_suites.py --list
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from helpers.suite_runner import SUITES, run_suites
+
+def main():
+    parser = argparse.ArgumentParser(description='Run named test suites in one pytest session')
+    parser.add_argument('suites', nargs='*', help=f"Suites to run (default: all). Available: {', '.join(SUITES)}")
+    parser.add_argument('--list', action='store_true', help='List available suites and exit')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Run tests in verbose mode')
+    parser.add_argument('--headed', action='store_true', help='Run tests in headed mode (show browser)')
+    parser.add_argument('--slow-mo', type=int, default=None, help='Slow down Playwright operations (milliseconds)')
+    parser.add_argument('--workers', default=None, help='Number of xdist workers (or "auto")')
+
+    args, extra_args = parser.parse_known_args()
+
+    if args.list:
+        for name, suite in SUITES.items():
+            keyword = f" (tests matching '{suite['keyword']}')" if suite['keyword'] else ""
+            print(f"{name}: {', '.join(suite['paths'])}{keyword}")
+        return 0
+
+    # Ensure we're in the correct directory
+    os.chdir(Path(__file__).parent)
+
+    try:
+        return run_suites(
+            args.suites,
+            workers=args.workers,
+            headed=args.headed,
+            slow_mo=args.slow_mo,
+            verbose=args.verbose,
+            extra_args=extra_args
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 4
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
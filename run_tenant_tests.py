@@ -11,11 +11,9 @@ Usage:
     python run_tenant_tests.py --headed
 """
 
-import subprocess
 import sys
 import argparse
-import os
-from pathlib import Path
+from helpers.suite_runner import run_suites
 
 def main():
     parser = argparse.ArgumentParser(description='Run tenant functionality tests')
@@ -23,42 +21,32 @@ def main():
     parser.add_argument('--headed', action='store_true', help='Run tests in headed mode (show browser)')
     parser.add_argument('--slow-mo', type=int, default=100, help='Slow down Playwright operations (milliseconds)')
     parser.add_argument('--workers', type=int, default=1, help='Number of test workers')
-    parser.add_argument('--retries', type=int, default=1, help='Number of retries for failed tests')
+    parser.add_argument('--retries', type=int, default=1, help='Rerun failed tests once to classify flaky ones (0 to disable)')
     
     args = parser.parse_args()
     
-    # Build pytest command
-    cmd = [
-        'python', '-m', 'pytest',
-        'tests/test_tenant_functionality.py',
-        '--tb=short'
-    ]
-    
-    if args.verbose:
-        cmd.append('-v')
-    
-    if args.headed:
-        cmd.extend(['--headed'])
-    
-    cmd.extend([
-        '--slow-mo', str(args.slow_mo),
-        '--workers', str(args.workers),
-        '--retries', str(args.retries)
-    ])
+    extra_args = ['--tb=short']
+    if args.retries:
+        extra_args.append('--flaky-detect')
     
     print("Running tenant functionality tests...")
-    print(f"Command: {' '.join(cmd)}")
     print("-" * 50)
     
     try:
-        result = subprocess.run(cmd, check=True)
-        print("-" * 50)
-        print("✅ All tenant tests passed!")
-        return 0
-    except subprocess.CalledProcessError as e:
+        exit_code = run_suites(
+            ['tenants'],
+            workers=args.workers if args.workers > 1 else None,
+            headed=args.headed,
+            slow_mo=args.slow_mo,
+            verbose=args.verbose,
+            extra_args=extra_args
+        )
         print("-" * 50)
-        print(f"❌ Some tenant tests failed with exit code: {e.returncode}")
-        return e.returncode
+        if exit_code == 0:
+            print("✅ All tenant tests passed!")
+        else:
+            print(f"❌ Some tenant tests failed with exit code: {exit_code}")
+        return exit_code
     except KeyboardInterrupt:
         print("\n⚠️  Tests interrupted by user")
         return 1
@@ -67,4 +55,4 @@ def main():
         return 1
 
 if __name__ == '__main__':
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
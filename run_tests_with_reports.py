@@ -4,8 +4,8 @@ Enhanced test runner with multiple reporting options
 """
 
 import argparse
-import subprocess
 import sys
+import pytest
 from helpers.reports import ReportsHelper
 
 def run_tests_with_reports(test_path=None, report_type="all", parallel=False):
@@ -19,8 +19,8 @@ def run_tests_with_reports(test_path=None, report_type="all", parallel=False):
     """
     reports_helper = ReportsHelper()
     
-    # Build pytest command
-    cmd = ["python", "-m", "pytest"]
+    # Build pytest arguments for an in-process session
+    cmd = []
     
     # Add test path if specified
     if test_path:
@@ -46,21 +46,21 @@ def run_tests_with_reports(test_path=None, report_type="all", parallel=False):
         cmd.extend(["-q", "--tb=no"])
     
     print(f"🚀 Running tests with {report_type} reports...")
-    print(f"Command: {' '.join(cmd)}")
+    print(f"Command: pytest {' '.join(cmd)}")
     
     try:
         # Run tests
-        result = subprocess.run(cmd, check=False)
+        exit_code = int(pytest.main(cmd))
         
         # Generate additional reports if needed
-        if report_type in ["all", "allure"] and result.returncode == 0:
+        if report_type in ["all", "allure"] and exit_code == 0:
             print("\n📊 Generating Allure report...")
             reports_helper.generate_allure_report()
         
         # Show report summary
         print("\n" + reports_helper.get_report_summary())
         
-        return result.returncode
+        return exit_code
         
     except KeyboardInterrupt:
         print("\n⏹️  Test execution interrupted by user")
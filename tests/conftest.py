@@ -1,11 +1,451 @@
 import os
+import shutil
+import tempfile
+import uuid
 import pytest
 from playwright.sync_api import sync_playwright, Page
-from dotenv import load_dotenv
-from helpers import ScreenshotHelper, TestLogger, PageLoadHelper, ReportsHelper
+from pytest_playwright.pytest_playwright import artifacts_folder as playwright_artifacts
+from helpers import ScreenshotHelper, TestLogger, PageLoadHelper, ReportsHelper, TraceBuffer
+from helpers.impact import ImpactAnalyzer
+from helpers.flaky import FlakyTestPlugin
+from helpers.run_history import RunHistory
+from helpers.timeouts import TimeoutService, get_timeout_service, set_timeout_service
+from helpers.login_breaker import LoginCircuitBreaker
+from helpers.preflight import AppPreflight
+from helpers.settings import Settings, get_settings, configure_settings
+from helpers.warm_daemon import get_active_daemon
+from helpers.browser_server import BrowserServerPool, SharedBrowserClient
+from helpers.data_seeding import DataSeeder, DataSeedingError
+from helpers.account_pool import AccountPool
+from helpers.emulation import PROFILES, EmulationHelper
+from helpers.cpu_profiler import CpuProfiler
+from helpers.browser_events import BrowserEventCollector
+from helpers.sleep_audit import SleepAuditPlugin
+from helpers.timeline import TimelinePlugin
+from helpers.harness_profiler import HarnessProfilerPlugin
+from helpers.round_trips import RoundTripCounter, RoundTripCounterError
+from helpers.selector_profiler import SelectorProfiler
+from helpers.error_sentinel import ErrorSentinel
+from pytest_metadata.plugin import metadata_key
+from pom.landlord_page import LandlordPage
 
-# Load environment variables
-load_dotenv()
+def pytest_addoption(parser):
+    """Register LLHUB harness command line options"""
+    group = parser.getgroup("llhub", "LLHUB test harness")
+    group.addoption(
+        "--failure-trace", action="store_true", default=False,
+        help="Record chunked Playwright traces and keep them only for failed tests"
+    )
+    group.addoption(
+        "--failure-trace-chunks", type=int, default=3,
+        help="Number of most recent trace chunks (setup, each page object step, teardown) kept in the buffer (default: 3)"
+    )
+    group.addoption(
+        "--failure-trace-no-screenshots", action="store_true", default=False,
+        help="Do not capture screenshots in failure traces"
+    )
+    group.addoption(
+        "--failure-trace-no-snapshots", action="store_true", default=False,
+        help="Do not capture DOM snapshots in failure traces"
+    )
+    group.addoption(
+        "--failure-trace-sources", action="store_true", default=False,
+        help="Include test sources in failure traces"
+    )
+    group.addoption(
+        "--impact-base", default=None, metavar="REV",
+        help="Only run tests affected by changes in pom/, helpers/ or tests/ since a git revision"
+    )
+    group.addoption(
+        "--flaky-detect", action="store_true", default=False,
+        help="Record outcomes, rerun failures once to classify flaky tests and honour quarantine"
+    )
+    group.addoption(
+        "--auto-quarantine", action="store_true", default=False,
+        help="Move tests over the flakiness threshold to the non-blocking quarantine lane"
+    )
+    group.addoption(
+        "--flaky-threshold", type=float, default=0.3,
+        help="Flakiness score at which a test is quarantined (default: 0.3)"
+    )
+    group.addoption(
+        "--flaky-min-runs", type=int, default=5,
+        help="Recorded runs needed before a flakiness score is trusted (default: 5)"
+    )
+    group.addoption(
+        "--flaky-window", type=int, default=20,
+        help="Number of recent runs used for the flakiness score (default: 20)"
+    )
+    group.addoption(
+        "--run-history-db", default="reports/history/run_history.db",
+        help="SQLite database for test run history"
+    )
+    group.addoption(
+        "--record-timings", action="store_true", default=False,
+        help="Record successful wait durations per route and action in the run history"
+    )
+    group.addoption(
+        "--adaptive-timeouts", action="store_true", default=False,
+        help="Record wait durations and use learned timeouts instead of the hard-coded ones"
+    )
+    group.addoption(
+        "--timeout-multiplier", type=float, default=3.0,
+        help="Multiple of the learned percentile used as the timeout (default: 3.0)"
+    )
+    group.addoption(
+        "--timeout-percentile", type=float, default=95,
+        help="Percentile of recorded durations to learn, e.g. 95 or 99 (default: 95)"
+    )
+    group.addoption(
+        "--timeout-floor", type=int, default=2000,
+        help="Smallest adaptive timeout in milliseconds (default: 2000)"
+    )
+    group.addoption(
+        "--timeout-ceiling", type=int, default=30000,
+        help="Largest adaptive timeout in milliseconds (default: 30000)"
+    )
+    group.addoption(
+        "--preflight", action="store_true", default=False,
+        help="Wait for the app and warm key routes over plain HTTP before any browser launches"
+    )
+    group.addoption(
+        "--preflight-timeout", type=float, default=60,
+        help="Seconds to wait for the app to become ready (default: 60)"
+    )
+    group.addoption(
+        "--preflight-status", action="store_true", default=False,
+        help="Also require /status to answer successfully during pre-flight"
+    )
+    group.addoption(
+        "--shared-browser", action="store_true", default=False,
+        help="With xdist, connect workers to shared browser server processes instead of one browser each"
+    )
+    group.addoption(
+        "--workers-per-browser", type=int, default=4,
+        help="Number of xdist workers sharing one browser server process (default: 4)"
+    )
+    group.addoption(
+        "--account-leasing", action="store_true", default=False,
+        help="Lease test accounts exclusively per test from the configured pool of accounts per role"
+    )
+    group.addoption(
+        "--account-pool-db", default=None,
+        help="SQLite lease database shared by all runs on this host (default: in the temp directory)"
+    )
+    group.addoption(
+        "--min-login-interval", type=float, default=2.0,
+        help="Minimum seconds between two logins of the same account (default: 2.0)"
+    )
+    group.addoption(
+        "--emulation-profile", default=None, choices=sorted(PROFILES),
+        help="Throttle network and CPU of every browser test with a named profile (Chromium only)"
+    )
+    group.addoption(
+        "--enforce-budgets", action="store_true", default=False,
+        help="Fail tests whose waits exceed their emulation profile's budgets instead of only reporting them"
+    )
+    group.addoption(
+        "--leak-soak", type=int, default=0, metavar="ITERATIONS",
+        help="Run the leak soak test with this many loops over the landlord routes (skipped by default)"
+    )
+    group.addoption(
+        "--cpu-profile", action="store_true", default=False,
+        help="CPU-profile page navigations, tab clicks and tenant searches in the browser (Chromium only)"
+    )
+    group.addoption(
+        "--cpu-profile-top", type=int, default=10,
+        help="Number of hot functions listed per route and action (default: 10)"
+    )
+    group.addoption(
+        "--browser-events-size", type=int, default=500,
+        help="Number of recent console and network events kept per page (default: 500)"
+    )
+    group.addoption(
+        "--fail-on-browser-errors", action="store_true", default=False,
+        help="Fail tests whose pages logged console errors, page errors, failed requests or 5xx responses"
+    )
+    group.addoption(
+        "--sleep-audit", action="store_true", default=False,
+        help="Record time spent in time.sleep and page.wait_for_timeout per test, file and call site"
+    )
+    group.addoption(
+        "--sleep-audit-top", type=int, default=10,
+        help="Number of tests, files and call sites listed by the sleep audit (default: 10)"
+    )
+    group.addoption(
+        "--timeline", action="store_true", default=False,
+        help="Record fixture, page object and helper spans as a Chrome trace (reports/timeline.json)"
+    )
+    group.addoption(
+        "--profile-harness", action="store_true", default=False,
+        help="Profile the harness's Python code per test with cProfile and a stack sampler"
+    )
+    group.addoption(
+        "--profile-harness-top", type=int, default=25,
+        help="Number of functions in the harness profile table (default: 25)"
+    )
+    group.addoption(
+        "--round-trips", action="store_true", default=False,
+        help="Count browser round trips and their latency per page object method and test"
+    )
+    group.addoption(
+        "--round-trip-budget", action="append", default=[], metavar="METHOD=N",
+        help="Fail tests in which one call of METHOD (e.g. login or LandlordPage.search_tenants) "
+             "makes more than N round trips; implies --round-trips (repeatable)"
+    )
+    group.addoption(
+        "--round-trip-default-budget", type=int, default=None, metavar="N",
+        help="Round-trip budget of page object methods without their own; implies --round-trips"
+    )
+    group.addoption(
+        "--selector-profile", action="store_true", default=False,
+        help="Time every selector's resolution against the live page and rank selectors by cost and ambiguity"
+    )
+    group.addoption(
+        "--selector-profile-top", type=int, default=15,
+        help="Number of selectors listed in the selector profile summary (default: 15)"
+    )
+    group.addoption(
+        "--visual", action="store_true", default=False,
+        help="Compare a screenshot of every route visited through the page objects with its baseline"
+    )
+    group.addoption(
+        "--update-baselines", action="store_true", default=False,
+        help="Replace the visual baselines with new screenshots; implies --visual"
+    )
+    group.addoption(
+        "--visual-mask", action="append", default=[], metavar="SELECTOR",
+        help="Mask elements matching SELECTOR in visual screenshots, e.g. dates or avatars (repeatable)"
+    )
+    group.addoption(
+        "--visual-threshold", type=float, default=0.02,
+        help="Share of differing pixels above which a 32x32 tile fails (default: 0.02)"
+    )
+    group.addoption(
+        "--visual-workers", type=int, default=None,
+        help="Processes comparing screenshots (default: up to 4)"
+    )
+    group.addoption(
+        "--failure-capture", default="auto", choices=ScreenshotHelper.POLICIES,
+        help="Failure screenshot policy: the failing element plus margin, the viewport or the full page "
+             "(default: auto - element when the error names one, otherwise viewport)"
+    )
+    group.addoption(
+        "--failure-capture-max-pixels", type=int, default=4_000_000,
+        help="Largest failure screenshot in pixels; longer pages are cut and wider ones downscaled (default: 4000000)"
+    )
+
+def pytest_configure(config):
+    """Set up the run id shared with xdist workers and register optional harness plugins"""
+    workerinput = getattr(config, "workerinput", None)
+    config.llhub_run_id = workerinput["llhub_run_id"] if workerinput else uuid.uuid4().hex
+
+    # Workers reuse the controller's settings instead of parsing .env again
+    if workerinput and "llhub_settings" in workerinput:
+        configure_settings(Settings.from_dict(workerinput["llhub_settings"]))
+
+    if config.getoption("flaky_detect"):
+        config.pluginmanager.register(
+            FlakyTestPlugin(
+                config,
+                RunHistory(config.getoption("run_history_db")),
+                threshold=config.getoption("flaky_threshold"),
+                min_runs=config.getoption("flaky_min_runs"),
+                window=config.getoption("flaky_window"),
+                auto_quarantine=config.getoption("auto_quarantine")
+            ),
+            "llhub_flaky"
+        )
+
+    if config.getoption("sleep_audit"):
+        sleep_audit = SleepAuditPlugin(config, top_n=config.getoption("sleep_audit_top"))
+        sleep_audit.install()
+        config.pluginmanager.register(sleep_audit, "llhub_sleep_audit")
+
+    if config.getoption("timeline"):
+        timeline = TimelinePlugin(config)
+        timeline.install()
+        config.pluginmanager.register(timeline, "llhub_timeline")
+
+    if config.getoption("profile_harness"):
+        config.pluginmanager.register(
+            HarnessProfilerPlugin(config, top_n=config.getoption("profile_harness_top")),
+            "llhub_harness_profiler"
+        )
+
+    budgets = {}
+    for budget in config.getoption("round_trip_budget"):
+        method, _, limit = budget.partition("=")
+        if not method or not limit.isdigit():
+            raise pytest.UsageError(f"--round-trip-budget expects METHOD=N, got '{budget}'")
+        budgets[method] = int(limit)
+    default_budget = config.getoption("round_trip_default_budget")
+    if config.getoption("round_trips") or budgets or default_budget is not None:
+        config.llhub_round_trips = RoundTripCounter(budgets, default_budget)
+        try:
+            config.llhub_round_trips.install()
+        except RoundTripCounterError as e:
+            raise pytest.UsageError(str(e))
+
+    adaptive = config.getoption("adaptive_timeouts")
+    if adaptive or config.getoption("record_timings"):
+        set_timeout_service(
+            TimeoutService(
+                RunHistory(config.getoption("run_history_db")),
+                apply=adaptive,
+                multiplier=config.getoption("timeout_multiplier"),
+                percentile=config.getoption("timeout_percentile"),
+                floor_ms=config.getoption("timeout_floor"),
+                ceiling_ms=config.getoption("timeout_ceiling")
+            )
+        )
+
+    if config.getoption("failure_trace"):
+        TraceBuffer.install()
+
+    if config.getoption("cpu_profile"):
+        config.llhub_cpu_profiler = CpuProfiler(top_n=config.getoption("cpu_profile_top"))
+        config.llhub_cpu_profiler.install()
+
+    if config.getoption("selector_profile"):
+        config.llhub_selector_profiler = SelectorProfiler(
+            root=str(config.rootpath), round_trips=getattr(config, "llhub_round_trips", None)
+        )
+        config.llhub_selector_profiler.install()
+
+    if config.getoption("visual") or config.getoption("update_baselines"):
+        # NumPy and Pillow are only needed for visual regression runs
+        try:
+            from helpers.visual import VisualRegression
+        except ImportError as e:
+            raise pytest.UsageError(f"--visual needs NumPy and Pillow (pip install -r requirements.txt): {e}")
+        config.llhub_visual = VisualRegression(
+            os.path.join(str(config.rootpath), "visual_baselines"),
+            update=config.getoption("update_baselines"),
+            workers=config.getoption("visual_workers"),
+            mask_selectors=config.getoption("visual_mask"),
+            tile_threshold=config.getoption("visual_threshold")
+        )
+        config.llhub_visual.install()
+
+    if config.getoption("emulation_profile"):
+        config.stash[metadata_key]["Emulation profile"] = config.getoption("emulation_profile")
+
+    # The controller owns the shared browser servers; workers only connect
+    if config.getoption("shared_browser") and not workerinput and getattr(config.option, "numprocesses", None):
+        browser_names = config.getoption("browser") or ["chromium"]
+        launch_options = {"headless": not config.getoption("headed")}
+        if config.getoption("browser_channel"):
+            launch_options["channel"] = config.getoption("browser_channel")
+        config.llhub_browser_servers = BrowserServerPool(
+            os.path.join(tempfile.gettempdir(), "llhub-browser-servers", config.llhub_run_id),
+            browser_name=browser_names[0],
+            workers_per_server=config.getoption("workers_per_browser"),
+            launch_options=launch_options
+        )
+        config.llhub_browser_servers.start_monitor()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Pass the run id and settings to each xdist worker"""
+    node.workerinput["llhub_run_id"] = node.config.llhub_run_id
+    node.workerinput["llhub_settings"] = get_settings().to_dict()
+    pool = getattr(node.config, "llhub_browser_servers", None)
+    if pool:
+        node.workerinput["llhub_browser_server"] = pool.endpoint_file_for(int(node.gateway.id[2:]))
+
+def pytest_report_header(config):
+    """Report missing or invalid settings up front"""
+    return [f"⚠️  Settings: {problem}" for problem in get_settings().validate()]
+
+def pytest_sessionstart(session):
+    """Gate the run on the app being reachable and warmed up"""
+    config = session.config
+    if not config.getoption("preflight") or hasattr(config, "workerinput"):
+        return
+
+    url = get_settings().url
+    if not url:
+        pytest.exit("❌ Pre-flight failed: URL environment variable not set", returncode=3)
+
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    preflight = AppPreflight(
+        url,
+        timeout=config.getoption("preflight_timeout"),
+        status_path="/status" if config.getoption("preflight_status") else None
+    )
+    result = preflight.run()
+    if not result["ready"]:
+        pytest.exit(f"❌ Pre-flight failed: {result['error']}", returncode=3)
+
+    if reporter:
+        warmed = ", ".join(
+            f"{route} {status or 'ERR'} {elapsed * 1000:.0f}ms"
+            for route, (status, elapsed) in result["warm_up"].items()
+        )
+        reporter.write_line(
+            f"🩺 App ready in {result['time_to_ready']:.1f}s after {result['attempts']} attempt(s) - warmed: {warmed}"
+        )
+
+def pytest_unconfigure(config):
+    """Persist wait durations recorded by this process and clean up run state"""
+    get_timeout_service().flush()
+
+    if hasattr(config, "llhub_cpu_profiler"):
+        config.llhub_cpu_profiler.uninstall()
+
+    if hasattr(config, "llhub_round_trips"):
+        config.llhub_round_trips.uninstall()
+
+    if hasattr(config, "llhub_selector_profiler"):
+        config.llhub_selector_profiler.uninstall()
+
+    if hasattr(config, "llhub_visual"):
+        config.llhub_visual.uninstall()
+
+    if config.getoption("failure_trace"):
+        TraceBuffer.uninstall()
+
+    pool = getattr(config, "llhub_browser_servers", None)
+    if pool:
+        pool.stop()
+        shutil.rmtree(pool.state_dir, ignore_errors=True)
+
+    # The controller removes the login circuit breaker state of the run
+    if not hasattr(config, "workerinput") and hasattr(config, "llhub_run_id"):
+        shutil.rmtree(
+            os.path.join(tempfile.gettempdir(), "llhub-login-breaker", config.llhub_run_id),
+            ignore_errors=True
+        )
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests not affected by the changes since --impact-base"""
+    base = config.getoption("impact_base")
+    if not base:
+        return
+
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    analyzer = ImpactAnalyzer(str(config.rootpath))
+    affected = analyzer.affected_tests(analyzer.changed_lines(base))
+    if affected is None:
+        if reporter:
+            reporter.write_line(f"🔁 Shared configuration changed since {base} - running all tests")
+        return
+
+    selected = []
+    deselected = []
+    for item in items:
+        path = item.path.relative_to(config.rootpath).as_posix()
+        if (path, getattr(item, "originalname", item.name)) in affected:
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    if reporter:
+        reporter.write_line(f"🎯 Change impact since {base}: {len(selected)} selected, {len(deselected)} deselected")
 
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args):
@@ -18,9 +458,199 @@ def browser_context_args(browser_context_args):
         "ignore_https_errors": True,
     }
 
+@pytest.fixture(scope="session")
+def playwright():
+    """Playwright instance, reused from the warm daemon when one is running"""
+    daemon = get_active_daemon()
+    if daemon:
+        yield daemon.playwright
+        return
+    pw = sync_playwright().start()
+    yield pw
+    pw.stop()
+
+def _browser_scope(fixture_name, config):
+    """Check the browser per test on workers using a shared browser server, so lost connections recover"""
+    workerinput = getattr(config, "workerinput", {})
+    return "function" if "llhub_browser_server" in workerinput else "session"
+
+@pytest.fixture(scope="session")
+def shared_browser_client(pytestconfig, browser_type, browser_type_launch_args):
+    """Fixture to provide this worker's connection to its shared browser server"""
+    client = SharedBrowserClient(
+        browser_type,
+        pytestconfig.workerinput["llhub_browser_server"],
+        slow_mo=browser_type_launch_args.get("slow_mo")
+    )
+    yield client
+    client.close()
+    playwright_artifacts.cleanup()
+
+@pytest.fixture(scope=_browser_scope)
+def browser(request):
+    """Browser, reused from the warm daemon or a shared browser server when available"""
+    daemon = get_active_daemon()
+    if daemon:
+        yield daemon.browser
+        return
+    if "llhub_browser_server" in getattr(request.config, "workerinput", {}):
+        yield request.getfixturevalue("shared_browser_client").get()
+        return
+    browser = request.getfixturevalue("launch_browser")()
+    yield browser
+    browser.close()
+    playwright_artifacts.cleanup()
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Start tests marked ``authenticated`` in a context already logged in by the warm daemon"""
+    marker = item.get_closest_marker("authenticated")
+    daemon = get_active_daemon()
+    if marker is None or daemon is None or marker.args[0] not in daemon.storage_states:
+        return
+    # pytest-playwright's context fixture applies the marker's arguments to browser.new_context
+    item.add_marker(pytest.mark.browser_context_args(storage_state=daemon.storage_states[marker.args[0]]))
+    item.llhub_authenticated = marker.args[0]
+
+@pytest.fixture
+def pre_authenticated(request):
+    """Fixture to tell whether the test's context started logged in as its ``authenticated`` marker's role.
+
+    Only the warm daemon keeps roles logged in; otherwise this is False and
+    tests log in through the UI as usual.
+    """
+    return getattr(request.node, "llhub_authenticated", None) is not None
+
 @pytest.fixture(scope="session")
 def base_url():
-    return os.getenv('URL')
+    return get_settings().url
+
+@pytest.fixture(scope="session")
+def settings():
+    """Fixture to provide the settings loaded once per process"""
+    return get_settings()
+
+@pytest.fixture(scope="session")
+def login_breaker(pytestconfig):
+    """Fixture to provide the login circuit breaker shared by all workers of the run"""
+    state_dir = os.path.join(tempfile.gettempdir(), "llhub-login-breaker", pytestconfig.llhub_run_id)
+    return LoginCircuitBreaker(state_dir)
+
+def _lease_holder(config) -> str:
+    """Identify this worker of this run in the account lease table"""
+    return f"{config.llhub_run_id}-{getattr(config, 'workerinput', {}).get('workerid', 'main')}"
+
+@pytest.fixture(scope="session")
+def account_pool(pytestconfig):
+    """Fixture to provide the account lease pool, or None without --account-leasing"""
+    if not pytestconfig.getoption("account_leasing"):
+        return None
+    return AccountPool(
+        pytestconfig.getoption("account_pool_db") or os.path.join(tempfile.gettempdir(), "llhub-account-pool.db"),
+        min_login_interval=pytestconfig.getoption("min_login_interval")
+    )
+
+@pytest.fixture
+def lease_account(account_pool, pytestconfig):
+    """Fixture to get a role's credentials, leased exclusively for this test with --account-leasing"""
+    holder = _lease_holder(pytestconfig)
+    leases = []
+
+    def lease(role: str):
+        settings = get_settings()
+        if account_pool is None:
+            return settings.role_credentials(role)
+        accounts = settings.role_accounts(role)
+        if not accounts:
+            return None
+        credentials = account_pool.lease(role, accounts, holder)
+        leases.append((role, credentials.email))
+        account_pool.throttle_login(credentials.email)
+        return credentials
+
+    yield lease
+    for role, email in leases:
+        account_pool.release(role, email, holder)
+
+@pytest.fixture(scope="session")
+def landlord_storage_state(request, browser_context_args, login_breaker, account_pool):
+    """Fixture to provide the landlord's storage state, logging in once per worker"""
+    daemon = get_active_daemon()
+    if daemon and "landlord" in daemon.storage_states:
+        yield daemon.storage_states["landlord"]
+        return
+
+    settings = get_settings()
+    credentials = settings.role_credentials("landlord")
+    if not credentials:
+        pytest.skip(f"{settings.env_names('landlord')} must be set in .env file")
+
+    # The account is only leased for the login; the storage state stays valid after release
+    holder = f"{_lease_holder(request.config)}-session"
+    if account_pool:
+        credentials = account_pool.lease("landlord", settings.role_accounts("landlord"), holder)
+        account_pool.throttle_login(credentials.email)
+
+    # The browser fixture is per test on shared browser servers
+    if "llhub_browser_server" in getattr(request.config, "workerinput", {}):
+        browser = request.getfixturevalue("shared_browser_client").get()
+    else:
+        browser = request.getfixturevalue("browser")
+    context = browser.new_context(**browser_context_args)
+    try:
+        with login_breaker.guard(credentials.email):
+            landlord = LandlordPage(context.new_page(), settings.url)
+            landlord.navigate_to_login()
+            landlord.login(credentials.email, credentials.password)
+        storage_state = context.storage_state()
+    except Exception as e:
+        pytest.skip(f"Data seeding skipped - landlord login failed: {e}")
+    finally:
+        context.close()
+        if account_pool:
+            account_pool.release("landlord", credentials.email, holder)
+
+    yield storage_state
+
+@pytest.fixture(scope="session")
+def data_seeder(pytestconfig, landlord_storage_state):
+    """Fixture to provide the API data seeder; deletes the created data at session end"""
+    workerinput = getattr(pytestconfig, "workerinput", {})
+    settings = get_settings()
+    seeder = DataSeeder(
+        settings.url,
+        settings.api_paths,
+        storage_state=landlord_storage_state,
+        prefix=f"llhub-{pytestconfig.llhub_run_id[:8]}-{workerinput.get('workerid', 'main')}"
+    )
+    yield seeder
+    for failure in seeder.cleanup():
+        print(f"⚠️  Data cleanup: {failure}")
+
+@pytest.fixture(scope="session")
+def seeded_data(data_seeder):
+    """Fixture to provide properties and tenants created through the API for this worker"""
+    try:
+        return data_seeder.seed()
+    except DataSeedingError as e:
+        pytest.skip(f"Data seeding failed: {e}")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Start the context of tests using ``landlord_session`` with the landlord's storage state"""
+    if fixturedef.argname == "context" and "landlord_session" in request.fixturenames:
+        storage_state = request.getfixturevalue("landlord_storage_state")
+        # pytest-playwright's context fixture applies the marker's arguments to browser.new_context
+        request.node.add_marker(pytest.mark.browser_context_args(storage_state=storage_state))
+
+@pytest.fixture
+def landlord_session(context, landlord_storage_state):
+    """Fixture for tests whose context starts logged in with the landlord session the data was seeded with.
+
+    The storage state is applied when the context is created (see
+    ``pytest_fixture_setup``), like the warm daemon's for ``authenticated`` tests.
+    """
+    return landlord_storage_state
 
 @pytest.fixture(scope="function")
 def slow_mo():
@@ -40,18 +670,355 @@ def test_logger(request, reports_helper):
 @pytest.fixture
 def screenshot_helper(page: Page, request, reports_helper):
     """Fixture to provide a ScreenshotHelper instance"""
-    return ScreenshotHelper(page, request.node.name)
+    return ScreenshotHelper(
+        page,
+        request.node.name,
+        policy=request.config.getoption("failure_capture"),
+        max_pixels=request.config.getoption("failure_capture_max_pixels")
+    )
 
 @pytest.fixture
 def page_load_helper(page: Page, request):
     """Fixture to provide a PageLoadHelper instance"""
     return PageLoadHelper(page, request.node.name)
 
+def _after_call(request, check):
+    """Register a check that runs once the test body has finished.
+
+    ``check(passed)`` records its results in the test's user properties and
+    returns a failure message or None. pytest_runtest_makereport runs the
+    checks on the call report and fails a passing test with their messages,
+    so a test is reported failed once instead of passed plus a teardown error.
+    The fixture calls the returned function in its teardown; it runs the check
+    only if setup failed before the test body ran.
+
+    Args:
+        request: Pytest request of the registering fixture
+        check: Callable taking whether the test body passed
+
+    Returns:
+        Callable running the check at most once and returning its message
+    """
+    results = []
+
+    def run(passed: bool = False):
+        if not results:
+            results.append(check(passed))
+        return results[0]
+
+    checks = request.node.__dict__.setdefault("llhub_after_call", [])
+    checks.append(run)
+    request.addfinalizer(lambda: checks.remove(run))
+    return run
+
+@pytest.fixture(autouse=True)
+def emulation_profile(request, pytestconfig):
+    """Fixture to throttle the test's page with the emulation marker's or the run's profile"""
+    marker = request.node.get_closest_marker("emulation")
+    name = marker.args[0] if marker else pytestconfig.getoption("emulation_profile")
+    if not name or "page" not in request.fixturenames:
+        yield None
+        return
+    if name not in PROFILES:
+        pytest.fail(f"Unknown emulation profile '{name}'. Available: {', '.join(sorted(PROFILES))}")
+    if request.getfixturevalue("browser_name") != "chromium":
+        if marker:
+            pytest.skip(f"Emulation profile '{name}' needs Chromium (CDP)")
+        yield None
+        return
+
+    profile = PROFILES[name]
+    emulation = EmulationHelper(request.getfixturevalue("page"), profile)
+    emulation.apply()
+    request.node.user_properties.append(("emulation_profile", name))
+
+    timeouts = get_timeout_service()
+    violations = []
+
+    def check_budget(action, route, duration_ms):
+        budget = profile.budget(action)
+        if budget is not None and duration_ms > budget:
+            violations.append(f"{action} on {TimeoutService.route_of(route or '/')}: "
+                              f"{duration_ms:.0f}ms > {budget}ms budget")
+
+    def report_violations(passed):
+        if not violations:
+            return None
+        request.node.user_properties.append(("budget_violations", list(violations)))
+        if pytestconfig.getoption("enforce_budgets"):
+            return f"Budgets of emulation profile '{name}' exceeded:\n" + "\n".join(violations)
+        return None
+
+    timeouts.profile = name
+    timeouts.observers.append(check_budget)
+    finish = _after_call(request, report_violations)
+    yield profile
+    finish()
+    timeouts.observers.remove(check_budget)
+    timeouts.profile = ""
+    emulation.reset()
+
+@pytest.fixture(autouse=True)
+def cpu_profile_results(request):
+    """Fixture to attach the CPU profiles taken during the test to its report"""
+    profiler = getattr(request.config, "llhub_cpu_profiler", None)
+    if profiler:
+        profiler.take_results()
+    yield
+    if profiler:
+        results = profiler.take_results()
+        if results:
+            request.node.user_properties.append(("cpu_profiles", results))
+
+@pytest.fixture(autouse=True)
+def selector_profile_results(request):
+    """Fixture to attach the selectors timed during the test to its report"""
+    profiler = getattr(request.config, "llhub_selector_profiler", None)
+    if profiler:
+        profiler.take_results()
+    yield
+    if profiler:
+        results = profiler.take_results()
+        if results:
+            request.node.user_properties.append(("selector_profile", results))
+
+@pytest.fixture(autouse=True)
+def visual_regression(request):
+    """Fixture to wait for the test's visual comparisons and fail the test on differences"""
+    visual = getattr(request.config, "llhub_visual", None)
+    if visual is None:
+        yield None
+        return
+
+    def report_differences(passed):
+        results = visual.collect()
+        if results:
+            request.node.user_properties.append(("visual", results))
+        failures = [result for result in results if result["status"] == "failed"]
+        if not failures:
+            return None
+        return "Visual differences:\n" + "\n".join(
+            f"  {result['name']}: {result['reason']}" + (f" (diff: {result['diff']})" if result["diff"] else "")
+            for result in failures
+        )
+
+    visual.collect()
+    finish = _after_call(request, report_differences)
+    yield visual
+    finish()
+
+@pytest.fixture(autouse=True)
+def round_trips(request):
+    """Fixture to count the test's browser round trips and enforce the round-trip budgets"""
+    counter = getattr(request.config, "llhub_round_trips", None)
+    if counter is None:
+        yield None
+        return
+
+    def report_round_trips(passed):
+        methods = counter.stop()
+        if methods:
+            request.node.user_properties.append(("round_trips", methods))
+        if not counter.violations:
+            return None
+        request.node.user_properties.append(("round_trip_violations", counter.violations))
+        return "Round-trip budgets exceeded:\n" + "\n".join(counter.violations)
+
+    counter.start()
+    finish = _after_call(request, report_round_trips)
+    yield counter
+    finish()
+
+def pytest_terminal_summary(terminalreporter, config):
+    """List budget violations, the hottest browser functions per route, round trips and selector costs"""
+    violations = {}
+    profiles = []
+    round_trips = []
+    selectors = []
+    visual = []
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "teardown":
+                continue
+            for key, value in getattr(report, "user_properties", []):
+                if key == "budget_violations":
+                    violations[report.nodeid] = value
+                elif key == "cpu_profiles":
+                    profiles.extend(value)
+                elif key == "round_trips":
+                    round_trips.append(value)
+                elif key == "selector_profile":
+                    selectors.extend(value)
+                elif key == "visual":
+                    visual.extend(value)
+                elif key == "round_trip_violations":
+                    violations[report.nodeid] = violations.get(report.nodeid, []) + value
+
+    if violations:
+        terminalreporter.section("Budget violations")
+        for nodeid, messages in sorted(violations.items()):
+            terminalreporter.write_line(nodeid)
+            for message in messages:
+                terminalreporter.write_line(f"    {message}")
+
+    if profiles:
+        terminalreporter.section("Browser CPU profile: top self time")
+        top_n = config.getoption("cpu_profile_top")
+        for label, functions in sorted(CpuProfiler.merge(profiles, top_n).items()):
+            terminalreporter.write_line(label)
+            for entry in functions:
+                location = f" ({entry['url']}:{entry['line']})" if entry["url"] else ""
+                terminalreporter.write_line(f"    {entry['self_ms']:>9.1f}ms  {entry['function']}{location}")
+        terminalreporter.write_line(f"📁 {len(profiles)} .cpuprofile file(s) saved to reports/cpu_profiles")
+
+    if round_trips:
+        terminalreporter.section("Browser round trips")
+        terminalreporter.write_line(f"{'calls':>6} {'trips':>7} {'avg':>6} {'max':>5} {'latency':>10}  method")
+        merged = RoundTripCounter.merge(round_trips)
+        for label, entry in sorted(merged.items(), key=lambda item: -item[1]["round_trips"]):
+            terminalreporter.write_line(
+                f"{entry['calls']:>6} {entry['round_trips']:>7} {entry['round_trips'] / entry['calls']:>6.1f} "
+                f"{entry['max_round_trips']:>5} {entry['latency_ms']:>8.0f}ms  {label}"
+            )
+
+    if selectors:
+        terminalreporter.section("Selector cost")
+        ranked = SelectorProfiler().rank(SelectorProfiler.merge(selectors))
+        terminalreporter.write_line(f"{'total':>9} {'avg':>7} {'uses':>5} {'max#':>5}  route / selector")
+        for entry in ranked[:config.getoption("selector_profile_top")]:
+            terminalreporter.write_line(
+                f"{entry['total_cost_ms']:>7.1f}ms {entry['avg_cost_ms']:>5.2f}ms {entry['uses']:>5} "
+                f"{entry['max_matches']:>5}  {entry['route']} {entry['selector']}"
+            )
+            if entry["suggestion"]:
+                terminalreporter.write_line(f"{'':>30}💡 {entry['suggestion']}")
+        if not hasattr(config, "workerinput"):
+            terminalreporter.write_line(f"🔎 Selector profile: {SelectorProfiler.save_report(ranked)}")
+
+    if visual:
+        terminalreporter.section("Visual regression")
+        statuses = {}
+        for result in visual:
+            statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+        terminalreporter.write_line("🖼️  " + ", ".join(f"{count} {status}" for status, count in sorted(statuses.items())))
+        for result in visual:
+            if result["status"] == "failed":
+                terminalreporter.write_line(f"    ❌ {result['name']}: {result['reason']}")
+                if result["diff"]:
+                    terminalreporter.write_line(f"       {result['diff']}")
+
+@pytest.fixture(autouse=True)
+def error_sentinel(request):
+    """Fixture to install the in-page error sentinel before the test's pages load"""
+    if "page" not in request.fixturenames:
+        return
+    ErrorSentinel.install(request.getfixturevalue("context"))
+
+@pytest.fixture(autouse=True)
+def browser_events(request, pytestconfig):
+    """Fixture to collect console and network events of the test's pages from context creation"""
+    if "page" not in request.fixturenames:
+        yield None
+        return
+
+    collector = BrowserEventCollector(
+        request.getfixturevalue("context"),
+        request.node.name,
+        max_events=pytestconfig.getoption("browser_events_size")
+    )
+    request.node.browser_events = collector
+
+    def report_errors(passed):
+        if not passed or not pytestconfig.getoption("fail_on_browser_errors"):
+            return None
+        errors = collector.errors()
+        if not errors:
+            return None
+        path = collector.dump("errors")
+        details = "\n".join(
+            f"  [{event['kind']}] {event.get('status', '')} {event.get('text') or event.get('url', '')}".rstrip()
+            for event in errors[:10]
+        )
+        return f"{len(errors)} browser error(s) during the test:\n{details}\nEvents: {path}"
+
+    finish = _after_call(request, report_errors)
+    yield collector
+    finish()
+    collector.close()
+
+@pytest.fixture(autouse=True)
+def failure_trace(request, pytestconfig):
+    """Fixture to trace browser tests into a rolling chunk buffer"""
+    if not pytestconfig.getoption("failure_trace") or "page" not in request.fixturenames:
+        yield None
+        return
+
+    context = request.getfixturevalue("context")
+    trace_buffer = TraceBuffer(
+        context,
+        request.node.name,
+        max_chunks=pytestconfig.getoption("failure_trace_chunks"),
+        screenshots=not pytestconfig.getoption("failure_trace_no_screenshots"),
+        snapshots=not pytestconfig.getoption("failure_trace_no_snapshots"),
+        sources=pytestconfig.getoption("failure_trace_sources")
+    )
+    trace_buffer.start()
+    request.node.trace_buffer = trace_buffer
+    TraceBuffer.active = trace_buffer
+    yield trace_buffer
+    TraceBuffer.active = None
+    try:
+        # The teardown chunk of a failed test belongs with the chunks persisted on failure
+        if getattr(request.node, "llhub_trace_persisted", False):
+            for trace_path in trace_buffer.persist():
+                print(f"\n🧵 Teardown trace captured: {trace_path}")
+    except Exception as e:
+        print(f"Failed to persist trace: {e}")
+    finally:
+        trace_buffer.close()
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Hook to capture screenshots on test failures"""
+    """Hook to capture screenshots, traces and browser events on test failures"""
     outcome = yield
     rep = outcome.get_result()
+    trace_buffer = getattr(item, "trace_buffer", None)
+
+    if rep.when == "call":
+        # Budget, visual and browser error checks fail the call phase of otherwise passing tests
+        messages = [check(rep.passed) for check in getattr(item, "llhub_after_call", [])]
+        messages = [message for message in messages if message]
+        if messages and rep.passed:
+            rep.outcome = "failed"
+            rep.longrepr = "\n\n".join(messages)
+
+    # Keep the browser events of failed tests as JSONL
+    browser_events = getattr(item, "browser_events", None)
+    if browser_events and rep.when == "call" and rep.failed:
+        try:
+            print(f"\n📜 Browser events captured on failure: {browser_events.dump('failure')}")
+        except Exception as e:
+            print(f"Failed to write browser events: {e}")
+
+    # Start a fresh trace chunk for the test body once setup has finished
+    if trace_buffer and rep.when == "setup" and rep.passed:
+        trace_buffer.checkpoint("call")
+
+    # Persist the buffered trace chunks only when the test body failed
+    if trace_buffer and rep.when == "call" and rep.failed:
+        try:
+            for trace_path in trace_buffer.persist():
+                print(f"\n🧵 Trace captured on failure: {trace_path}")
+            item.llhub_trace_persisted = True
+        except Exception as e:
+            print(f"Failed to persist trace: {e}")
+
+    # Trace teardown in a chunk of its own
+    if trace_buffer and rep.when == "call":
+        try:
+            trace_buffer.checkpoint("teardown")
+        except Exception as e:
+            print(f"Failed to start the teardown trace chunk: {e}")
     
     # Only capture screenshots on failures, not on skips or passes
     if rep.when == "call" and rep.failed:
@@ -63,15 +1030,20 @@ def pytest_runtest_makereport(item, call):
             try:
                 # Create screenshot helper
                 from helpers.screenshot import ScreenshotHelper
-                screenshot_helper = ScreenshotHelper(page, test_name)
+                screenshot_helper = ScreenshotHelper(
+                    page,
+                    test_name,
+                    policy=item.config.getoption("failure_capture"),
+                    max_pixels=item.config.getoption("failure_capture_max_pixels")
+                )
                 
-                # Take screenshot on failure
+                # Take screenshot on failure, clipped to the failing locator when the error names one
                 screenshot_path = screenshot_helper.take_error_screenshot(
                     page_path="test_failure", 
                     error_message=rep.longreprtext[:50] if rep.longreprtext else "test_failed",
-                    full_page=True
+                    selector=ScreenshotHelper.failing_selector(rep.longreprtext)
                 )
-                print(f"\n📸 Screenshot captured on failure: {screenshot_path}")
+                print(f"\n📸 Screenshot captured on failure ({screenshot_helper.last_capture['policy']}): {screenshot_path}")
                 
             except Exception as e:
                 print(f"Failed to capture screenshot: {e}")
\ No newline at end of file
@@ -1,33 +1,29 @@
-import os
-from dotenv import load_dotenv
 import pytest
 from playwright.sync_api import expect, TimeoutError, Page
 from pom.admin_page import AdminPage
 
-# Load environment variables
-load_dotenv(override=True)
-
 @pytest.fixture
 def admin_page(page: Page, base_url: str):
     """Fixture to provide an AdminPage instance"""
     return AdminPage(page, base_url)
 
 @pytest.fixture
-def admin_credentials():
+def admin_credentials(lease_account):
     """Fixture to provide admin credentials"""
-    email = os.getenv('ADMIN_USER_EMAIL')
-    password = os.getenv('ADMIN_USER_PASSWORD')
+    credentials = lease_account("admin")
     
-    if not email or not password:
+    if not credentials:
         pytest.fail("ADMIN_USER_EMAIL and ADMIN_USER_PASSWORD must be set in .env file")
     
-    return {"email": email, "password": password}
+    return credentials.as_dict()
 
-def test_successful_login(admin_page: AdminPage, admin_credentials: dict, page_load_helper, test_logger):
+def test_successful_login(admin_page: AdminPage, admin_credentials: dict, page_load_helper, test_logger,
+                          login_breaker):
     """Test successful login with valid credentials"""
     test_logger.info("Starting login test")
-    admin_page.navigate_to_login()
-    admin_page.login(admin_credentials["email"], admin_credentials["password"])
+    with login_breaker.guard(admin_credentials["email"]):
+        admin_page.navigate_to_login()
+        admin_page.login(admin_credentials["email"], admin_credentials["password"])
     
     # Verify login success with comprehensive page load check
     page_load_helper.verify_page_loaded(
@@ -36,6 +32,7 @@ def test_successful_login(admin_page: AdminPage, admin_credentials: dict, page_l
     )
     test_logger.info("Login test completed successfully")
 
+@pytest.mark.authenticated("admin")
 @pytest.mark.parametrize("page_path", [
     #  "/welcome",
     "/status",
@@ -46,13 +43,17 @@ def test_successful_login(admin_page: AdminPage, admin_credentials: dict, page_l
     #  "/admin/reports"
 ])
 def test_admin_pages_load(admin_page: AdminPage, admin_credentials: dict, 
-                         page_load_helper, screenshot_helper, test_logger, page_path: str):
+                         page_load_helper, screenshot_helper, test_logger, login_breaker, pre_authenticated,
+                         page_path: str):
     """Test that admin pages load correctly after login"""
     test_logger.info(f"Testing page: {page_path}")
     
-    # First login as admin
-    admin_page.navigate_to_login()
-    admin_page.login(admin_credentials["email"], admin_credentials["password"])
+    # First login as admin (unless the watch daemon's context already is) -
+    # fails fast once a login of this account failed definitively
+    if not pre_authenticated:
+        with login_breaker.guard(admin_credentials["email"]):
+            admin_page.navigate_to_login()
+            admin_page.login(admin_credentials["email"], admin_credentials["password"])
     
     # Test the specific page
     try:
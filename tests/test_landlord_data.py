@@ -0,0 +1,31 @@
+import pytest
+from playwright.sync_api import expect
+from pom.landlord_page import LandlordPage
+from helpers.landlord_fixture import landlord_page
+
+def test_property_page_lists_seeded_properties(landlord_page: LandlordPage, landlord_session, seeded_data: dict,
+                                               page_load_helper, test_logger):
+    """Test that the properties seeded through the API are listed on the property page"""
+    test_logger.info(f"Checking {len(seeded_data['properties'])} seeded properties")
+    landlord_page.navigate_to_property()
+    page_load_helper.verify_page_loaded(expected_url=f"{landlord_page.base_url}/property")
+
+    for record in seeded_data["properties"]:
+        expect(landlord_page.page.get_by_text(record["name"], exact=True).first).to_be_visible()
+    test_logger.info("All seeded properties are listed")
+
+def test_tenants_search_finds_seeded_tenant(landlord_page: LandlordPage, landlord_session, seeded_data: dict,
+                                            page_load_helper, test_logger):
+    """Test that searching the tenants page for a seeded tenant's name finds that tenant"""
+    if not seeded_data["tenants"]:
+        pytest.skip("No tenants were seeded")
+    name = seeded_data["tenants"][0]["name"]
+    test_logger.info(f"Searching for seeded tenant: {name}")
+
+    landlord_page.navigate_to_tenants()
+    page_load_helper.verify_page_loaded(expected_url=f"{landlord_page.base_url}/tenants")
+    landlord_page.search_tenants(name)
+    page_load_helper.wait_for_count_stable(LandlordPage.TENANT_CARD_SELECTOR)
+
+    expect(landlord_page.page.locator(LandlordPage.TENANT_CARD_SELECTOR).filter(has_text=name).first).to_be_visible()
+    test_logger.info("Seeded tenant found by search")
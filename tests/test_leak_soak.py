@@ -0,0 +1,39 @@
+import pytest
+from pom.landlord_page import LandlordPage
+from helpers.landlord_fixture import landlord_page, landlord_credentials
+from helpers.leak_soak import LeakSoak
+
+# Landlord routes a long-lived session keeps switching between
+LANDLORD_ROUTES = ["/welcome", "/property", "/tenants", "/expense", "/income/history", "/cashflow"]
+
+@pytest.mark.slow
+@pytest.mark.authenticated("landlord")
+def test_landlord_routes_do_not_leak(landlord_page: LandlordPage, landlord_credentials: dict, browser_name: str,
+                                     pytestconfig, test_logger, login_breaker, pre_authenticated):
+    """Soak test: cycle through the landlord routes and check heap, DOM node and listener growth"""
+    iterations = pytestconfig.getoption("leak_soak")
+    if not iterations:
+        pytest.skip("Leak soak runs only with --leak-soak ITERATIONS")
+    if browser_name != "chromium":
+        pytest.skip("Leak soak needs Chromium (CDP)")
+
+    try:
+        if not pre_authenticated:
+            with login_breaker.guard(landlord_credentials["email"]):
+                landlord_page.navigate_to_login()
+                landlord_page.login(landlord_credentials["email"], landlord_credentials["password"])
+    except Exception as e:
+        pytest.skip(f"Leak soak skipped - login failed, credentials may be invalid: {e}")
+
+    soak = LeakSoak(landlord_page.page, landlord_page.base_url, LANDLORD_ROUTES, iterations=iterations)
+    analysis = soak.run()
+    report_path = soak.save_report(analysis)
+    test_logger.info(f"Leak soak after {iterations} loops:\n{LeakSoak.format_summary(analysis)}")
+    test_logger.info(f"Leak soak report saved to: {report_path}")
+
+    leaks = LeakSoak.leaking_routes(analysis)
+    assert not leaks, (
+        "Steady growth after forced GC on: "
+        + ", ".join(f"{route} ({', '.join(metrics)})" for route, metrics in leaks.items())
+        + f"\nReport: {report_path}"
+    )
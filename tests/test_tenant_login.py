@@ -8,19 +8,14 @@ def tenant_page(page, base_url: str):
     return TenantPage(page, base_url)
 
 @pytest.fixture
-def tenant_credentials():
+def tenant_credentials(lease_account):
     """Fixture to provide tenant credentials"""
-    import os
-    from dotenv import load_dotenv
-    load_dotenv(override=True)
+    credentials = lease_account("tenant")
     
-    email = os.getenv('TenantA_USER_EMAIL')
-    password = os.getenv('TenantA_USER_PASSWORD')
-    
-    if not email or not password:
+    if not credentials:
         pytest.fail("TenantA_USER_EMAIL and TenantA_USER_PASSWORD must be set in .env file")
     
-    return {"email": email, "password": password}
+    return credentials.as_dict()
 
 def test_login_page_loads(tenant_page: TenantPage, test_logger):
     """Test that the login page loads correctly"""
@@ -37,13 +32,15 @@ def test_login_page_loads(tenant_page: TenantPage, test_logger):
     
     test_logger.info("Tenant login page loaded successfully")
 
-def test_successful_login(tenant_page: TenantPage, tenant_credentials: dict, page_load_helper, test_logger):
+def test_successful_login(tenant_page: TenantPage, tenant_credentials: dict, page_load_helper, test_logger,
+                          login_breaker):
     """Test successful login with valid credentials"""
     test_logger.info("Starting tenant login test")
-    tenant_page.navigate_to_login()
     
     try:
-        tenant_page.login(tenant_credentials["email"], tenant_credentials["password"])
+        with login_breaker.guard(tenant_credentials["email"]):
+            tenant_page.navigate_to_login()
+            tenant_page.login(tenant_credentials["email"], tenant_credentials["password"])
         
         # Verify login success - check that we're no longer on login page
         current_url = tenant_page.page.url
@@ -55,7 +52,7 @@ def test_successful_login(tenant_page: TenantPage, tenant_credentials: dict, pag
         
     except Exception as e:
         test_logger.warning(f"Tenant login test failed (likely due to invalid credentials): {str(e)}")
-        pytest.skip("Tenant login test skipped - credentials may be invalid or application not running")
+        pytest.skip(f"Tenant login test skipped - credentials may be invalid or application not running: {e}")
 
 def test_invalid_login(tenant_page: TenantPage, test_logger):
     """Test login with invalid credentials"""
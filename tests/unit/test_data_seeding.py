@@ -0,0 +1,95 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from helpers.data_seeding import DataSeeder, DataSeedingError
+
+class FakeApi(BaseHTTPRequestHandler):
+    """JSON API for properties and tenants that records its requests and their concurrency"""
+    lock = threading.Lock()
+
+    def _answer(self, status: int, body=None, content_type: str = "application/json"):
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _track(self):
+        server = self.server
+        with self.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.log.append((self.command, self.path))
+        # Slow enough for concurrent requests to overlap
+        time.sleep(0.1)
+        with self.lock:
+            server.in_flight -= 1
+
+    def do_GET(self):
+        if self.path in ("/api/v1/properties", "/api/v1/tenants"):
+            self._answer(200, [])
+        else:
+            self._answer(200, "<html></html>", content_type="text/html")
+
+    def do_POST(self):
+        self._track()
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.lock:
+            self.server.next_id += 1
+            record_id = self.server.next_id
+        self._answer(201, {"id": record_id, "name": body["name"]})
+
+    def do_DELETE(self):
+        self._track()
+        self._answer(204)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeApi)
+    server.in_flight = server.max_in_flight = server.next_id = 0
+    server.log = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def _seeder(server, **api_paths):
+    """Build a seeder for the fake API (skipped when the Playwright driver cannot start)."""
+    try:
+        return DataSeeder(f"http://127.0.0.1:{server.server_port}", api_paths, prefix="t")
+    except Exception as e:
+        pytest.skip(f"Playwright driver not available: {e}")
+
+def test_seed_and_cleanup_send_requests_together(api):
+    """Records of one kind are created and deleted concurrently, dependents deleted first"""
+    seeder = _seeder(api, property="/api/v1/properties", tenant="/api/v1/tenants")
+    data = seeder.seed(properties=3, tenants=4)
+    assert [record["name"] for record in data["properties"]] == ["t-property-1", "t-property-2", "t-property-3"]
+    assert all(record["propertyId"] == data["properties"][0]["id"] for record in data["tenants"])
+    assert api.max_in_flight > 1
+
+    creates = [path for method, path in api.log if method == "POST"]
+    assert creates == ["/api/v1/properties"] * 3 + ["/api/v1/tenants"] * 4
+    assert seeder.cleanup() == []
+    deletes = [path for method, path in api.log if method == "DELETE"]
+    assert len(deletes) == 7
+    assert all(path.startswith("/api/v1/tenants/") for path in deletes[:4])
+    assert all(path.startswith("/api/v1/properties/") for path in deletes[4:])
+
+def test_unconfigured_or_unserved_routes_fail_before_creating(api):
+    """Missing route settings and HTML answers stop the seeding before any record is created"""
+    seeder = _seeder(api, property="/api/v1/properties")
+    with pytest.raises(DataSeedingError, match="TENANT_API_PATH"):
+        seeder.seed()
+    seeder.api_paths["tenant"] = "/tenants"
+    with pytest.raises(DataSeedingError, match="text/html"):
+        seeder.seed()
+    assert not [method for method, _ in api.log if method == "POST"]
+    assert seeder.cleanup() == []
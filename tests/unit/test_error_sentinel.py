@@ -0,0 +1,105 @@
+import logging
+import pytest
+from helpers.error_sentinel import ErrorSentinel
+
+class StubPage:
+    """Page returning a fixed sentinel state from ``evaluate``"""
+    url = "https://app.test/property"
+
+    def __init__(self, state):
+        self.state = state
+        self.calls = []
+
+    def evaluate(self, expression, arg=None):
+        self.calls.append(arg)
+        if isinstance(self.state, Exception):
+            raise self.state
+        return self.state
+
+def _state(entries=(), visible=()):
+    return {"entries": list(entries), "dropped": 0, "visible": list(visible)}
+
+def test_verify_without_sentinel_falls_back():
+    """Pages without the sentinel (or that cannot be evaluated) are left to polling"""
+    assert ErrorSentinel(StubPage(None)).verify() is False
+    assert ErrorSentinel(StubPage(RuntimeError("Target closed"))).verify() is False
+
+def test_verify_passes_and_drains(caplog):
+    """Uncaught errors and rejections are only logged, and the buffer is drained"""
+    page = StubPage(_state([{"kind": "rejection", "text": "TypeError: x is undefined"}]))
+    logger = logging.getLogger("sentinel-test")
+    with caplog.at_level(logging.WARNING, logger="sentinel-test"):
+        assert ErrorSentinel(page, logger).verify() is True
+    assert page.calls == [True]
+    assert "Page rejection: TypeError: x is undefined" in caplog.text
+
+def test_verify_fails_on_error_texts_and_failed_requests():
+    """Flashed and still visible error texts and failed requests fail with their details"""
+    page = StubPage(_state(
+        entries=[{"kind": "text", "text": "Server Error", "element": "div.alert"},
+                 {"kind": "fetch", "url": "https://app.test/api/properties", "status": 502}],
+        visible=[{"kind": "text", "text": "404 Not Found", "element": "h1"}]
+    ))
+    with pytest.raises(AssertionError) as error:
+        ErrorSentinel(page).verify()
+
+    message = str(error.value)
+    assert message.startswith("Error state detected on https://app.test/property")
+    assert "[text] 'Server Error' in div.alert" in message
+    assert "[fetch] 502 https://app.test/api/properties" in message
+    assert "[text] '404 Not Found' in h1" in message
+
+@pytest.fixture(scope="module")
+def chromium():
+    """Headless Chromium (skipped when no browser can be launched)"""
+    sync_api = pytest.importorskip("playwright.sync_api")
+    with sync_api.sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            pytest.skip(f"Chromium not available: {e}")
+        yield browser
+        browser.close()
+
+@pytest.fixture
+def browser_page(chromium):
+    """Fresh page, so each test starts its own sentinel"""
+    page = chromium.new_page()
+    yield page
+    page.close()
+
+def _load(page, body: str):
+    """Render a page and start the sentinel in it."""
+    page.set_content(f"<html><body>{body}</body></html>")
+    page.add_script_tag(content=ErrorSentinel.script())
+
+def test_sentinel_records_added_error_nodes(browser_page):
+    """An error node added to the page fails verification, even when removed before the check"""
+    _load(browser_page, "<main><h1>Properties</h1></main>")
+    sentinel = ErrorSentinel(browser_page)
+    assert sentinel.verify() is True
+
+    browser_page.evaluate("""() => new Promise(resolve => {
+        const alert = document.createElement('div');
+        alert.className = 'alert';
+        alert.textContent = 'Server Error';
+        document.querySelector('main').appendChild(alert);
+        setTimeout(() => { alert.remove(); resolve(); }, 50);
+    })""")
+    with pytest.raises(AssertionError, match=r"\[text\] 'Server Error' in div\.alert"):
+        sentinel.verify()
+    assert sentinel.verify() is True
+
+def test_sentinel_records_revealed_error_nodes(browser_page):
+    """A hidden error shown by an attribute change fails verification; hidden ones do not"""
+    _load(browser_page, '<main><p id="notice" hidden>404 Not Found</p></main>')
+    sentinel = ErrorSentinel(browser_page)
+    assert sentinel.verify() is True
+
+    browser_page.evaluate("""() => new Promise(resolve => {
+        const notice = document.getElementById('notice');
+        notice.hidden = false;
+        setTimeout(() => { notice.hidden = true; resolve(); }, 50);
+    })""")
+    with pytest.raises(AssertionError, match=r"\[text\] '404 Not Found' in p#notice"):
+        sentinel.verify()
@@ -0,0 +1,83 @@
+import textwrap
+from helpers.impact import ImpactAnalyzer
+
+def write(root, path, source):
+    target = root / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(textwrap.dedent(source))
+
+def line_of(analyzer, path, name):
+    """First body line of a method or function"""
+    info = analyzer.modules[path]
+    start, _ = info["methods"][name]["lines"] if name in info["methods"] else info["functions"][name]
+    return start + 1
+
+def test_cross_module_helper_change(tmp_path):
+    """A helper method change reaches tests through page object methods of another module"""
+    write(tmp_path, "helpers/sentinel.py", """
+        class Sentinel:
+            def verify(self):
+                return True
+
+            def unused(self):
+                return False
+    """)
+    write(tmp_path, "pom/home_page.py", """
+        from helpers.sentinel import Sentinel
+
+        class HomePage:
+            def _verify(self):
+                return Sentinel().verify()
+
+            def navigate_to_page(self, path):
+                return self._verify()
+
+            def logout(self):
+                return None
+    """)
+    write(tmp_path, "tests/test_home.py", """
+        from pom.home_page import HomePage
+
+        def test_navigation():
+            HomePage().navigate_to_page("/home")
+
+        def test_logout():
+            HomePage().logout()
+    """)
+    analyzer = ImpactAnalyzer(str(tmp_path))
+
+    changes = {"helpers/sentinel.py": {line_of(analyzer, "helpers/sentinel.py", "verify")}}
+    assert analyzer.affected_tests(changes) == {("tests/test_home.py", "test_navigation")}
+
+    changes = {"helpers/sentinel.py": {line_of(analyzer, "helpers/sentinel.py", "unused")}}
+    assert analyzer.affected_tests(changes) == set()
+
+def test_unresolved_caller_impacts_whole_module(tmp_path):
+    """A changed function read at module level changes every test of the reading module"""
+    write(tmp_path, "helpers/routes.py", """
+        def home_route():
+            return "/home"
+    """)
+    write(tmp_path, "tests/test_routes.py", """
+        from helpers.routes import home_route
+
+        ROUTE = home_route()
+
+        def test_home():
+            assert ROUTE
+
+        def test_other():
+            assert True
+    """)
+    analyzer = ImpactAnalyzer(str(tmp_path))
+
+    changes = {"helpers/routes.py": {line_of(analyzer, "helpers/routes.py", "home_route")}}
+    assert analyzer.affected_tests(changes) == {("tests/test_routes.py", "test_home"),
+                                                ("tests/test_routes.py", "test_other")}
+
+def test_repo_helper_change_selects_navigation_tests(pytestconfig):
+    """Editing ErrorSentinel.verify or TimeoutService.timeout selects the landlord navigation tests"""
+    analyzer = ImpactAnalyzer(str(pytestconfig.rootpath))
+    for path, name in (("helpers/error_sentinel.py", "verify"), ("helpers/timeouts.py", "timeout")):
+        affected = analyzer.affected_tests({path: {line_of(analyzer, path, name)}})
+        assert ("tests/test_landlord_login.py", "test_landlord_pages_load") in affected
@@ -0,0 +1,25 @@
+from helpers.leak_soak import LeakSoak
+
+def test_slope_is_growth_per_step():
+    """The least-squares slope of a linear series is its step, noise around it averages out"""
+    assert LeakSoak.slope([5, 7, 9, 11]) == 2
+    assert LeakSoak.slope([3, 3, 3]) == 0
+    assert LeakSoak.slope([10]) == 0.0
+    assert abs(LeakSoak.slope([0, 12, 18, 30, 42]) - 10.2) < 1e-9
+
+def test_analyze_attributes_growth_to_the_leaking_route():
+    """Only the route whose visits keep leaving nodes and listeners behind is flagged"""
+    soak = LeakSoak(None, "https://app.test", ["/welcome", "/property", "/tenants"], iterations=10, warmup=2)
+    for metrics in soak.samples.values():
+        for name in LeakSoak.METRICS:
+            # Caches fill on the first loops, later visits release what they built
+            metrics[name].extend([40000, 20000] + [0, 1, -1, 0, 1, -1, 0, 0])
+    soak.samples["/property"]["Nodes"] = [300, 100] + [12] * 8
+    soak.samples["/property"]["JSEventListeners"] = [30, 10] + [2] * 8
+
+    analysis = soak.analyze()
+    assert LeakSoak.leaking_routes(analysis) == {"/property": ["Nodes", "JSEventListeners"]}
+    assert analysis["/property"]["Nodes"]["growth_per_loop"] == 12
+    assert analysis["/property"]["Nodes"]["retained"] == 96
+    assert abs(analysis["/tenants"]["JSHeapUsedSize"]["growth_per_loop"]) < 1
+    assert "LEAK" in LeakSoak.format_summary(analysis).splitlines()[2]
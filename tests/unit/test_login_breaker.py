@@ -0,0 +1,50 @@
+import pytest
+from helpers.login_breaker import LoginCircuitBreaker, LoginCircuitOpenError
+
+REDIRECT_TIMEOUT = ("Timeout 30000ms exceeded.\n=========================== logs ===========================\n"
+                    "waiting for navigation to \"https://app.test/welcome\" until \"load\"")
+
+def test_is_definitive(tmp_path):
+    """Error messages and an unreachable app are definitive; timeouts and missing elements are not"""
+    breaker = LoginCircuitBreaker(str(tmp_path))
+    assert breaker.is_definitive(Exception("Login failed with error message. Current URL: https://app.test/login"))
+    assert breaker.is_definitive(Exception("Page.goto: net::ERR_CONNECTION_REFUSED at https://app.test/login"))
+    assert breaker.is_definitive(Exception("Page.goto: net::ERR_NAME_NOT_RESOLVED at https://app.test/login"))
+    assert not breaker.is_definitive(Exception("Could not find email input field"))
+    assert not breaker.is_definitive(Exception(REDIRECT_TIMEOUT))
+    assert breaker.is_redirect_timeout(Exception(REDIRECT_TIMEOUT))
+    assert breaker.is_redirect_timeout(Exception("Login failed - still on login page. Current URL: https://app.test/login"))
+
+def _login(breaker, account, error=None):
+    """Run one guarded login that fails with ``error`` (or succeeds)."""
+    with breaker.guard(account):
+        if error:
+            raise error
+
+def test_definitive_failure_trips_only_its_account(tmp_path):
+    """A connection error opens the circuit of that account right away, with its diagnosis"""
+    breaker = LoginCircuitBreaker(str(tmp_path))
+    with pytest.raises(Exception):
+        _login(breaker, "a@example.com", Exception("Page.goto: net::ERR_CONNECTION_REFUSED at https://app.test/login"))
+
+    with pytest.raises(LoginCircuitOpenError, match="ERR_CONNECTION_REFUSED"):
+        _login(breaker, "a@example.com")
+    _login(breaker, "b@example.com")
+
+def test_repeated_redirect_timeouts_trip_with_the_first_diagnosis(tmp_path):
+    """Consecutive redirect timeouts open the circuit; a successful login in between resets the streak"""
+    breaker = LoginCircuitBreaker(str(tmp_path), redirect_timeouts=2)
+    with pytest.raises(Exception):
+        _login(breaker, "a@example.com", Exception(REDIRECT_TIMEOUT))
+    _login(breaker, "a@example.com")
+    with pytest.raises(Exception):
+        _login(breaker, "a@example.com", Exception(REDIRECT_TIMEOUT))
+    assert breaker.diagnosis("a@example.com") is None
+
+    with pytest.raises(Exception):
+        _login(breaker, "a@example.com", Exception("Login failed - still on login page. Current URL: x"))
+    diagnosis = breaker.diagnosis("a@example.com")
+    assert diagnosis.startswith("Timeout 30000ms exceeded. waiting for navigation to")
+    assert "2 login redirect timeouts in a row" in diagnosis
+    with pytest.raises(LoginCircuitOpenError):
+        _login(breaker, "a@example.com")
@@ -0,0 +1,48 @@
+import pytest
+from playwright.sync_api import Error
+from helpers.page_load import PageLoadHelper
+
+NAVIGATED = "Page.evaluate: Execution context was destroyed, most likely because of a navigation"
+
+class StubPage:
+    """Page whose ``evaluate`` raises the queued errors before resolving"""
+    url = "https://app.test/tenants"
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.evaluations = 0
+        self.load_states = []
+
+    def evaluate(self, expression, arg=None):
+        self.evaluations += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return None
+
+    def wait_for_load_state(self, state, timeout=None):
+        self.load_states.append(state)
+
+@pytest.fixture
+def in_tmp(tmp_path, monkeypatch):
+    # TestLogger writes to reports/logs relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+def test_dom_stable_settles_again_after_a_navigation(in_tmp):
+    """A navigation during the wait reruns it on the new document instead of failing the test"""
+    page = StubPage(Error(NAVIGATED))
+    helper = PageLoadHelper(page, "nav")
+    assert helper.wait_for_dom_stable(quiet_ms=50, timeout=1000) is True
+    assert page.evaluations == 2
+    assert page.load_states == ["domcontentloaded"]
+    assert helper.wait_log[-1]["ok"] is True
+
+def test_repeated_navigation_counts_as_not_settled(in_tmp):
+    """A second navigation ends the wait as not met; other errors still propagate"""
+    page = StubPage(Error(NAVIGATED), Error(NAVIGATED))
+    assert PageLoadHelper(page, "nav").wait_for_dom_stable(timeout=1000) is False
+    assert page.evaluations == 2
+
+    with pytest.raises(Error, match="SyntaxError"):
+        PageLoadHelper(StubPage(Error("Page.evaluate: SyntaxError: Unexpected token")), "nav").wait_for_dom_stable(
+            timeout=1000
+        )
@@ -0,0 +1,54 @@
+import base64
+import pytest
+from helpers.screenshot import ScreenshotHelper
+
+# 1x1 PNG written by the stub page's screenshots
+PIXEL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+)
+
+@pytest.mark.parametrize("error_text, selector", [
+    ('Locator.click: Timeout 30000ms exceeded.\nCall log:\n  - waiting for locator("#save")', "#save"),
+    ('Timeout 5000ms exceeded.\n  - waiting for locator(".card").locator("button.view")', ".card >> button.view"),
+    ('  - waiting for locator(".tenant-card").first', ".tenant-card"),
+    ('  - waiting for locator("button:has-text(\\"Save\\")")', 'button:has-text("Save")'),
+    ('Page.click: Timeout 30000ms exceeded.\n  - waiting for selector "input[name=\\"email\\"]"', 'input[name="email"]'),
+    ('  - waiting for locator("#old")\n  - locator resolved\n  - waiting for locator("#new")', "#new"),
+    ('  - waiting for get_by_text("Save")', None),
+    ("AssertionError: assert 1 == 2", None),
+    ("", None)
+])
+def test_failing_selector(error_text, selector):
+    """The selector comes from the last 'waiting for' line of Playwright's call log"""
+    assert ScreenshotHelper.failing_selector(error_text) == selector
+
+class StubPage:
+    """Page with a fixed document size that records screenshot options"""
+
+    def __init__(self, width: int, height: int):
+        self.size = [width, height]
+        self.screenshots = []
+
+    def evaluate(self, expression):
+        return self.size
+
+    def screenshot(self, **options):
+        self.screenshots.append(options)
+        with open(options["path"], "wb") as image_file:
+            image_file.write(PIXEL_PNG)
+
+def test_full_capture_is_cut_at_max_pixels(tmp_path, monkeypatch):
+    """Full-page captures of pages over max_pixels keep the page width and cut the height"""
+    monkeypatch.chdir(tmp_path)
+    page = StubPage(1000, 10000)
+    helper = ScreenshotHelper(page, "test_full", max_pixels=2_000_000)
+
+    helper.capture("long", policy="full")
+    assert page.screenshots[-1]["full_page"] is True
+    assert page.screenshots[-1]["clip"] == {"x": 0, "y": 0, "width": 1000, "height": 2000}
+    assert helper.last_capture == {"policy": "full (cut)", "selector": None}
+
+    page.size = [1000, 1500]
+    helper.capture("short", policy="full")
+    assert "clip" not in page.screenshots[-1]
+    assert helper.last_capture["policy"] == "full"
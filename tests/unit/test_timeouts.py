@@ -0,0 +1,27 @@
+from helpers.run_history import RunHistory
+from helpers.timeouts import TimeoutService
+
+def test_percentile_nearest_rank():
+    """The percentile is the nearest-rank value of the sorted durations"""
+    durations = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+    assert TimeoutService(percentile=95)._percentile(durations) == 100
+    assert TimeoutService(percentile=50)._percentile(durations) == 50
+    assert TimeoutService(percentile=90)._percentile(durations) == 90
+    assert TimeoutService(percentile=0)._percentile(durations) == 10
+    assert TimeoutService(percentile=99)._percentile([250]) == 250
+
+def test_settled_waits_are_not_learned(tmp_path):
+    """Near-0 ms waits on already idle pages neither get recorded nor lower the learned timeout"""
+    history = RunHistory(str(tmp_path / "history.db"))
+    # Rows written before settled waits were left out
+    history.record_timings([("/dashboard", "networkidle", 1.0, "")] * 20)
+
+    recorder = TimeoutService(history)
+    for duration_ms in (900, 1000, 1100, 1200, 1300):
+        recorder.record("networkidle", "https://app.test/dashboard", duration_ms)
+    recorder.record("networkidle", "https://app.test/dashboard", 2.0)
+    recorder.flush()
+    assert len(history.timing_samples()[("/dashboard", "networkidle", "")]) == 25
+
+    service = TimeoutService(history, apply=True, percentile=50, multiplier=3, floor_ms=0)
+    assert service.timeout("networkidle", "/dashboard", default=30000) == 3300
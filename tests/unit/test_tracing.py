@@ -0,0 +1,60 @@
+from helpers.tracing import TraceBuffer
+
+class StubTracing:
+    """Tracing API writing an empty zip per stopped chunk"""
+
+    def __init__(self):
+        self.titles = []
+
+    def start(self, **kwargs):
+        pass
+
+    def start_chunk(self, title=None):
+        self.titles.append(title)
+
+    def stop_chunk(self, path=None):
+        if path:
+            open(path, "wb").close()
+
+    def stop(self):
+        pass
+
+class StubContext:
+    def __init__(self):
+        self.tracing = StubTracing()
+
+def test_page_object_steps_rotate_chunks(tmp_path, monkeypatch):
+    """Each outermost page object step starts a chunk and only the last ones are kept"""
+    monkeypatch.chdir(tmp_path)
+    context = StubContext()
+    trace_buffer = TraceBuffer(context, "test_steps", max_chunks=2)
+    calls = []
+
+    def navigate_to_page(page_object, path):
+        calls.append(path)
+
+    def navigate_to_property(page_object):
+        step(page_object, "/property")
+
+    step = TraceBuffer._wrap(navigate_to_page, "navigate_to_page")
+    outer = TraceBuffer._wrap(navigate_to_property, "navigate_to_property")
+    trace_buffer.start()
+    monkeypatch.setattr(TraceBuffer, "active", trace_buffer)
+    try:
+        trace_buffer.checkpoint("call")
+        step(None, "/welcome")
+        outer(None)
+        step(None, "/tenants")
+    finally:
+        monkeypatch.setattr(TraceBuffer, "active", None)
+
+    assert calls == ["/welcome", "/property", "/tenants"]
+    # Nested steps do not split their caller's chunk
+    assert context.tracing.titles == ["test_steps", "test_steps - call", "test_steps - navigate_to_page",
+                                      "test_steps - navigate_to_property", "test_steps - navigate_to_page"]
+    persisted = trace_buffer.persist()
+    assert [path.rsplit("_", 1)[1] for path in persisted] == ["part4.zip", "part5.zip"]
+
+    trace_buffer.checkpoint("teardown")
+    assert [path.rsplit("_", 1)[1] for path in trace_buffer.persist()] == ["part6.zip"]
+    trace_buffer.close()
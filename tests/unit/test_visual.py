@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+from helpers.visual import compare_images
+
+def _text_image(path, text: str):
+    """Save black text on white, scaled up 4x like a zoomed-in screenshot."""
+    image = Image.new("RGB", (16, 16), "white")
+    ImageDraw.Draw(image).text((4, 2), text, fill="black")
+    image.resize((64, 64), Image.NEAREST).save(path)
+
+def _edge_image(path, edge_grey: int):
+    """Save a black square on white whose right edge is smoothed with a grey column."""
+    image = Image.new("RGB", (32, 32), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((8, 8, 15, 23), fill="black")
+    draw.line((16, 8, 16, 23), fill=(edge_grey,) * 3)
+    image.save(path)
+
+def test_changed_glyph_is_reported(tmp_path):
+    """A changed character fails even though its pixels' colours occur around it"""
+    _text_image(tmp_path / "baseline.png", "8")
+    _text_image(tmp_path / "actual.png", "0")
+
+    result = compare_images(str(tmp_path / "baseline.png"), str(tmp_path / "actual.png"),
+                            str(tmp_path / "diff.png"), tile_size=8)
+    assert not result["passed"]
+    assert result["changed_pixels"] > 0
+    assert result["diff"] == str(tmp_path / "diff.png") and (tmp_path / "diff.png").exists()
+
+def test_antialiased_edge_is_ignored(tmp_path):
+    """A differently smoothed edge between flat areas passes"""
+    _edge_image(tmp_path / "baseline.png", 180)
+    _edge_image(tmp_path / "actual.png", 120)
+
+    result = compare_images(str(tmp_path / "baseline.png"), str(tmp_path / "actual.png"),
+                            str(tmp_path / "diff.png"), tile_size=8, keep_actual=True)
+    assert result["passed"], result["reason"]
+    assert result["changed_pixels"] == 0
+    # Without anti-aliasing tolerance the grey column fills an eighth of its tiles
+    assert not compare_images(str(tmp_path / "baseline.png"), str(tmp_path / "actual.png"),
+                              str(tmp_path / "diff.png"), tile_size=8, antialiasing=False)["passed"]
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Watch mode
+
+Keeps one browser (and the logged-in roles) warm in a long-lived process,
+watches pom/, helpers/ and tests/ and re-runs only the tests affected by each
+change in-process, skipping report generation for fast feedback.
+
+Usage:
+    python watch_tests.py                       # keep the landlord logged in
+    python watch_tests.py --roles landlord tenant --run-first
+    python watch_tests.py --headed -x           # extra args go to pytest
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from helpers.warm_daemon import WarmDaemon
+
+# Same as pytest.ini without the HTML/JSON reports and metadata
+WATCH_ADDOPTS = "-v --tb=short --strict-markers --disable-warnings"
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-run affected tests on change against a warm browser')
+    parser.add_argument('--roles', nargs='*', default=['landlord'],
+                        help=f"Roles to log in once and keep warm (available: {', '.join(WarmDaemon.ROLE_PAGES)})")
+    parser.add_argument('--browser', default='chromium', help='Browser to keep warm (default: chromium)')
+    parser.add_argument('--headed', action='store_true', help='Show the browser window')
+    parser.add_argument('--run-first', action='store_true', help='Run all tests once before watching')
+    parser.add_argument('--poll-interval', type=float, default=0.5, help='Seconds between change checks')
+
+    args, extra_args = parser.parse_known_args()
+
+    # Ensure we're in the correct directory
+    os.chdir(Path(__file__).parent)
+
+    daemon = WarmDaemon(
+        browser_name=args.browser,
+        headed=args.headed,
+        roles=tuple(args.roles),
+        poll_interval=args.poll_interval,
+        pytest_args=['-o', f'addopts={WATCH_ADDOPTS}', '-p', 'no:cacheprovider', *extra_args]
+    )
+    print(f"🔥 Starting warm {args.browser} browser...")
+    daemon.start()
+    try:
+        daemon.watch(run_first=args.run_first)
+    except KeyboardInterrupt:
+        print("\n👋 Stopping watch mode")
+    finally:
+        daemon.stop()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())